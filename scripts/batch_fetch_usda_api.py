@@ -7,22 +7,24 @@ Uses the actual API endpoint: https://plantsservices.sc.egov.usda.gov/api/PlantP
 import json
 import os
 import sys
-import time
 import argparse
 from datetime import datetime, timezone
 from pathlib import Path
-import urllib.request
 import urllib.error
 
+from http_transport import open_url
+from rate_limiter import get_rate_limiter
+
 # USDA API endpoint
-USDA_API_BASE = "https://plantsservices.sc.egov.usda.gov/api/PlantProfile"
+USDA_API_HOST = "plantsservices.sc.egov.usda.gov"
+USDA_API_BASE = f"https://{USDA_API_HOST}/api/PlantProfile"
 
 def fetch_plant_data(usda_symbol: str) -> dict:
     """Fetch plant data from USDA Plants API."""
     url = f"{USDA_API_BASE}?symbol={usda_symbol.upper()}"
     
     try:
-        with urllib.request.urlopen(url) as response:
+        with open_url(url) as response:
             data = json.loads(response.read().decode())
             return {
                 "success": True,
@@ -88,7 +90,8 @@ def main():
     parser.add_argument("--yes", "-y", action="store_true", help="Skip confirmation prompt")
     parser.add_argument("--limit", type=int, help="Limit number of plants to fetch")
     parser.add_argument("--force", action="store_true", help="Re-fetch even if file exists")
-    parser.add_argument("--delay", type=float, default=0.5, help="Delay between requests in seconds (default: 0.5)")
+    parser.add_argument("--delay", type=float, help="Minimum interval between requests in seconds, "
+                        "0 for no limit (default: the USDA budget in rate_limiter.HOST_RATE_LIMITS)")
     
     args = parser.parse_args()
     
@@ -125,8 +128,18 @@ def main():
             return
     
     # Batch fetch
+    # Pace requests with the shared per-host token bucket
+    limiter = get_rate_limiter()
+    if args.delay is not None:
+        # A rate of None leaves the host unlimited
+        limiter.set_host_rate(USDA_API_HOST, 1 / args.delay if args.delay > 0 else None)
+    rate = limiter.host_limits.get(USDA_API_HOST, {}).get('rate')
+    
     print(f"\nStarting batch fetch...")
-    print(f"Rate limiting: {args.delay} seconds between requests")
+    if rate:
+        print(f"Rate limiting: {1 / rate:.2f} seconds between requests")
+    else:
+        print("Rate limiting: off")
     print()
     
     success_count = 0
@@ -158,10 +171,6 @@ def main():
         
         # Save to file
         save_plant_data(usda_id, api_response, output_dir)
-        
-        # Rate limiting
-        if i < len(plants_with_ids):
-            time.sleep(args.delay)
     
     # Summary
     print()
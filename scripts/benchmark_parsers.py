@@ -0,0 +1,513 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for the page parsers, with stored baselines.
+
+Measures how fast PlantDataParser (wildflower.org plant pages),
+PlantLinkParser (wildflower.org collection pages) and USDADataExtractor (USDA
+Plant Guide PDFs) get through a fixed corpus, so a change that slows a parser
+down is caught before it reaches a crawl. For each parser it reports:
+
+- pages per second over a timed run of at least --min-time seconds
+- time per page spent in each instrumented method (inclusive, from a
+  separate pass so the instrumentation does not slow the timed run)
+- peak memory allocated while parsing the corpus once (tracemalloc)
+
+Corpus:
+    PlantDataParser     MOCK_PLANT_DETAILS, plus up to --archive N archived
+                        plant pages from the page archive (page_archive.py)
+    PlantLinkParser     MOCK_COLLECTION_HTML
+    USDADataExtractor   The PDFs in src/data/usda (needs pdfplumber)
+
+Every benchmark records the SHA-256 of its corpus together with
+CORPUS_VERSION. Results are only compared with a baseline measured on the
+same corpus; a corpus change needs a new baseline (--save-baseline).
+
+Each run also parses ADVERSARIAL_CASES: pages built to make backtracking
+regexes blow up (long digit runs in a height, a Growing Conditions section
+full of "medium" without "moisture", ...). Every case is parsed at
+ADVERSARIAL_SIZE, twice and four times that size, each in a child process
+that is killed after ADVERSARIAL_TIMEOUT seconds; plant pages go through the
+crawler's parse_plant_page, so PARSE_CPU_BUDGET applies. Each timing repeats
+the parse for at least ADVERSARIAL_MIN_TIME seconds, so timer noise stays
+small. A case fails when it times out, runs out of CPU budget, or its parse
+time grows more than MAX_GROWTH times per doubling between the smallest and
+largest size (roughly linear is fine) twice in a row, which needs no baseline.
+
+Usage:
+    python scripts/benchmark_parsers.py                  # Run and compare with the baseline
+    python scripts/benchmark_parsers.py --save-baseline  # Run and store the results as the baseline
+    python scripts/benchmark_parsers.py --archive 200 --only PlantDataParser
+    python scripts/benchmark_parsers.py --adversarial-only  # Only the adversarial check (no baseline)
+
+Options:
+    --save-baseline     Store this run's results in the baseline file
+    --baseline PATH     Baseline file (default: .cache/bench/parser_baselines.json)
+    --threshold F       Throughput drop that fails the run, as a fraction (default: 0.2)
+    --archive N         Add up to N archived plant pages to the corpus (default: 0)
+    --min-time SECONDS  Minimum timed run per parser (default: 1.0)
+    --only NAME         Run a single benchmark
+    --skip-adversarial  Do not run the adversarial input check
+    --adversarial-only  Run only the adversarial input check
+
+Exits with status 1 when a parser's throughput dropped by more than the
+threshold compared with its baseline, or an adversarial case failed.
+"""
+
+import hashlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+
+from fetch_wildflower_data import (
+    BASE_URL, MOCK_COLLECTION_HTML, MOCK_PLANT_DETAILS, PlantDataParser, PlantLinkParser,
+    parse_plant_page as budgeted_parse_plant_page
+)
+from page_archive import PageArchiveError, get_page_archive
+
+# Configuration
+CORPUS_VERSION = 1  # Bump when the built-in corpus changes, so old baselines are not compared
+BASELINE_FILE = ".cache/bench/parser_baselines.json"  # Relative to the repository root (gitignored)
+REGRESSION_THRESHOLD = 0.2  # Fail when pages/sec drops by more than this fraction
+MIN_TIME = 1.0  # Seconds each parser is timed for (whole corpus rounds)
+USDA_PDF_DIR = "src/data/usda"
+ADVERSARIAL_SIZE = 50000  # Characters of adversarial text per case (also run at 2x and 4x this)
+ADVERSARIAL_MIN_TIME = 0.1  # Seconds each adversarial timing repeats the parse for
+MAX_GROWTH = 3.0  # Allowed parse time ratio per doubling of the input (linear ~2, quadratic ~4)
+ADVERSARIAL_TIMEOUT = 60.0  # Wall-clock seconds per adversarial case and size before it fails
+
+# Methods timed per page in the instrumented pass
+PLANT_DATA_METHODS = ['tokenize'] + sorted(name for name in dir(PlantDataParser) if name.startswith('extract_'))
+PLANT_LINK_METHODS = ['feed', 'close', 'handle_starttag', 'handle_endtag', '_scan_total_results']
+USDA_METHODS = ['extract_from_pdf']
+
+
+class MethodTimer:
+    """Accumulates the time spent in methods of the objects it instruments."""
+
+    def __init__(self):
+        self.totals = defaultdict(float)
+
+    def instrument(self, obj, names):
+        """Wrap the named methods of one object (the class is left alone)."""
+        for name in names:
+            setattr(obj, name, self._timed(name, getattr(obj, name)))
+        return obj
+
+    def _timed(self, name, method):
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.totals[name] += time.perf_counter() - start
+        return timed
+
+
+def parse_plant_page(html, timer=None):
+    parser = PlantDataParser()
+    if timer is not None:
+        timer.instrument(parser, PLANT_DATA_METHODS)
+    parser.extract_plant_info(html)
+
+
+def parse_collection_page(html, timer=None):
+    parser = PlantLinkParser()
+    if timer is not None:
+        timer.instrument(parser, PLANT_LINK_METHODS)
+    parser.feed(html)
+    parser.close()
+
+
+def extract_usda_pdf(path, timer=None):
+    from extract_usda_data import USDADataExtractor
+    extractor = USDADataExtractor()
+    if timer is not None:
+        timer.instrument(extractor, USDA_METHODS)
+    extractor.extract_from_pdf(path)
+
+
+# Adversarial inputs: (name, parse function, page builder taking a size in characters).
+# Plant pages use the crawler's parse_plant_page, which enforces PARSE_CPU_BUDGET.
+ADVERSARIAL_CASES = [
+    ('height digit run', budgeted_parse_plant_page,
+     lambda n: f"<h3>Plant Characteristics</h3><div><strong>Height:</strong> {'1' * n}</div>"),
+    ('height digits and spaces', budgeted_parse_plant_page,
+     lambda n: f"<h3>Plant Characteristics</h3><div><strong>Height:</strong> {'1 ' * (n // 2)}</div>"),
+    ('description digit run', budgeted_parse_plant_page, lambda n: f"<p>{'1' * n}-1</p>"),
+    ('spread digit run', budgeted_parse_plant_page, lambda n: f"<div class=\"spread\">{'1' * n}-</div>"),
+    ('medium without moisture', budgeted_parse_plant_page,
+     lambda n: f"<h3>Growing Conditions</h3><p>{'medium ' * (n // 7)}</p>"),
+    ('birds without food', budgeted_parse_plant_page, lambda n: f"<h3>Benefit</h3><p>{'birds ' * (n // 6)}</p>"),
+    ('zone digit run', budgeted_parse_plant_page, lambda n: f"<p>Zone {'1' * n}</p>"),
+    ('unclosed labels', budgeted_parse_plant_page, lambda n: '<div><strong>' * (n // 13)),
+    ('collection digit run', parse_collection_page, lambda n: f"<p>{'1' * n} plants</p>"),
+]
+
+
+def best_time(parse, page, repeat=3, min_time=ADVERSARIAL_MIN_TIME):
+    """
+    Time per parse of one page, in seconds: the best of `repeat` runs that
+    each parse it over and over for at least `min_time` seconds.
+    """
+    best = None
+    for _ in range(repeat):
+        count = 0
+        start = time.perf_counter()
+        while True:
+            parse(page)
+            count += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+        best = elapsed / count if best is None else min(best, elapsed / count)
+    return best
+
+
+def adversarial_case(name, size):
+    """
+    Child process side of run_adversarial_case: print the case's best parse time.
+
+    Returns:
+        Exit status (0 on success)
+    """
+    for case_name, parse, build in ADVERSARIAL_CASES:
+        if case_name == name:
+            try:
+                print(best_time(parse, build(size)))
+            except Exception as e:
+                print(f"{type(e).__name__}: {e}")
+                return 1
+            return 0
+    print(f"unknown case {name!r}")
+    return 1
+
+
+def run_adversarial_case(name, size, timeout=ADVERSARIAL_TIMEOUT):
+    """
+    Time one adversarial case in a child process, so a parser that never
+    finishes is killed instead of hanging the run.
+
+    Returns:
+        Tuple of (seconds, error): error is None on success, otherwise why
+        the case failed (timeout, exhausted CPU budget, crash)
+    """
+    command = [sys.executable, os.path.abspath(__file__), '--adversarial-case', name, str(size)]
+    try:
+        completed = subprocess.run(command, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return None, f"no result within {timeout:g}s"
+    output = (completed.stdout.strip() or completed.stderr.strip()).splitlines()
+    last_line = output[-1] if output else f"exit status {completed.returncode}"
+    if completed.returncode != 0:
+        return None, last_line
+    try:
+        return float(last_line), None
+    except ValueError:
+        return None, last_line
+
+
+def adversarial_growth(name, size, timeout):
+    """
+    Time one adversarial case at 1x, 2x and 4x its size.
+
+    Returns:
+        Tuple of (times, growth, error): growth is the parse time ratio per
+        doubling of the input, from the smallest to the largest size
+    """
+    times = []
+    for scale in (1, 2, 4):
+        seconds, error = run_adversarial_case(name, size * scale, timeout)
+        if error is not None:
+            return times, None, error
+        times.append(seconds)
+    # Below a millisecond, timer noise dominates the ratio
+    growth = (times[-1] / times[0]) ** 0.5 if times[0] >= 0.001 else 1.0
+    return times, growth, None
+
+
+def check_adversarial(size=ADVERSARIAL_SIZE, max_growth=MAX_GROWTH, timeout=ADVERSARIAL_TIMEOUT):
+    """
+    Parse every adversarial case at three sizes and print how parse time grows.
+
+    A case whose growth exceeds max_growth is measured once more and only
+    fails if it does again, so one noisy timing does not fail the run.
+
+    Returns:
+        Names of the cases that failed: timed out, ran out of CPU budget,
+        crashed, or grew more than max_growth times per doubling
+    """
+    print(f"\nAdversarial inputs ({size}, {size * 2} and {size * 4} characters):")
+    print(f"  {'Case':<28} {'ms':>9} {'ms (2x)':>9} {'ms (4x)':>9} {'growth':>7}")
+    failed = []
+    for name, _, _ in ADVERSARIAL_CASES:
+        times, growth, error = adversarial_growth(name, size, timeout)
+        if error is None and growth > max_growth:
+            times, growth, error = adversarial_growth(name, size, timeout)
+        if error is not None:
+            failed.append(name)
+            print(f"  ✗ {name:<26} {error}")
+            continue
+        marker = '✓'
+        if growth > max_growth:
+            failed.append(name)
+            marker = '✗'
+        print(f"  {marker} {name:<26} " + ' '.join(f"{t * 1000:>9.1f}" for t in times) + f" {growth:>6.1f}x")
+    return failed
+
+
+def archived_plant_pages(limit):
+    """
+    Up to `limit` distinct wildflower plant pages from the page archive.
+
+    Returns:
+        List of (label, html), ordered by body hash so the corpus is stable
+    """
+    if limit <= 0:
+        return []
+    by_sha = {}
+    for entry in reversed(get_page_archive().entries()):
+        url = entry['url']
+        if not url.startswith(BASE_URL) or 'collection.php' in url or entry['sha256'] in by_sha:
+            continue
+        by_sha[entry['sha256']] = entry
+        if len(by_sha) == limit:
+            break
+    pages = []
+    for sha256, entry in sorted(by_sha.items()):
+        try:
+            html = get_page_archive().get_text(entry['key'])
+        except PageArchiveError as e:
+            print(f"⚠ Skipping archived page {entry['url']}: {e}")
+            continue
+        if html is not None:
+            pages.append((entry['url'], html))
+    return pages
+
+
+def build_benchmarks(archive_limit):
+    """
+    The benchmarks and their corpora.
+
+    Returns:
+        List of (name, parse function, corpus), corpus being a list of (label, payload)
+    """
+    plant_pages = sorted(MOCK_PLANT_DETAILS.items()) + archived_plant_pages(archive_limit)
+    benchmarks = [
+        ('PlantDataParser', parse_plant_page, plant_pages),
+        ('PlantLinkParser', parse_collection_page, [('MOCK_COLLECTION_HTML', MOCK_COLLECTION_HTML)]),
+    ]
+
+    try:
+        import extract_usda_data
+        pdf_available = extract_usda_data.PDF_AVAILABLE
+    except ImportError:
+        pdf_available = False
+    pdfs = sorted(Path(USDA_PDF_DIR).glob('*.pdf'))
+    if not pdf_available:
+        print("⚠ pdfplumber not installed, skipping USDADataExtractor")
+    elif not pdfs:
+        print(f"⚠ No PDFs in {USDA_PDF_DIR}, skipping USDADataExtractor")
+    else:
+        benchmarks.append(('USDADataExtractor', extract_usda_pdf, [(path.name, path) for path in pdfs]))
+    return benchmarks
+
+
+def corpus_sha256(corpus):
+    """Fingerprint of a corpus: labels and contents, in order."""
+    digest = hashlib.sha256()
+    for label, payload in corpus:
+        if isinstance(payload, Path):
+            payload = payload.read_bytes()
+        elif isinstance(payload, str):
+            payload = payload.encode('utf-8')
+        digest.update(str(label).encode('utf-8') + b'\0')
+        digest.update(hashlib.sha256(payload).digest())
+    return digest.hexdigest()
+
+
+def run_benchmark(parse, corpus, min_time):
+    """
+    Time one parser over its corpus.
+
+    Returns:
+        Result dict: pages, pages_per_sec, peak_memory_kb, method_ms_per_page
+    """
+    # Warm-up round (imports, regex caches)
+    for _, payload in corpus:
+        parse(payload)
+
+    rounds = 0
+    start = time.perf_counter()
+    while True:
+        for _, payload in corpus:
+            parse(payload)
+        rounds += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+    pages = rounds * len(corpus)
+
+    timer = MethodTimer()
+    for _ in range(rounds):
+        for _, payload in corpus:
+            parse(payload, timer)
+
+    tracemalloc.start()
+    try:
+        for _, payload in corpus:
+            parse(payload)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'pages': len(corpus),
+        'pages_per_sec': round(pages / elapsed, 2),
+        'peak_memory_kb': round(peak / 1024, 1),
+        'method_ms_per_page': {name: round(total * 1000 / pages, 4)
+                               for name, total in sorted(timer.totals.items())},
+    }
+
+
+def load_baselines(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'benchmarks': {}}
+
+
+def save_baselines(path, results):
+    """Store results as the baseline, keeping baselines of benchmarks not run this time."""
+    baselines = load_baselines(path)
+    baselines['benchmarks'] = dict(baselines.get('benchmarks', {}), **results)
+    baselines['saved_at'] = datetime.now().isoformat()
+    baselines['python'] = platform.python_version()
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(baselines, f, indent=2)
+        f.write('\n')
+
+
+def compare(name, result, baseline, threshold):
+    """
+    Compare a result with its baseline and print the verdict.
+
+    Returns:
+        True if throughput dropped by more than the threshold
+    """
+    if baseline is None:
+        print(f"  ⚠ {name}: no baseline (run with --save-baseline)")
+        return False
+    if (baseline.get('corpus_version'), baseline.get('corpus_sha256')) != (CORPUS_VERSION, result['corpus_sha256']):
+        print(f"  ⚠ {name}: baseline was measured on a different corpus, not compared")
+        return False
+    change = result['pages_per_sec'] / baseline['pages_per_sec'] - 1
+    if -change > threshold:
+        print(f"  ✗ {name}: {result['pages_per_sec']:.1f} pages/sec, {change:+.1%} vs baseline "
+              f"{baseline['pages_per_sec']:.1f} (allowed drop {threshold:.0%})")
+        return True
+    print(f"  ✓ {name}: {result['pages_per_sec']:.1f} pages/sec, {change:+.1%} vs baseline")
+    return False
+
+
+def print_result(name, result):
+    print(f"\n{name}: {result['pages']} page(s) in corpus")
+    print(f"  {result['pages_per_sec']:.1f} pages/sec, peak memory {result['peak_memory_kb']:.0f} KB")
+    print(f"  {'Method':<32} {'ms/page':>10}")
+    for method, ms in sorted(result['method_ms_per_page'].items(), key=lambda item: -item[1]):
+        print(f"  {method:<32} {ms:>10.3f}")
+
+
+def parse_args(argv):
+    """Parse command line options (see module docstring)."""
+    options = {
+        'skip_adversarial': False, 'adversarial_only': False, 'save_baseline': False, 'baseline': BASELINE_FILE, 'threshold': REGRESSION_THRESHOLD,
+        'archive': 0, 'min_time': MIN_TIME, 'only': None,
+    }
+    flags = {
+        '--baseline': ('baseline', str), '--threshold': ('threshold', float),
+        '--archive': ('archive', int), '--min-time': ('min_time', float), '--only': ('only', str),
+    }
+    for i, arg in enumerate(argv):
+        if arg == '--save-baseline':
+            options['save_baseline'] = True
+        elif arg == '--skip-adversarial':
+            options['skip_adversarial'] = True
+        elif arg == '--adversarial-only':
+            options['adversarial_only'] = True
+        elif arg in flags and i + 1 < len(argv):
+            name, convert = flags[arg]
+            try:
+                options[name] = convert(argv[i + 1])
+            except ValueError:
+                print(f"Warning: Invalid value '{argv[i + 1]}' for {arg}, ignoring")
+    return options
+
+
+def main():
+    """Run the benchmarks, then compare with or store the baseline."""
+    if len(sys.argv) == 4 and sys.argv[1] == '--adversarial-case':
+        return adversarial_case(sys.argv[2], int(sys.argv[3]))
+
+    options = parse_args(sys.argv[1:])
+
+    print("=" * 70)
+    print("Parser Throughput Benchmark")
+    print("=" * 70)
+
+    if options['adversarial_only']:
+        failed = check_adversarial()
+        print()
+        if failed:
+            print(f"✗ Adversarial input failed: {', '.join(failed)}")
+            return 1
+        print("✓ All adversarial cases parse in linear time")
+        return 0
+
+    benchmarks = build_benchmarks(options['archive'])
+    if options['only']:
+        benchmarks = [benchmark for benchmark in benchmarks if benchmark[0] == options['only']]
+        if not benchmarks:
+            print(f"✗ Unknown or unavailable benchmark: {options['only']}")
+            return 1
+
+    results = {}
+    for name, parse, corpus in benchmarks:
+        result = run_benchmark(parse, corpus, options['min_time'])
+        result['corpus_version'] = CORPUS_VERSION
+        result['corpus_sha256'] = corpus_sha256(corpus)
+        results[name] = result
+        print_result(name, result)
+
+    failed_adversarial = [] if options['skip_adversarial'] else check_adversarial()
+
+    print()
+    print("=" * 70)
+    if failed_adversarial:
+        print(f"✗ Adversarial input failed: {', '.join(failed_adversarial)}")
+    if options['save_baseline']:
+        save_baselines(options['baseline'], results)
+        print(f"✓ Saved baseline for {len(results)} benchmark(s) to {options['baseline']}")
+        return 1 if failed_adversarial else 0
+
+    baselines = load_baselines(options['baseline']).get('benchmarks', {})
+    print(f"Compared with {options['baseline']}:")
+    regressions = [name for name, result in results.items()
+                   if compare(name, result, baselines.get(name), options['threshold'])]
+    if regressions:
+        print(f"✗ Throughput regression in {', '.join(regressions)}")
+        return 1
+    print("✓ No throughput regressions")
+    return 1 if failed_adversarial else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
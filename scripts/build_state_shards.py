@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Per-state county → plants shards for location-based browsing.
+
+Once a location resolves to a county, the app only needs the plants of that
+county, but without an index it has to load every plant file to find them.
+This generator writes one small shard per state:
+
+    public/data/by-state/{stateFips}.json   {"<county FIPS>": ["<plant id>", ...], ...}
+    public/data/by-state/manifest.json      Per shard: file, size, sha256, counties, plants
+
+Every county of the state in us-counties.json has an entry (an empty list
+when no plant is recorded there); plant IDs are sorted. Shards whose content
+did not change are not rewritten, and shards of states that no longer exist
+are removed.
+
+Usage:
+    python scripts/build_state_shards.py
+"""
+
+import hashlib
+import json
+import os
+import re
+import sys
+from datetime import datetime, timezone
+
+from county_presence import COUNTIES_FILE, PLANTS_JSON_DIR, load_plant_counties
+
+# Configuration
+SHARDS_DIR = "public/data/by-state"
+MANIFEST_FILE = "manifest.json"
+SHARD_NAME = re.compile(r'^\d{2}\.json$')
+
+
+def build_shards(counties_by_state, plant_counties):
+    """
+    Group plants by county, state by state.
+
+    Args:
+        counties_by_state: us-counties.json content (state FIPS -> [{name, fips}])
+        plant_counties: Plant ID -> county FIPS codes (see load_plant_counties)
+
+    Returns:
+        Tuple of (shards, unknown): shards maps state FIPS to {county FIPS:
+        sorted plant IDs}, unknown maps plant ID to FIPS codes that are not
+        in us-counties.json
+    """
+    shards = {state: {county['fips']: [] for county in sorted(counties, key=lambda c: c['fips'])}
+              for state, counties in sorted(counties_by_state.items())}
+    unknown = {}
+    for plant_id in sorted(plant_counties):
+        for fips in sorted(plant_counties[plant_id]):
+            county_plants = shards.get(fips[:2], {}).get(fips)
+            if county_plants is None:
+                unknown.setdefault(plant_id, []).append(fips)
+            else:
+                county_plants.append(plant_id)
+    return shards, unknown
+
+
+def write_if_changed(path, data):
+    """Write bytes atomically unless the file already holds them. Returns True if written."""
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def write_shards(shards, shards_dir=SHARDS_DIR):
+    """
+    Write the shard files and their manifest.
+
+    Returns:
+        Tuple of (manifest, written, removed): written and removed count shard files
+    """
+    os.makedirs(shards_dir, exist_ok=True)
+    states = {}
+    written = 0
+    for state, county_plants in shards.items():
+        filename = f"{state}.json"
+        data = (json.dumps(county_plants, separators=(',', ':')) + '\n').encode('utf-8')
+        if write_if_changed(os.path.join(shards_dir, filename), data):
+            written += 1
+        states[state] = {
+            'file': filename,
+            'size': len(data),
+            'sha256': hashlib.sha256(data).hexdigest(),
+            'counties': len(county_plants),
+            'plants': len({plant_id for plant_ids in county_plants.values() for plant_id in plant_ids}),
+        }
+
+    removed = 0
+    for filename in os.listdir(shards_dir):
+        if SHARD_NAME.match(filename) and filename[:2] not in shards:
+            os.remove(os.path.join(shards_dir, filename))
+            removed += 1
+
+    manifest_path = os.path.join(shards_dir, MANIFEST_FILE)
+    manifest = {'version': 1, 'generatedAt': None, 'states': states}
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        previous = {}
+    # Keep the previous timestamp when nothing changed, so an unchanged build leaves no diff
+    if previous.get('states') == states and previous.get('version') == manifest['version']:
+        manifest['generatedAt'] = previous.get('generatedAt')
+    else:
+        manifest['generatedAt'] = datetime.now(timezone.utc).isoformat()
+    write_if_changed(manifest_path, (json.dumps(manifest, indent=2) + '\n').encode('utf-8'))
+    return manifest, written, removed
+
+
+def main():
+    if not os.path.isdir(PLANTS_JSON_DIR) or not os.path.exists(COUNTIES_FILE):
+        print(f"✗ Run from the repository root ({PLANTS_JSON_DIR} and {COUNTIES_FILE} are needed)")
+        sys.exit(1)
+
+    with open(COUNTIES_FILE, 'r', encoding='utf-8') as f:
+        counties_by_state = json.load(f)
+    plant_counties, unreadable = load_plant_counties()
+
+    shards, unknown = build_shards(counties_by_state, plant_counties)
+    manifest, written, removed = write_shards(shards)
+
+    total_size = sum(state['size'] for state in manifest['states'].values())
+    largest = max(manifest['states'].values(), key=lambda state: state['size'])
+    print(f"✓ {len(shards)} state shards in {SHARDS_DIR} ({written} written, {removed} removed), "
+          f"{total_size:,} bytes in total, largest {largest['file']} at {largest['size']:,} bytes")
+    if unknown:
+        print(f"⚠ {len(unknown)} plants list counties missing from {COUNTIES_FILE} (not included):")
+        for plant_id, codes in sorted(unknown.items()):
+            print(f"    {plant_id}: {', '.join(codes)}")
+    if unreadable:
+        print(f"⚠ {len(unreadable)} plant files could not be read: {', '.join(unreadable)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,10 +3,24 @@
 Convert USDA distribution CSV files to PlantDistribution JSON format.
 
 This script:
-1. Reads distribution CSV files from public/data/distribution/
-2. Extracts county FIPS codes (5-digit) and state FIPS codes (2-digit)
-3. Generates distribution JSON for each plant
-4. Updates plant JSON files with distribution data
+1. Indexes the plant JSON files in public/data/plants/ by usdaPlantId (one scan)
+2. Reads distribution CSV files from public/data/distribution/
+3. Extracts county FIPS codes (5-digit) and state FIPS codes (2-digit)
+4. Generates distribution JSON for each plant, with the SHA-256 of its source CSV
+5. Updates plant JSON files whose source CSV changed since the last conversion
+6. Reports the counties added and removed per plant
+7. Reports symbols shared by several plants and CSVs with no plant file
+
+CSVs are parsed by a pool of worker processes, each reading only the
+Country, State FIP and County FIP columns; the main process is the single
+writer that merges the results into the plant JSON files as they arrive.
+A CSV whose hash matches the sourceSha256 stored in its plant's distribution
+is not parsed again.
+
+Usage:
+    python scripts/convert_distribution_to_json.py              # Convert new and changed CSVs
+    python scripts/convert_distribution_to_json.py --force      # Reconvert every CSV, ignoring stored hashes
+    python scripts/convert_distribution_to_json.py --workers 4  # Parser processes (0 = parse in-process)
 
 CSV Format:
     Symbol,Country,State,State FIP,County,County FIP
@@ -17,15 +31,20 @@ CSV Format:
 Output:
     {
         "fipsCodes": ["10001", "10003", "10005", ...],
-        "statesFips": ["01", "09", "10", ...]
+        "statesFips": ["01", "09", "10", ...],
+        "sourceSha256": "9f2c..."
     }
 """
 
 import sys
+import os
 import csv
+import hashlib
+import io
 import json
 import pathlib
-from typing import Dict, List, Set
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Set, Tuple
 from datetime import datetime, timezone
 
 # Directories
@@ -35,6 +54,24 @@ PLANTS_JSON_DIR = pathlib.Path("public/data/plants")
 # Logging
 LOG_FILE = pathlib.Path("scripts/convert_distribution_log.txt")
 
+# Processing
+PARSE_WORKERS = os.cpu_count() or 1  # CSV parser processes (0 parses in the main process)
+PARSE_CHUNK_SIZE = 8  # CSVs handed to a worker at a time
+FORCE_RECONVERT = '--force' in sys.argv  # Reconvert CSVs whose hash has not changed
+CHANGE_LIST_LIMIT = 10  # County FIPS codes listed per plant in the change report
+
+for i, arg in enumerate(sys.argv):
+    if arg == '--workers' and i + 1 < len(sys.argv):
+        try:
+            PARSE_WORKERS = max(0, int(sys.argv[i + 1]))
+        except ValueError:
+            print(f"Warning: Invalid worker count '{sys.argv[i + 1]}', ignoring")
+
+# Columns of the distribution CSVs that are read
+COUNTRY_COLUMN = 'Country'
+STATE_FIP_COLUMN = 'State FIP'
+COUNTY_FIP_COLUMN = 'County FIP'
+
 
 def log_message(message: str):
     """Log message with timestamp to console and file."""
@@ -48,114 +85,216 @@ def log_message(message: str):
         f.write(log_entry + '\n')
 
 
-def parse_distribution_csv(csv_path: pathlib.Path) -> Dict[str, any]:
+def read_distribution_csv(csv_path: pathlib.Path, known_sha256: str = None) -> Dict[str, any] | None:
     """
-    Parse a distribution CSV file and extract FIPS codes.
+    Read the FIPS codes from a distribution CSV file.
+    
+    Rows are plain tuples from csv.reader; only the Country, State FIP and
+    County FIP columns are looked at.
     
     Args:
         csv_path: Path to the CSV file
+        known_sha256: SHA-256 of the CSV at the last conversion; the file is
+            not parsed when it still has this hash
         
     Returns:
-        Dictionary with fipsCodes and statesFips arrays
+        Dictionary with fipsCodes and statesFips arrays and the sourceSha256
+        of the file, or None if the file is unchanged
+        
+    Raises:
+        OSError, UnicodeDecodeError or csv.Error if the file cannot be read
     """
+    data = csv_path.read_bytes()
+    source_sha256 = hashlib.sha256(data).hexdigest()
+    if source_sha256 == known_sha256:
+        return None
+    
     county_fips: Set[str] = set()
     state_fips: Set[str] = set()
     
-    try:
-        with open(csv_path, 'r', encoding='utf-8-sig') as f:  # utf-8-sig handles BOM
-            # Skip the first line (header: "Distribution Data")
-            first_line = f.readline()
+    with io.StringIO(data.decode('utf-8-sig'), newline='') as f:  # utf-8-sig handles BOM
+        # Skip the first line (header: "Distribution Data")
+        f.readline()
+        
+        # Now read as CSV with actual column headers
+        reader = csv.reader(f)
+        header = next(reader, [])
+        if not all(column in header for column in (COUNTRY_COLUMN, STATE_FIP_COLUMN, COUNTY_FIP_COLUMN)):
+            return {'fipsCodes': [], 'statesFips': [], 'sourceSha256': source_sha256}
+        country_index = header.index(COUNTRY_COLUMN)
+        state_index = header.index(STATE_FIP_COLUMN)
+        county_index = header.index(COUNTY_FIP_COLUMN)
+        row_length = max(country_index, state_index, county_index) + 1
+        
+        for row in reader:
+            # Skip blank or short rows and non-US entries
+            if len(row) < row_length or row[country_index].strip() != 'United States':
+                continue
             
-            # Now read as CSV with actual column headers
-            reader = csv.DictReader(f)
+            state_fip = row[state_index].strip()
+            if len(state_fip) != 2:
+                continue
+            state_fips.add(state_fip)
             
-            for row in reader:
-                # Skip rows that don't have expected columns
-                if 'Country' not in row:
-                    continue
-                    
-                # Skip non-US entries
-                if row.get('Country', '').strip() != 'United States':
-                    continue
-                
-                state_fip = row.get('State FIP', '').strip()
-                county_fip = row.get('County FIP', '').strip()
-                
-                # Add state FIPS if available
-                if state_fip and len(state_fip) == 2:
-                    state_fips.add(state_fip)
-                
-                # Add county FIPS if available (combine state + county)
-                if state_fip and county_fip and len(state_fip) == 2 and len(county_fip) == 3:
-                    full_county_fips = state_fip + county_fip
-                    county_fips.add(full_county_fips)
-        
-        return {
-            'fipsCodes': sorted(list(county_fips)),
-            'statesFips': sorted(list(state_fips))
-        }
+            # Add county FIPS if available (combine state + county)
+            county_fip = row[county_index].strip()
+            if len(county_fip) == 3:
+                county_fips.add(state_fip + county_fip)
     
+    return {
+        'fipsCodes': sorted(county_fips),
+        'statesFips': sorted(state_fips),
+        'sourceSha256': source_sha256
+    }
+
+
+def usda_symbol_for_csv(csv_path: pathlib.Path) -> str:
+    """USDA symbol from a CSV file name (e.g., "astut2_distribution.csv" -> "ASTUT2")."""
+    return csv_path.stem.replace('_distribution', '').upper()
+
+
+def parse_distribution_file(csv_path: pathlib.Path,
+                            known_sha256: str = None) -> Tuple[pathlib.Path, Dict[str, any] | None, str | None]:
+    """
+    Parse one CSV in a worker process.
+    
+    Returns:
+        Tuple of (csv_path, distribution, error), error being None on success
+        and distribution None if the CSV still has known_sha256
+    """
+    try:
+        return csv_path, read_distribution_csv(csv_path, known_sha256), None
     except Exception as e:
-        log_message(f"  ✗ Error parsing CSV: {e}")
-        return {
-            'fipsCodes': [],
-            'statesFips': []
-        }
+        return csv_path, {'fipsCodes': [], 'statesFips': []}, f"{type(e).__name__}: {e}"
 
 
-def get_plant_id_from_usda_symbol(usda_symbol: str) -> str | None:
+def iter_parsed_distributions(csv_files: List[pathlib.Path], known_hashes: List[str | None] = None,
+                              workers: int = None):
     """
-    Find the plant ID that corresponds to a USDA symbol.
+    Parse CSVs across PARSE_WORKERS processes, yielding results in file order.
     
     Args:
-        usda_symbol: USDA plant symbol (e.g., "ASTUT2")
-        
+        csv_files: CSV files to parse
+        known_hashes: SHA-256 stored for each file at its last conversion
+            (None entries, or no list, parse every file)
+        workers: Parser processes (default PARSE_WORKERS)
+    
+    Yields:
+        Tuples of (csv_path, distribution, error) from parse_distribution_file
+    """
+    known_hashes = known_hashes or [None] * len(csv_files)
+    workers = PARSE_WORKERS if workers is None else workers
+    executor = None
+    if workers > 0 and len(csv_files) > 1:
+        try:
+            executor = ProcessPoolExecutor(max_workers=workers)
+        except (OSError, NotImplementedError) as e:
+            print(f"⚠ Parser processes unavailable ({e}), parsing in-process")
+    
+    if executor is None:
+        for csv_path, known_sha256 in zip(csv_files, known_hashes):
+            yield parse_distribution_file(csv_path, known_sha256)
+        return
+    
+    with executor:
+        yield from executor.map(parse_distribution_file, csv_files, known_hashes, chunksize=PARSE_CHUNK_SIZE)
+
+
+def build_usda_symbol_index() -> Tuple[Dict[str, List[str]], Dict[str, str], List[str]]:
+    """
+    Map every usdaPlantId to the plants that carry it, reading each plant file once.
+    
+    Plant files are read in sorted order, so plants sharing a symbol are
+    listed in the same order on every run.
+    
     Returns:
-        Plant ID (e.g., "asclepias-tuberosa") or None if not found
+        Tuple of (index, source_hashes, unreadable): index maps USDA symbol to
+        plant IDs, source_hashes maps plant ID to the sourceSha256 of its
+        distribution, unreadable lists plant files that are not valid JSON
     """
+    index: Dict[str, List[str]] = {}
+    source_hashes: Dict[str, str] = {}
+    unreadable: List[str] = []
+    
     if not PLANTS_JSON_DIR.exists():
-        return None
+        return index, source_hashes, unreadable
     
-    # Search all plant JSON files for matching usdaPlantId
-    for json_file in PLANTS_JSON_DIR.glob("*.json"):
+    for json_file in sorted(PLANTS_JSON_DIR.glob("*.json")):
         try:
             with open(json_file, 'r') as f:
                 data = json.load(f)
-            
-            if data.get('usdaPlantId') == usda_symbol:
-                return data.get('id')
         except Exception:
+            unreadable.append(json_file.name)
             continue
+        
+        # index.json and other non-plant files are lists
+        if not isinstance(data, dict):
+            continue
+        
+        usda_symbol = data.get('usdaPlantId')
+        plant_id = data.get('id')
+        if usda_symbol and plant_id:
+            index.setdefault(usda_symbol, []).append(plant_id)
+        
+        source_sha256 = (data.get('distribution') or {}).get('sourceSha256')
+        if plant_id and source_sha256:
+            source_hashes[plant_id] = source_sha256
     
-    return None
+    return index, source_hashes, unreadable
+
+
+def get_plant_ids_from_usda_symbol(usda_symbol: str, symbol_index: Dict[str, List[str]]) -> List[str]:
+    """
+    Find the plant IDs that correspond to a USDA symbol.
+    
+    Args:
+        usda_symbol: USDA plant symbol (e.g., "ASTUT2")
+        symbol_index: Index from build_usda_symbol_index
+        
+    Returns:
+        Plant IDs (e.g., ["asclepias-tuberosa"]); several when plants share
+        the symbol (a species and its variety), empty if not found
+    """
+    return symbol_index.get(usda_symbol, [])
 
 
-def update_plant_with_distribution(plant_id: str, distribution: Dict[str, any]) -> bool:
+def known_source_hash(plant_ids: List[str], source_hashes: Dict[str, str]) -> str | None:
+    """The sourceSha256 all these plants were converted from, or None if they differ or lack one."""
+    hashes = {source_hashes.get(plant_id) for plant_id in plant_ids}
+    return hashes.pop() if len(hashes) == 1 else None
+
+
+def update_plant_with_distribution(plant_id: str,
+                                   distribution: Dict[str, any]) -> Tuple[str, List[str], List[str]]:
     """
     Update a plant JSON file with distribution data.
     
     Args:
         plant_id: Plant ID (e.g., "asclepias-tuberosa")
-        distribution: Distribution dictionary with fipsCodes and statesFips
+        distribution: Distribution dictionary with fipsCodes, statesFips and sourceSha256
         
     Returns:
-        True if successful, False otherwise
+        Tuple of (status, added, removed): status is 'updated' if the file was
+        written, 'skipped' if it already had this distribution and 'failed'
+        otherwise; added and removed are the county FIPS codes that changed
     """
     plant_file = PLANTS_JSON_DIR / f"{plant_id}.json"
     
     if not plant_file.exists():
         log_message(f"  ✗ Plant file not found: {plant_file}")
-        return False
+        return 'failed', [], []
     
     try:
         # Load existing plant data
         with open(plant_file, 'r') as f:
             plant_data = json.load(f)
         
-        # Check if distribution already exists
-        if 'distribution' in plant_data and plant_data['distribution'].get('fipsCodes'):
-            log_message(f"  ⏭ Distribution already exists, skipping")
-            return True
+        existing = plant_data.get('distribution') or {}
+        if existing == distribution:
+            return 'skipped', [], []
+        
+        previous_fips = set(existing.get('fipsCodes', []))
+        current_fips = set(distribution['fipsCodes'])
         
         # Add distribution data
         plant_data['distribution'] = distribution
@@ -165,53 +304,98 @@ def update_plant_with_distribution(plant_id: str, distribution: Dict[str, any])
             json.dump(plant_data, f, indent=2, ensure_ascii=False)
             f.write('\n')  # Add trailing newline
         
-        return True
+        return 'updated', sorted(current_fips - previous_fips), sorted(previous_fips - current_fips)
     
     except Exception as e:
         log_message(f"  ✗ Error updating plant file: {e}")
-        return False
+        return 'failed', [], []
 
 
-def process_distribution_file(csv_path: pathlib.Path) -> bool:
+def format_county_changes(added: List[str], removed: List[str]) -> str:
+    """Describe added and removed counties, listing up to CHANGE_LIST_LIMIT codes of each."""
+    def describe(sign: str, codes: List[str]) -> str:
+        listed = ', '.join(codes[:CHANGE_LIST_LIMIT])
+        more = f", … {len(codes) - CHANGE_LIST_LIMIT} more" if len(codes) > CHANGE_LIST_LIMIT else ''
+        return f"{sign}{len(codes)} ({listed}{more})" if codes else f"{sign}0"
+    
+    return f"{describe('+', added)} / {describe('-', removed)} counties"
+
+
+def process_distribution_file(csv_path: pathlib.Path, distribution: Dict[str, any],
+                              symbol_index: Dict[str, List[str]]) -> Tuple[str, List[str], List[str]]:
     """
-    Process a single distribution CSV file.
+    Write the parsed distribution of one CSV file into every plant file
+    carrying its USDA symbol.
     
     Args:
         csv_path: Path to the CSV file
+        distribution: Result of read_distribution_csv for that file
+        symbol_index: Index from build_usda_symbol_index
         
     Returns:
-        True if successful, False otherwise
+        Tuple of (status, added, removed): status is 'failed' if any plant
+        failed, else 'updated' if any was written, else 'skipped'; added and
+        removed count the changed county codes over all its plants
     """
-    # Extract USDA symbol from filename (e.g., "astut2_distribution.csv" -> "ASTUT2")
-    usda_symbol = csv_path.stem.replace('_distribution', '').upper()
+    usda_symbol = usda_symbol_for_csv(csv_path)
     
-    log_message(f"Processing: {usda_symbol} ({csv_path.name})")
+    if not distribution['fipsCodes'] and not distribution['statesFips']:
+        log_message(f"  ⚠ {usda_symbol}: no FIPS codes found in CSV")
+        return 'failed', [], []
     
-    # Parse CSV
-    distribution = parse_distribution_csv(csv_path)
+    # Find corresponding plant IDs
+    plant_ids = get_plant_ids_from_usda_symbol(usda_symbol, symbol_index)
     
-    if not distribution['fipsCodes'] and not distribution['statesFips']:
-        log_message(f"  ⚠ No FIPS codes found in CSV")
-        return False
+    if not plant_ids:
+        log_message(f"  ⚠ {usda_symbol}: no plant file found for USDA symbol")
+        return 'failed', [], []
     
-    log_message(f"  ✓ Found {len(distribution['fipsCodes'])} county codes, "
-                f"{len(distribution['statesFips'])} state codes")
+    statuses = set()
+    total_added: List[str] = []
+    total_removed: List[str] = []
+    for plant_id in plant_ids:
+        status, added, removed = update_plant_with_distribution(plant_id, distribution)
+        statuses.add(status)
+        total_added.extend(added)
+        total_removed.extend(removed)
+        if status == 'updated':
+            log_message(f"  ✓ {usda_symbol} → {plant_id}: {format_county_changes(added, removed)}, "
+                        f"{len(distribution['fipsCodes'])} counties and "
+                        f"{len(distribution['statesFips'])} states in total")
     
-    # Find corresponding plant ID
-    plant_id = get_plant_id_from_usda_symbol(usda_symbol)
+    for status in ('failed', 'updated', 'skipped'):
+        if status in statuses:
+            return status, total_added, total_removed
+
+
+def report_index_diagnostics(symbol_index: Dict[str, List[str]], unreadable: List[str],
+                             csv_files: List[pathlib.Path]):
+    """
+    Log what the symbol index could not resolve one-to-one.
+    
+    - symbols shared by several plants (each of them is updated)
+    - indexed plants whose ID does not match a file name (they cannot be updated)
+    - distribution CSVs whose symbol no plant file carries
+    - plant files that are not valid JSON
+    """
+    shared = {symbol: ids for symbol, ids in symbol_index.items() if len(ids) > 1}
+    if shared:
+        log_message(f"⚠ {len(shared)} USDA symbols are shared by several plants (each one updated):")
+        for symbol, plant_ids in sorted(shared.items()):
+            log_message(f"    {symbol}: {', '.join(plant_ids)}")
     
-    if not plant_id:
-        log_message(f"  ⚠ No plant file found for USDA symbol {usda_symbol}")
-        return False
+    mismatched = sorted(plant_id for plant_ids in symbol_index.values() for plant_id in plant_ids
+                        if not (PLANTS_JSON_DIR / f"{plant_id}.json").exists())
+    if mismatched:
+        log_message(f"⚠ {len(mismatched)} plants have no file named after their ID: {', '.join(mismatched)}")
     
-    log_message(f"  ✓ Found plant: {plant_id}")
+    csv_symbols = sorted(csv_path.stem.replace('_distribution', '').upper() for csv_path in csv_files)
+    without_plant = [symbol for symbol in csv_symbols if symbol not in symbol_index]
+    if without_plant:
+        log_message(f"⚠ {len(without_plant)} distribution CSVs have no plant file: {', '.join(without_plant)}")
     
-    # Update plant file
-    if update_plant_with_distribution(plant_id, distribution):
-        log_message(f"  ✓ Updated plant file with distribution data")
-        return True
-    else:
-        return False
+    if unreadable:
+        log_message(f"⚠ {len(unreadable)} plant files could not be read: {', '.join(unreadable)}")
 
 
 def main():
@@ -239,33 +423,51 @@ def main():
         sys.exit(1)
     
     log_message(f"✓ Found {len(csv_files)} distribution CSV files")
+    
+    # Index plant files by USDA symbol once, instead of scanning them for every CSV
+    symbol_index, source_hashes, unreadable = build_usda_symbol_index()
+    log_message(f"✓ Indexed {sum(len(ids) for ids in symbol_index.values())} plants "
+                f"by {len(symbol_index)} USDA symbols")
     print()
     
-    # Process each file
-    success_count = 0
-    skipped_count = 0
-    failure_count = 0
+    # CSVs still matching the hash stored in all their plants are not parsed again
+    known_hashes = [None if FORCE_RECONVERT else
+                    known_source_hash(get_plant_ids_from_usda_symbol(usda_symbol_for_csv(csv_file), symbol_index),
+                                      source_hashes)
+                    for csv_file in csv_files]
     
-    for idx, csv_file in enumerate(csv_files, 1):
-        print(f"[{idx}/{len(csv_files)}]")
-        
-        result = process_distribution_file(csv_file)
-        
-        if result:
-            success_count += 1
+    # Parse CSVs in worker processes; this process is the only one writing plant files
+    counts = {'updated': 0, 'skipped': 0, 'failed': 0}
+    counties_added = 0
+    counties_removed = 0
+    
+    for idx, (csv_file, distribution, error) in enumerate(iter_parsed_distributions(csv_files, known_hashes), 1):
+        if error:
+            log_message(f"  ✗ {csv_file.name}: {error}")
+            counts['failed'] += 1
+        elif distribution is None:
+            counts['skipped'] += 1
         else:
-            failure_count += 1
+            status, added, removed = process_distribution_file(csv_file, distribution, symbol_index)
+            counts[status] += 1
+            counties_added += len(added)
+            counties_removed += len(removed)
         
-        print()
+        if idx % 50 == 0 or idx == len(csv_files):
+            print(f"[{idx}/{len(csv_files)}] {counts['updated']} updated, "
+                  f"{counts['skipped']} unchanged, {counts['failed']} failed")
     
     # Summary
     print("=" * 70)
     log_message(f"✓ Processing complete")
-    log_message(f"  Success: {success_count}/{len(csv_files)}")
-    log_message(f"  Failures: {failure_count}/{len(csv_files)}")
+    log_message(f"  Updated: {counts['updated']}/{len(csv_files)}")
+    log_message(f"  Unchanged: {counts['skipped']}/{len(csv_files)}")
+    log_message(f"  Failures: {counts['failed']}/{len(csv_files)}")
+    log_message(f"  Counties: +{counties_added} / -{counties_removed}")
+    report_index_diagnostics(symbol_index, unreadable, csv_files)
     print("=" * 70)
     
-    sys.exit(0 if failure_count == 0 else 1)
+    sys.exit(0 if counts['failed'] == 0 else 1)
 
 
 if __name__ == "__main__":
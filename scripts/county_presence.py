@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Plant × county presence bitmap for county filtering without loading every plant.
+
+Each plant JSON carries its native counties as a distribution.fipsCodes
+array, so finding the plants of one county means reading every plant file.
+This build step packs all of them into one small binary artifact:
+
+- every county in us-counties.json gets a row index and every plant a bit
+  index; both are stable across rebuilds (the previous artifact's order is
+  kept and new counties and plants are appended), so a county's row never
+  moves. Counties and plants that no longer exist keep their empty row or
+  bit until a rebuild with --reindex, which assigns a compact order
+- a rebuild that changes nothing leaves the file untouched (generatedAt
+  included)
+- each county row is a packed bitset over the plants, so "which plants occur
+  in county X" is a single row read
+- a small JSON header carries the county and plant order
+
+Layout of county-presence.bin:
+    magic       4 bytes, b"PFCP"
+    header_len  uint32, little-endian
+    header      UTF-8 JSON: version, generatedAt, counties (FIPS codes in row
+                order), plants (plant IDs in bit order), rowBytes
+    rows        one row of rowBytes bytes per county; bit j (byte j // 8,
+                least significant bit first) is set when plant j is native
+                to the county
+
+Usage:
+    python scripts/county_presence.py              # Build public/data/county-presence.bin
+    python scripts/county_presence.py --reindex    # Rebuild row and bit order from scratch (drops removed entries)
+    python scripts/county_presence.py --county 10001   # List the plants of one county
+
+    from county_presence import CountyPresence
+
+    presence = CountyPresence.load()
+    presence.plants_in_county("10001")             # One row lookup
+    presence.counties_for_plant("asclepias-tuberosa")
+    presence.occurs("asclepias-tuberosa", "10001")
+"""
+
+import json
+import os
+import struct
+import sys
+from datetime import datetime, timezone
+
+# Configuration
+PLANTS_JSON_DIR = "public/data/plants"
+COUNTIES_FILE = "public/data/us-counties.json"
+PRESENCE_FILE = "public/data/county-presence.bin"
+FORMAT_VERSION = 1
+MAGIC = b"PFCP"
+HEADER_LENGTH = struct.Struct("<I")
+
+
+class CountyPresenceError(Exception):
+    """The presence file is missing, truncated or in an unknown format."""
+
+
+def load_county_fips(path=COUNTIES_FILE):
+    """All county FIPS codes in us-counties.json (state FIPS -> [{name, fips}]), sorted."""
+    with open(path, 'r', encoding='utf-8') as f:
+        counties_by_state = json.load(f)
+    return sorted({county['fips'] for counties in counties_by_state.values() for county in counties})
+
+
+def load_plant_counties(plants_dir=PLANTS_JSON_DIR):
+    """
+    Native county FIPS codes of every plant file.
+
+    Returns:
+        Tuple of (plant_counties, unreadable): plant_counties maps plant ID
+        to its set of county FIPS codes (empty without a distribution),
+        unreadable lists plant files that are not valid JSON
+    """
+    plant_counties = {}
+    unreadable = []
+    for filename in sorted(os.listdir(plants_dir)):
+        if not filename.endswith('.json') or filename == 'index.json':
+            continue
+        try:
+            with open(os.path.join(plants_dir, filename), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            unreadable.append(filename)
+            continue
+        if isinstance(data, dict) and data.get('id'):
+            plant_counties[data['id']] = set((data.get('distribution') or {}).get('fipsCodes', []))
+    return plant_counties, unreadable
+
+
+def stable_order(previous, current):
+    """Keep the previous order and append codes that are new, sorted."""
+    known = set(previous)
+    return list(previous) + sorted(code for code in current if code not in known)
+
+
+def build_rows(counties, plants, plant_counties):
+    """
+    Pack the presence matrix county by county.
+
+    Returns:
+        Tuple of (rows, unknown): rows is the bytes of all county rows,
+        unknown maps plant ID to FIPS codes that are not in the county list
+    """
+    row_bytes = (len(plants) + 7) // 8
+    county_row = {fips: row for row, fips in enumerate(counties)}
+    bits = [0] * len(counties)
+    unknown = {}
+    for bit, plant_id in enumerate(plants):
+        for fips in plant_counties.get(plant_id, ()):
+            row = county_row.get(fips)
+            if row is None:
+                unknown.setdefault(plant_id, []).append(fips)
+            else:
+                bits[row] |= 1 << bit
+    rows = b''.join(row.to_bytes(row_bytes, 'little') for row in bits)
+    return rows, {plant_id: sorted(codes) for plant_id, codes in unknown.items()}
+
+
+def write_presence(path, header, rows):
+    """Write the presence file atomically."""
+    header_json = json.dumps(header, separators=(',', ':')).encode('utf-8')
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(HEADER_LENGTH.pack(len(header_json)))
+        f.write(header_json)
+        f.write(rows)
+    os.replace(tmp_path, path)
+
+
+class CountyPresence:
+    """Read-only view of a county presence file."""
+
+    def __init__(self, header, rows):
+        self.counties = header['counties']
+        self.plants = header['plants']
+        self.row_bytes = header['rowBytes']
+        self.generated_at = header.get('generatedAt')
+        self._rows = memoryview(rows)
+        self._county_row = {fips: row for row, fips in enumerate(self.counties)}
+        self._plant_bit = {plant_id: bit for bit, plant_id in enumerate(self.plants)}
+        if len(rows) != len(self.counties) * self.row_bytes:
+            raise CountyPresenceError(f"expected {len(self.counties)} rows of {self.row_bytes} bytes, "
+                                      f"found {len(rows)} bytes")
+
+    @classmethod
+    def load(cls, path=PRESENCE_FILE):
+        """
+        Read a presence file.
+
+        Raises:
+            OSError if it cannot be read, CountyPresenceError if it is not a
+            presence file this version understands
+        """
+        with open(path, 'rb') as f:
+            data = f.read()
+        return cls.from_bytes(data)
+
+    @classmethod
+    def from_bytes(cls, data):
+        prefix = len(MAGIC) + HEADER_LENGTH.size
+        if data[:len(MAGIC)] != MAGIC or len(data) < prefix:
+            raise CountyPresenceError("not a county presence file")
+        header_len, = HEADER_LENGTH.unpack_from(data, len(MAGIC))
+        try:
+            header = json.loads(data[prefix:prefix + header_len].decode('utf-8'))
+        except ValueError as e:
+            raise CountyPresenceError(f"unreadable header: {e}") from e
+        if header.get('version') != FORMAT_VERSION:
+            raise CountyPresenceError(f"unsupported version {header.get('version')}")
+        return cls(header, data[prefix + header_len:])
+
+    def _row(self, fips):
+        row = self._county_row.get(fips)
+        if row is None:
+            return 0
+        start = row * self.row_bytes
+        return int.from_bytes(self._rows[start:start + self.row_bytes], 'little')
+
+    def plants_in_county(self, fips):
+        """IDs of the plants native to a county (5-digit FIPS), in bit order."""
+        bits = self._row(fips)
+        plants = []
+        while bits:
+            lowest = bits & -bits
+            plants.append(self.plants[lowest.bit_length() - 1])
+            bits ^= lowest
+        return plants
+
+    def occurs(self, plant_id, fips):
+        """True if the plant is native to the county."""
+        bit = self._plant_bit.get(plant_id)
+        return bit is not None and bool(self._row(fips) >> bit & 1)
+
+    def counties_for_plant(self, plant_id):
+        """County FIPS codes of one plant (reads its bit in every row)."""
+        bit = self._plant_bit.get(plant_id)
+        if bit is None:
+            return []
+        byte, mask = bit // 8, 1 << (bit % 8)
+        return [fips for row, fips in enumerate(self.counties)
+                if self._rows[row * self.row_bytes + byte] & mask]
+
+
+def build_presence(path=PRESENCE_FILE, reindex=False):
+    """
+    Build the presence file from the plant JSON files.
+
+    Args:
+        path: Output file
+        reindex: Ignore the row and bit order of an existing file
+
+    Returns:
+        The written CountyPresence
+    """
+    current_counties = load_county_fips()
+    counties = current_counties
+    plant_counties, unreadable = load_plant_counties()
+
+    previous = None
+    if not reindex and os.path.exists(path):
+        try:
+            previous = CountyPresence.load(path)
+        except (OSError, CountyPresenceError) as e:
+            print(f"⚠ Existing presence file not reused ({e}), assigning a new order")
+
+    if previous is not None:
+        counties = stable_order(previous.counties, counties)
+        plants = stable_order(previous.plants, plant_counties)
+    else:
+        plants = sorted(plant_counties)
+
+    rows, unknown = build_rows(counties, plants, plant_counties)
+    header = {
+        'version': FORMAT_VERSION,
+        'generatedAt': datetime.now(timezone.utc).isoformat(),
+        'counties': counties,
+        'plants': plants,
+        'rowBytes': (len(plants) + 7) // 8,
+    }
+
+    with_counties = sum(1 for fips in plant_counties.values() if fips)
+    if (previous is not None and previous.counties == counties and previous.plants == plants
+            and previous._rows == rows):
+        # Nothing changed: keep the file (and its generatedAt) so a rebuild leaves no diff
+        header['generatedAt'] = previous.generated_at
+        print(f"✓ {path} is up to date: {len(counties)} counties × {len(plants)} plants "
+              f"({with_counties} with county data)")
+    else:
+        write_presence(path, header, rows)
+        print(f"✓ Wrote {path}: {len(counties)} counties × {len(plants)} plants "
+              f"({with_counties} with county data), {os.path.getsize(path):,} bytes")
+
+    current_counties = set(current_counties)
+    removed_counties = [fips for fips in counties if fips not in current_counties]
+    removed_plants = [plant_id for plant_id in plants if plant_id not in plant_counties]
+    if removed_counties or removed_plants:
+        print(f"⚠ {len(removed_counties)} counties and {len(removed_plants)} plants no longer exist and keep "
+              f"an empty row or bit; run with --reindex to drop them")
+    if unknown:
+        print(f"⚠ {len(unknown)} plants list counties missing from {COUNTIES_FILE} (not included):")
+        for plant_id, codes in sorted(unknown.items()):
+            print(f"    {plant_id}: {', '.join(codes)}")
+    if unreadable:
+        print(f"⚠ {len(unreadable)} plant files could not be read: {', '.join(unreadable)}")
+    return CountyPresence(header, rows)
+
+
+def main():
+    if '--county' in sys.argv:
+        index = sys.argv.index('--county')
+        if index + 1 >= len(sys.argv):
+            print("✗ --county needs a 5-digit county FIPS code")
+            sys.exit(1)
+        try:
+            presence = CountyPresence.load()
+        except (OSError, CountyPresenceError) as e:
+            print(f"✗ Cannot read {PRESENCE_FILE}: {e}")
+            sys.exit(1)
+        fips = sys.argv[index + 1]
+        plants = presence.plants_in_county(fips)
+        print(f"{len(plants)} plants native to county {fips}")
+        for plant_id in plants:
+            print(f"  {plant_id}")
+        return
+
+    if not os.path.isdir(PLANTS_JSON_DIR) or not os.path.exists(COUNTIES_FILE):
+        print(f"✗ Run from the repository root ({PLANTS_JSON_DIR} and {COUNTIES_FILE} are needed)")
+        sys.exit(1)
+    build_presence(reindex='--reindex' in sys.argv)
+
+
+if __name__ == "__main__":
+    main()
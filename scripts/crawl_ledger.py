@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Durable crawl ledger so an interrupted crawl resumes where it stopped.
+
+A crawl that dies partway (a 403 storm, a runner timeout) used to start over
+from the first collection page on the next run and fetch every plant again.
+The ledger records, in a SQLite database committed after every change:
+
+- the page frontier: every collection page offset and whether it was fetched
+- the plant links discovered on each page, in page order
+- each plant's status (pending, done or failed) with its attempt count and
+  last error
+
+A crawl stays open until every plant is done or has used up its attempts.
+Runs in between resume it and only do the remaining work; the first run after
+it is complete starts a new crawl.
+
+Across crawls the ledger also keeps each page's freshness: when it was last
+fetched, the SHA-256 of its body and its HTTP validators (ETag,
+Last-Modified). The scraper uses them to decide which pages to fetch again.
+
+Layout:
+    crawls  One row per crawl: name, started/finished time, total results
+    pages   Collection page offsets of a crawl with status and attempts
+    plants  Plant links of a crawl with page, position, status and attempts
+    pages_seen  Per URL, across crawls: last fetch, body hash, validators, last change
+
+Usage:
+    from crawl_ledger import CrawlLedger
+
+    ledger = CrawlLedger(".cache/crawl/wildflower.sqlite3")
+    resumed = ledger.begin("collection=bamona&pagecount=100")
+    if not ledger.page_done(0):
+        ledger.record_page(0, links)
+    for url in ledger.pending_plants():
+        ...fetch...
+        ledger.record_plant(url, ok=True)
+    ledger.finish_if_complete()
+"""
+
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+# Configuration
+MAX_ATTEMPTS = 3  # Attempts per page or plant within one crawl before it is left for the next crawl
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS crawls (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    finished_at TEXT,
+    total_results INTEGER
+);
+CREATE TABLE IF NOT EXISTS pages (
+    crawl_id INTEGER NOT NULL,
+    start INTEGER NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    link_count INTEGER,
+    last_error TEXT,
+    updated_at TEXT,
+    PRIMARY KEY (crawl_id, start)
+);
+CREATE TABLE IF NOT EXISTS plants (
+    crawl_id INTEGER NOT NULL,
+    url TEXT NOT NULL,
+    page_start INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    updated_at TEXT,
+    PRIMARY KEY (crawl_id, url)
+);
+CREATE TABLE IF NOT EXISTS pages_seen (
+    url TEXT PRIMARY KEY,
+    fetched_at TEXT NOT NULL,
+    sha256 TEXT,
+    etag TEXT,
+    last_modified TEXT,
+    changed_at TEXT
+);
+"""
+
+
+class CrawlLedger:
+    """SQLite-backed crawl state. Every method commits before returning. Thread-safe."""
+
+    def __init__(self, path, max_attempts=MAX_ATTEMPTS):
+        self.path = path
+        self.max_attempts = max_attempts
+        self.crawl_id = None
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(SCHEMA)
+        self._db.commit()
+
+    def _now(self):
+        return datetime.now().isoformat()
+
+    def _execute(self, sql, params=()):
+        with self._lock:
+            cursor = self._db.execute(sql, params)
+            self._db.commit()
+            return cursor
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return self._db.execute(sql, params).fetchall()
+
+    def begin(self, name, restart=False):
+        """
+        Resume the open crawl with this name, or start a new one.
+
+        Args:
+            name: Identifies what is crawled (e.g. collection and page size);
+                an open crawl with a different name is not resumed
+            restart: Abandon an open crawl and start over
+
+        Returns:
+            True if an open crawl was resumed
+        """
+        rows = self._query("SELECT id, name FROM crawls WHERE finished_at IS NULL ORDER BY id DESC LIMIT 1")
+        if rows and rows[0][1] == name and not restart:
+            self.crawl_id = rows[0][0]
+            return True
+        if rows:
+            # Close the abandoned crawl so it is never resumed
+            self._execute("UPDATE crawls SET finished_at = ? WHERE finished_at IS NULL", (self._now(),))
+        cursor = self._execute("INSERT INTO crawls (name, started_at) VALUES (?, ?)", (name, self._now()))
+        self.crawl_id = cursor.lastrowid
+        return False
+
+    def total_results(self):
+        """Total results recorded for the crawl, or None."""
+        rows = self._query("SELECT total_results FROM crawls WHERE id = ?", (self.crawl_id,))
+        return rows[0][0] if rows else None
+
+    def set_total_results(self, total):
+        self._execute("UPDATE crawls SET total_results = ? WHERE id = ?", (total, self.crawl_id))
+
+    def page_done(self, start):
+        """True if the collection page at this offset was fetched in this crawl."""
+        rows = self._query("SELECT status FROM pages WHERE crawl_id = ? AND start = ?", (self.crawl_id, start))
+        return bool(rows) and rows[0][0] == 'done'
+
+    def page_links(self, start):
+        """Plant links recorded for a fetched page, in page order."""
+        rows = self._query("SELECT url FROM plants WHERE crawl_id = ? AND page_start = ? ORDER BY position",
+                           (self.crawl_id, start))
+        return [url for url, in rows]
+
+    def record_page(self, start, links):
+        """Mark a collection page fetched and add its plant links (links seen on an earlier page keep that page)."""
+        now = self._now()
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO pages (crawl_id, start, status, attempts, link_count, updated_at) "
+                "VALUES (?, ?, 'done', 1, ?, ?) "
+                "ON CONFLICT (crawl_id, start) DO UPDATE SET status = 'done', attempts = attempts + 1, "
+                "link_count = excluded.link_count, last_error = NULL, updated_at = excluded.updated_at",
+                (self.crawl_id, start, len(links), now))
+            self._db.executemany(
+                "INSERT OR IGNORE INTO plants (crawl_id, url, page_start, position, updated_at) VALUES (?, ?, ?, ?, ?)",
+                [(self.crawl_id, url, start, position, now) for position, url in enumerate(links)])
+            self._db.commit()
+
+    def record_page_failure(self, start, error):
+        self._execute(
+            "INSERT INTO pages (crawl_id, start, status, attempts, last_error, updated_at) "
+            "VALUES (?, ?, 'failed', 1, ?, ?) "
+            "ON CONFLICT (crawl_id, start) DO UPDATE SET status = 'failed', attempts = attempts + 1, "
+            "last_error = excluded.last_error, updated_at = excluded.updated_at",
+            (self.crawl_id, start, str(error), self._now()))
+
+    def pending_pages(self):
+        """Offsets of collection pages that failed and have attempts left."""
+        rows = self._query("SELECT start FROM pages WHERE crawl_id = ? AND status != 'done' AND attempts < ? "
+                           "ORDER BY start", (self.crawl_id, self.max_attempts))
+        return [start for start, in rows]
+
+    def plant_links(self):
+        """All plant links discovered in this crawl, in page order."""
+        rows = self._query("SELECT url FROM plants WHERE crawl_id = ? ORDER BY page_start, position",
+                           (self.crawl_id,))
+        return [url for url, in rows]
+
+    def pending_plants(self):
+        """Plant links still to do: not done and with attempts left, in page order."""
+        rows = self._query(
+            "SELECT url FROM plants WHERE crawl_id = ? AND status != 'done' AND attempts < ? "
+            "ORDER BY page_start, position", (self.crawl_id, self.max_attempts))
+        return [url for url, in rows]
+
+    def record_plant(self, url, ok, error=None):
+        """Record one attempt at a plant page."""
+        self._execute(
+            "UPDATE plants SET status = ?, attempts = attempts + 1, last_error = ?, updated_at = ? "
+            "WHERE crawl_id = ? AND url = ?",
+            ('done' if ok else 'failed', None if ok else error, self._now(), self.crawl_id, url))
+
+    def counts(self):
+        """Plant counts by status: {'pending': n, 'done': n, 'failed': n}."""
+        counts = {'pending': 0, 'done': 0, 'failed': 0}
+        for status, count in self._query("SELECT status, COUNT(*) FROM plants WHERE crawl_id = ? GROUP BY status",
+                                         (self.crawl_id,)):
+            counts[status] = count
+        return counts
+
+    def freshness(self, url):
+        """
+        What is known about the last fetch of a URL, in any crawl.
+
+        Returns:
+            Dict with fetched_at, sha256, etag, last_modified and changed_at
+            (datetimes as ISO 8601 strings), or None if it was never fetched
+        """
+        rows = self._query("SELECT fetched_at, sha256, etag, last_modified, changed_at FROM pages_seen "
+                           "WHERE url = ?", (url,))
+        if not rows:
+            return None
+        return dict(zip(('fetched_at', 'sha256', 'etag', 'last_modified', 'changed_at'), rows[0]))
+
+    def record_fetch(self, url, sha256=None, etag=None, last_modified=None):
+        """
+        Record a successful fetch of a URL.
+
+        Args:
+            url: Page URL
+            sha256: Hex SHA-256 of the body; None for a 304 Not Modified
+                answer, which keeps the recorded hash
+            etag, last_modified: Validators from the response; None keeps the
+                recorded ones
+
+        Returns:
+            True if the body differs from the previous fetch (or there was none)
+        """
+        now = self._now()
+        with self._lock:
+            rows = self._db.execute("SELECT sha256 FROM pages_seen WHERE url = ?", (url,)).fetchall()
+            changed = not rows or (sha256 is not None and sha256 != rows[0][0])
+            self._db.execute(
+                "INSERT INTO pages_seen (url, fetched_at, sha256, etag, last_modified, changed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (url) DO UPDATE SET fetched_at = excluded.fetched_at, "
+                "sha256 = COALESCE(excluded.sha256, sha256), etag = COALESCE(excluded.etag, etag), "
+                "last_modified = COALESCE(excluded.last_modified, last_modified), "
+                "changed_at = COALESCE(excluded.changed_at, changed_at)",
+                (url, now, sha256, etag, last_modified, now if changed else None))
+            self._db.commit()
+        return changed
+
+    def finish_if_complete(self):
+        """
+        Close the crawl once no collection page or plant has work left.
+
+        Returns:
+            True if the crawl is now finished
+        """
+        if self.pending_plants() or self.pending_pages():
+            return False
+        self._execute("UPDATE crawls SET finished_at = ? WHERE id = ? AND finished_at IS NULL",
+                      (self._now(), self.crawl_id))
+        return True
+
+    def close(self):
+        with self._lock:
+            self._db.close()
@@ -21,12 +21,11 @@ import os
 import json
 import re
 from datetime import datetime
-from urllib.request import Request, urlopen, urlretrieve
-from urllib.error import URLError, HTTPError
 from urllib.parse import quote, unquote
-import socket
 from io import BytesIO
 
+from http_transport import make_request as shared_make_request, open_url
+
 # Try to import PIL for image optimization
 try:
     from PIL import Image
@@ -77,21 +76,14 @@ def log_message(message):
 
 
 def make_request(url, headers=None):
-    """Make an HTTP request with proper headers and error handling."""
+    """Make an HTTP request with proper headers and error handling (over the shared keep-alive transport)."""
     if headers is None:
         headers = {
             'User-Agent': USER_AGENT,
             'Accept': 'application/json'
         }
     
-    request = Request(url, headers=headers)
-    try:
-        with urlopen(request, timeout=TIMEOUT) as response:
-            return response.read().decode('utf-8', errors='ignore'), response.status
-    except HTTPError as e:
-        return None, e.code
-    except (URLError, socket.timeout) as e:
-        return None, 0
+    return shared_make_request(url, headers=headers, retries=1, timeout=TIMEOUT)
 
 
 def search_wikipedia_image(scientific_name, common_name):
@@ -324,9 +316,8 @@ def download_image(url, output_path):
     try:
         # Make the request with headers
         headers = {'User-Agent': USER_AGENT}
-        request = Request(url, headers=headers)
         
-        with urlopen(request, timeout=TIMEOUT) as response:
+        with open_url(url, headers=headers, timeout=TIMEOUT) as response:
             image_data = response.read()
             return image_data
     except Exception as e:
@@ -22,28 +22,38 @@ TODO comments. For production use, consider integrating additional data sources
 
 Usage:
     python fetch_inaturalist_data.py                # Normal mode - fetch from API
-    python fetch_inaturalist_data.py --limit 10     # Fetch only 10 plants
+    python fetch_inaturalist_data.py --limit 10     # Fetch only 10 plants (default: one page, PER_PAGE)
+    python fetch_inaturalist_data.py --limit 0      # Page through every result (up to 10,000)
     python fetch_inaturalist_data.py --test         # Test mode - use mock data
     python fetch_inaturalist_data.py --search "butterfly weed"  # Search for specific plant
+    python fetch_inaturalist_data.py --harvest      # Native ranges from the per-state harvest
+    python fetch_inaturalist_data.py --harvest --refresh-harvest  # Re-harvest every state first
 
 Configuration:
     Edit the script to change:
     - DEFAULT_SEARCH_QUERY: Plants to search for (default: native North American wildflowers)
     - PER_PAGE: Number of results per page (default: 50)
+    - TAXA_BATCH_SIZE: Taxon IDs fetched per detail request (default: 30)
     - OUTPUT_DIR: Where to save the data (default: src/data/inaturalist)
-    - US_STATE_PLACE_IDS: State place IDs for native range queries
+    - US_STATE_PLACE_IDS: State place IDs for native range queries (in inaturalist_native_range.py)
 """
 
 import sys
 import os
 import json
 import re
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from urllib.request import Request, urlopen
-from urllib.error import URLError, HTTPError
 from urllib.parse import quote
-import socket
-import time
+
+from http_cache import get_http_cache
+from http_transport import configure_transport, is_retryable_status, make_request as shared_make_request
+from inaturalist_native_range import (
+    US_STATE_PLACE_IDS, NativeRangeError, fetch_state_native_range as fetch_native_states,
+    load_native_range_index
+)
 
 # Configuration
 SCRAPER_VERSION = "1.1.0"
@@ -51,66 +61,21 @@ OUTPUT_DIR = "src/data/inaturalist"
 LOG_FILE = "fetch_log.txt"
 TIMEOUT = 30  # Request timeout in seconds
 USER_AGENT = 'PlantFinder-DataFetch/1.0 (https://github.com/ampautsc/PlantFinder)'
+REQUEST_HEADERS = {
+    'User-Agent': USER_AGENT,
+    'Accept': 'application/json'
+}
 
 # iNaturalist API configuration
 INATURALIST_API_BASE = "https://api.inaturalist.org/v1"
 PER_PAGE = 50  # Number of results per API request
-RATE_LIMIT_DELAY = 1.0  # Delay between requests in seconds
-
-# US State place IDs for iNaturalist API
-# These IDs are used to query state-level native range data
-US_STATE_PLACE_IDS = {
-    'Alabama': 19,
-    'Alaska': 6,
-    'Arizona': 40,
-    'Arkansas': 36,
-    'California': 14,
-    'Colorado': 34,
-    'Connecticut': 49,
-    'Delaware': 4,
-    'Florida': 7539,
-    'Georgia': 23,
-    'Hawaii': 11,
-    'Idaho': 22,
-    'Illinois': 35,
-    'Indiana': 20,
-    'Iowa': 24,
-    'Kansas': 25,
-    'Kentucky': 26,
-    'Louisiana': 27,
-    'Maine': 17,
-    'Maryland': 39,
-    'Massachusetts': 2,
-    'Michigan': 29,
-    'Minnesota': 38,
-    'Mississippi': 37,
-    'Missouri': 28,
-    'Montana': 16,
-    'Nebraska': 3,
-    'Nevada': 50,
-    'New Hampshire': 41,
-    'New Jersey': 51,
-    'New Mexico': 9,
-    'New York': 48,
-    'North Carolina': 30,
-    'North Dakota': 13,
-    'Ohio': 31,
-    'Oklahoma': 12,
-    'Oregon': 10,
-    'Pennsylvania': 42,
-    'Rhode Island': 8,
-    'South Carolina': 43,
-    'South Dakota': 44,
-    'Tennessee': 45,
-    'Texas': 18,
-    'Utah': 52,
-    'Vermont': 47,
-    'Virginia': 7,
-    'Washington': 46,
-    'West Virginia': 33,
-    'Wisconsin': 32,
-    'Wyoming': 15,
-}
+TAXA_BATCH_SIZE = 30  # Taxon IDs per /taxa/{id,id,...} detail request (API maximum)
+MAX_URL_LENGTH = 2000  # Split detail batches whose URL would be longer than this
+# Statuses meaning "this batch is too large": the batch is split in half and retried
+BATCH_TOO_LARGE_STATUSES = (400, 413, 414, 422)
+MAX_RESULT_WINDOW = 10000  # The API refuses pages beyond the first 10,000 results
+PIPELINE_QUEUE_SIZE = 2  # Batches buffered between pipeline stages (bounds memory use)
+# Request pacing for api.inaturalist.org is set in rate_limiter.HOST_RATE_LIMITS
 
 # Default search: Native North American wildflowers
 # Using rank_level=10 (species) and taxon_id=47126 (Plantae kingdom)
@@ -123,13 +88,15 @@ DEFAULT_SEARCH_QUERY = {
 
 # Parse command line arguments
 USE_TEST_MODE = '--test' in sys.argv
-LIMIT = None
+USE_HARVEST = '--harvest' in sys.argv  # Join against harvested per-state native taxa sets
+REFRESH_HARVEST = '--refresh-harvest' in sys.argv
+LIMIT = PER_PAGE  # Plants per run without --limit (one search page); 0 means no limit
 SEARCH_TERM = None
 
 for i, arg in enumerate(sys.argv):
     if arg == '--limit' and i + 1 < len(sys.argv):
         try:
-            LIMIT = int(sys.argv[i + 1])
+            LIMIT = max(0, int(sys.argv[i + 1]))
         except ValueError:
             print(f"Warning: Invalid limit value '{sys.argv[i + 1]}', ignoring")
     elif arg == '--search' and i + 1 < len(sys.argv):
@@ -202,69 +169,43 @@ def log_message(message, log_path):
     print(log_entry.strip())
 
 
-def make_request(url, headers=None, retries=3, backoff_factor=2):
+def make_request(url, headers=None, retries=3, backoff_factor=2, retry_on=is_retryable_status):
     """
     Make an HTTP request with proper headers, error handling, and retry logic.
     
+    Requests go through the shared keep-alive transport, so consecutive API
+    calls reuse the same connection to api.inaturalist.org.
+    
     Args:
         url: The URL to request
         headers: Optional custom headers dict
         retries: Number of retries on failure (default: 3)
         backoff_factor: Multiplier for exponential backoff delay (default: 2)
+        retry_on: Predicate on the HTTP status code deciding whether to retry
     
     Returns:
         Tuple of (content, status_code) where content is None on error
     """
     if headers is None:
-        headers = {
-            'User-Agent': USER_AGENT,
-            'Accept': 'application/json'
-        }
-    
-    last_error = None
-    last_status = 0
-    
-    for attempt in range(retries):
-        try:
-            request = Request(url, headers=headers)
-            response = urlopen(request, timeout=TIMEOUT)
-            content = response.read().decode('utf-8', errors='ignore')
-            return content, response.status
-            
-        except HTTPError as e:
-            last_error = e
-            last_status = e.code
-            # Don't retry on 403 (Forbidden) or 404 (Not Found)
-            if e.code in [403, 404]:
-                break
-            # Retry on other errors with exponential backoff
-            if attempt < retries - 1:
-                delay = backoff_factor ** attempt
-                print(f"  ⚠ HTTP Error {e.code}, retrying in {delay} seconds... (attempt {attempt + 1}/{retries})")
-                time.sleep(delay)
-        except (URLError, socket.timeout) as e:
-            last_error = e
-            last_status = 0
-            # Retry on network errors with exponential backoff
-            if attempt < retries - 1:
-                delay = backoff_factor ** attempt
-                print(f"  ⚠ Network error, retrying in {delay} seconds... (attempt {attempt + 1}/{retries})")
-                time.sleep(delay)
-        except Exception as e:
-            print(f"  Unexpected error in make_request: {type(e).__name__}: {str(e)}")
-            return None, 0
+        headers = REQUEST_HEADERS
     
-    # All retries failed
-    return None, last_status
+    return shared_make_request(url, headers=headers, retries=retries,
+                               backoff_factor=backoff_factor, timeout=TIMEOUT,
+                               retry_on=retry_on)
+
+
+class TaxaSearchError(Exception):
+    """The first page of taxa search results could not be fetched."""
 
 
-def search_taxa(query_params, log_path):
+def search_taxa(query_params, log_path, page=1):
     """
-    Search for plant taxa using the iNaturalist API.
+    Search for plant taxa using the iNaturalist API (one page of results).
     
     Args:
         query_params: Dict of query parameters
         log_path: Path to log file
+        page: Result page to fetch (1-based)
     
     Returns:
         Tuple of (success, results, message)
@@ -273,11 +214,12 @@ def search_taxa(query_params, log_path):
         if USE_TEST_MODE:
             print("🧪 TEST MODE: Using mock data")
             log_message("Using mock taxa data for testing", log_path)
-            return True, MOCK_TAXA_RESPONSE['results'], "Successfully loaded test data"
+            results = MOCK_TAXA_RESPONSE['results'] if page == 1 else []
+            return True, results, "Successfully loaded test data"
         
         # Build query string
         query_parts = []
-        for key, value in query_params.items():
+        for key, value in dict(query_params, page=page).items():
             query_parts.append(f"{key}={quote(str(value))}")
         query_string = "&".join(query_parts)
         
@@ -286,9 +228,6 @@ def search_taxa(query_params, log_path):
         print(f"Fetching taxa from: {api_url}")
         log_message(f"Fetching taxa from API: {query_string}", log_path)
         
-        # Add rate limiting
-        time.sleep(RATE_LIMIT_DELAY)
-        
         content, status_code = make_request(api_url)
         
         if content is None:
@@ -303,8 +242,8 @@ def search_taxa(query_params, log_path):
         results = data.get('results', [])
         total = data.get('total_results', 0)
         
-        print(f"✓ Found {len(results)} taxa (total available: {total})")
-        log_message(f"Found {len(results)} taxa (total available: {total})", log_path)
+        print(f"✓ Found {len(results)} taxa on page {page} (total available: {total})")
+        log_message(f"Found {len(results)} taxa on page {page} (total available: {total})", log_path)
         
         return True, results, f"Successfully fetched {len(results)} taxa"
         
@@ -318,6 +257,148 @@ def search_taxa(query_params, log_path):
         return False, [], error_msg
 
 
+def iter_taxa(query_params, log_path, limit=None):
+    """
+    Yield taxa from every result page, fetching the next page in the background
+    while the current page is being processed.
+    
+    Args:
+        query_params: Dict of query parameters (per_page sets the page size)
+        log_path: Path to log file
+        limit: Stop after this many taxa (None for all)
+    
+    Yields:
+        Taxon dicts from the search results
+    
+    Raises:
+        TaxaSearchError if the first page cannot be fetched
+    """
+    per_page = int(query_params.get('per_page', PER_PAGE))
+    yielded = 0
+    page = 1
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(search_taxa, query_params, log_path, page)
+        
+        while True:
+            success, results, message = future.result()
+            if not success:
+                if page == 1:
+                    raise TaxaSearchError(message)
+                log_message(f"Stopped paging at page {page}: {message}", log_path)
+                return
+            
+            last_page = (
+                len(results) < per_page
+                or (page + 1) * per_page > MAX_RESULT_WINDOW
+                or (limit is not None and yielded + len(results) >= limit)
+            )
+            if not last_page:
+                # Prefetch the next page while this one is consumed
+                future = executor.submit(search_taxa, query_params, log_path, page + 1)
+            
+            for taxon in results:
+                if limit is not None and yielded >= limit:
+                    return
+                yield taxon
+                yielded += 1
+            
+            if last_page:
+                return
+            page += 1
+
+
+def _put(work_queue, item, stop):
+    """Put an item on a bounded queue, giving up if the pipeline is stopping."""
+    while not stop.is_set():
+        try:
+            work_queue.put(item, timeout=0.5)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def iter_detailed_taxa(taxa, log_path):
+    """
+    Pipeline the taxa search and the batched detail lookups.
+    
+    A search thread groups taxa into TAXA_BATCH_SIZE batches, a detail thread
+    fetches each batch's details, and the caller consumes (taxon, details)
+    pairs - details is None for non-plants and failed lookups. The stages are
+    linked by bounded queues, so memory use stays constant however many pages
+    there are, and the next batch's requests overlap the caller's work
+    (native range lookups, transforming and saving).
+    
+    Args:
+        taxa: Iterable of taxa (e.g. from iter_taxa)
+        log_path: Path to log file
+    
+    Yields:
+        Tuples of (taxon, detailed_taxon or None)
+    
+    Raises:
+        Any exception raised by a stage (e.g. TaxaSearchError)
+    """
+    done = object()
+    stop = threading.Event()
+    batch_queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    detail_queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    
+    def search_stage():
+        try:
+            batch = []
+            for taxon in taxa:
+                batch.append(taxon)
+                if len(batch) >= TAXA_BATCH_SIZE:
+                    if not _put(batch_queue, batch, stop):
+                        return
+                    batch = []
+            if batch:
+                _put(batch_queue, batch, stop)
+            _put(batch_queue, done, stop)
+        except Exception as e:
+            _put(batch_queue, e, stop)
+    
+    def detail_stage():
+        while not stop.is_set():
+            batch = batch_queue.get()
+            if stop.is_set():
+                return
+            if batch is done or isinstance(batch, Exception):
+                _put(detail_queue, batch, stop)
+                return
+            try:
+                plant_ids = [taxon.get('id') for taxon in batch if taxon.get('iconic_taxon_name') == 'Plantae']
+                details = fetch_taxa_details(plant_ids, log_path)
+                item = [(taxon, details.get(taxon.get('id'))) for taxon in batch]
+            except Exception as e:
+                item = e
+            if not _put(detail_queue, item, stop) or isinstance(item, Exception):
+                return
+    
+    threads = [threading.Thread(target=search_stage, daemon=True),
+               threading.Thread(target=detail_stage, daemon=True)]
+    for thread in threads:
+        thread.start()
+    
+    try:
+        while True:
+            item = detail_queue.get()
+            if item is done:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield from item
+    finally:
+        stop.set()
+        # Unblock a detail stage waiting on an empty batch queue
+        try:
+            batch_queue.put_nowait(done)
+        except queue.Full:
+            pass
+
+
 def fetch_taxon_details(taxon_id, log_path):
     """
     Fetch detailed information for a specific taxon.
@@ -329,47 +410,106 @@ def fetch_taxon_details(taxon_id, log_path):
     Returns:
         Dict with taxon details or None on error
     """
+    return fetch_taxa_details([taxon_id], log_path).get(taxon_id)
+
+
+def fetch_taxa_details(taxon_ids, log_path):
+    """
+    Fetch detailed information for many taxa using multi-id /taxa/{id,id,...} requests.
+    
+    IDs are grouped TAXA_BATCH_SIZE at a time. A batch whose URL would be too
+    long, or that the API rejects as too large, is split in half and retried.
+    
+    Args:
+        taxon_ids: Iterable of iNaturalist taxon IDs
+        log_path: Path to log file
+    
+    Returns:
+        Dict mapping taxon ID to taxon details (IDs that failed are missing)
+    """
+    taxon_ids = list(dict.fromkeys(taxon_ids))  # Drop duplicates, keep order
+    details = {}
+    
+    if USE_TEST_MODE:
+        print(f"  🧪 Fetching test taxon details for {len(taxon_ids)} taxa")
+        # Return mock data for testing
+        for mock_taxon in MOCK_TAXA_RESPONSE['results']:
+            if mock_taxon['id'] in taxon_ids:
+                details[mock_taxon['id']] = mock_taxon
+        return details
+    
+    batches = [taxon_ids[i:i + TAXA_BATCH_SIZE] for i in range(0, len(taxon_ids), TAXA_BATCH_SIZE)]
+    if batches:
+        print(f"Fetching details for {len(taxon_ids)} taxa in {len(batches)} request(s)...")
+    
+    for batch in batches:
+        details.update(fetch_taxa_batch(batch, log_path))
+    
+    missing = [taxon_id for taxon_id in taxon_ids if taxon_id not in details]
+    if missing:
+        log_message(f"No details returned for {len(missing)} taxa: {', '.join(map(str, missing))}", log_path)
+    
+    return details
+
+
+def fetch_taxa_batch(batch, log_path):
+    """
+    Fetch one batch of taxon details, splitting it in half if it is too large.
+    
+    Args:
+        batch: List of taxon IDs
+        log_path: Path to log file
+    
+    Returns:
+        Dict mapping taxon ID to taxon details
+    """
+    api_url = f"{INATURALIST_API_BASE}/taxa/{','.join(str(taxon_id) for taxon_id in batch)}"
+    
+    if len(api_url) > MAX_URL_LENGTH and len(batch) > 1:
+        middle = len(batch) // 2
+        return {**fetch_taxa_batch(batch[:middle], log_path), **fetch_taxa_batch(batch[middle:], log_path)}
+    
     try:
-        if USE_TEST_MODE:
-            print(f"  🧪 Fetching test taxon details for ID: {taxon_id}")
-            # Return mock data for testing
-            for mock_taxon in MOCK_TAXA_RESPONSE['results']:
-                if mock_taxon['id'] == taxon_id:
-                    return mock_taxon
-            return None
-        
-        api_url = f"{INATURALIST_API_BASE}/taxa/{taxon_id}"
+        print(f"  Fetching taxon details: {len(batch)} taxa")
         
-        print(f"  Fetching taxon details: {api_url}")
-        
-        # Add rate limiting
-        time.sleep(RATE_LIMIT_DELAY)
-        
-        content, status_code = make_request(api_url)
+        content, status_code = make_request(
+            api_url,
+            retry_on=lambda code: is_retryable_status(code) and code not in BATCH_TOO_LARGE_STATUSES
+        )
         
         if content is None:
+            if status_code in BATCH_TOO_LARGE_STATUSES and len(batch) > 1:
+                print(f"  ⚠ Batch of {len(batch)} rejected (Status: {status_code}), splitting")
+                middle = len(batch) // 2
+                return {**fetch_taxa_batch(batch[:middle], log_path), **fetch_taxa_batch(batch[middle:], log_path)}
             print(f"  ✗ Failed to fetch taxon details (Status: {status_code})")
-            return None
+            log_message(f"Failed to fetch details for taxa {batch[0]}..{batch[-1]} (Status: {status_code})", log_path)
+            return {}
         
         data = json.loads(content)
-        results = data.get('results', [])
+        details = {result.get('id'): result for result in data.get('results', []) if result.get('id') in batch}
         
-        if not results:
-            print(f"  ✗ No taxon found with ID {taxon_id}")
-            return None
-        
-        print(f"  ✓ Successfully fetched taxon details")
-        return results[0]
+        print(f"  ✓ Successfully fetched {len(details)}/{len(batch)} taxon details")
+        return details
         
+    except json.JSONDecodeError as e:
+        print(f"  ✗ Failed to parse taxon details: {str(e)}")
+        return {}
     except Exception as e:
         print(f"  ✗ Error fetching taxon details: {type(e).__name__}: {str(e)}")
-        return None
+        return {}
+
+
+# Harvested state -> native taxa index, loaded by main() in --harvest mode
+NATIVE_RANGE_INDEX = None
 
 
 def fetch_state_native_range(taxon_id, log_path):
     """
     Fetch state-level native range data for a taxon by checking establishment means
-    for each US state.
+    for each US state. The per-state queries run concurrently under the shared
+    api.inaturalist.org rate budget (see inaturalist_native_range.py).
+    In --harvest mode the states come from a local join against the harvested index.
     
     Args:
         taxon_id: iNaturalist taxon ID
@@ -384,59 +524,11 @@ def fetch_state_native_range(taxon_id, log_path):
             # Return mock data for testing
             return ["Texas", "Oklahoma", "Kansas"]
         
-        native_states = []
-        total_states = len(US_STATE_PLACE_IDS)
-        # Calculate max line length for proper clearing: "    [50/50] Checking North Carolina..."
-        # The +3 accounts for the ellipsis "..." at the end of the progress message
-        max_state_name_len = max(len(name) for name in US_STATE_PLACE_IDS.keys())
-        max_line_len = len(f"    [{total_states}/{total_states}] Checking ") + max_state_name_len + 3
-        
-        print(f"  Fetching state-level native range data (checking {total_states} states)...")
-        
-        # Check each US state
-        for state_index, (state_name, place_id) in enumerate(US_STATE_PLACE_IDS.items(), 1):
-            # Query observations to get establishment means for this state
-            # Note: removed verifiable=true to get more results
-            api_url = f"{INATURALIST_API_BASE}/observations/species_counts?taxon_id={taxon_id}&place_id={place_id}"
-            
-            # Show progress indicator
-            print(f"    [{state_index}/{total_states}] Checking {state_name}...", end='\r', flush=True)
-            
-            # Add rate limiting
-            time.sleep(RATE_LIMIT_DELAY)
-            
-            content, status_code = make_request(api_url)
-            
-            if content is None:
-                continue  # Skip this state if request fails
-            
-            try:
-                data = json.loads(content)
-                results = data.get('results', [])
-                
-                if results:
-                    # Check if the plant has observations in this state
-                    for result in results:
-                        taxon_data = result.get('taxon', {})
-                        establishment_means = taxon_data.get('establishment_means', {})
-                        
-                        # Check if it's marked as native
-                        if establishment_means:
-                            means = establishment_means.get('establishment_means', '')
-                            place = establishment_means.get('place', {})
-                            
-                            # Verify this is the right place and it's native
-                            if means == 'native' and place.get('id') == place_id:
-                                native_states.append(state_name)
-                                # Clear the progress line and print the result
-                                result_line = f"    [{state_index}/{total_states}] ✓ Native to {state_name}"
-                                print(f"\r{result_line}" + " " * (max_line_len - len(result_line)))
-                                break
-            except json.JSONDecodeError:
-                continue  # Skip malformed responses
-        
-        # Clear the progress line
-        print(f"\r" + " " * max_line_len)
+        if NATIVE_RANGE_INDEX is not None:
+            native_states = NATIVE_RANGE_INDEX.native_states(taxon_id)
+        else:
+            print(f"  Fetching state-level native range data (checking {len(US_STATE_PLACE_IDS)} states)...")
+            native_states = fetch_native_states(taxon_id, headers=REQUEST_HEADERS)
         
         if native_states:
             print(f"  ✓ Found native range in {len(native_states)} states")
@@ -445,6 +537,10 @@ def fetch_state_native_range(taxon_id, log_path):
         
         return native_states
         
+    except NativeRangeError as e:
+        print(f"  ✗ {str(e)}")
+        log_message(f"Native range lookup cancelled for taxon {taxon_id}: {str(e)}", log_path)
+        return []
     except Exception as e:
         print(f"  ✗ Error fetching state native range: {type(e).__name__}: {str(e)}")
         return []
@@ -576,6 +672,25 @@ def main():
     ensure_output_directory()
     log_path = os.path.join(OUTPUT_DIR, LOG_FILE)
     
+    # Revalidate unchanged API responses against the on-disk cache
+    configure_transport(timeout=TIMEOUT, cache=get_http_cache())
+    
+    # Harvest (or reuse) the per-state native taxa sets once for the whole run
+    if USE_HARVEST and not USE_TEST_MODE:
+        global NATIVE_RANGE_INDEX
+        try:
+            NATIVE_RANGE_INDEX = load_native_range_index(headers=REQUEST_HEADERS, refresh=REFRESH_HARVEST)
+        except NativeRangeError as e:
+            print(f"  ✗ {str(e)}")
+            log_message(f"Native range harvest failed: {str(e)}", log_path)
+            return 1
+        missing = NATIVE_RANGE_INDEX.stale_states()
+        if missing:
+            # A partial index would silently drop states from every range; query per taxon instead
+            print(f"  ⚠ Harvest incomplete ({len(missing)} state(s) missing), falling back to per-taxon queries")
+            log_message(f"Native range harvest incomplete, missing: {', '.join(missing)}", log_path)
+            NATIVE_RANGE_INDEX = None
+    
     # Log start
     mode = "test mode" if USE_TEST_MODE else "normal mode"
     log_message(f"Batch job started ({mode})", log_path)
@@ -598,74 +713,65 @@ def main():
     if LIMIT and LIMIT < PER_PAGE:
         query_params['per_page'] = LIMIT
     
-    # Search for taxa
-    success, taxa, message = search_taxa(query_params, log_path)
-    log_message(f"Taxa search result: {message}", log_path)
+    # Stream taxa page by page through the detail and native range stages
+    success_count = 0
+    failure_count = 0
+    skipped_count = 0
+    processed = 0
+    
+    try:
+        for taxon, detailed_taxon in iter_detailed_taxa(iter_taxa(query_params, log_path, LIMIT or None), log_path):
+            processed += 1
+            print(f"\n[{processed}]")
+            
+            taxon_id = taxon.get('id')
+            scientific_name = taxon.get('name', 'Unknown')
+            common_name = taxon.get('preferred_common_name', '')
+            iconic_taxon = taxon.get('iconic_taxon_name', '')
+            
+            print(f"  Processing: {scientific_name}")
+            if common_name:
+                print(f"  Common name: {common_name}")
+            
+            # Validate that this is actually a plant
+            if iconic_taxon != 'Plantae':
+                print(f"  ⚠ Skipping: Not a plant (iconic_taxon_name: {iconic_taxon})")
+                log_message(f"Skipped non-plant taxon: {scientific_name} (iconic_taxon: {iconic_taxon})", log_path)
+                skipped_count += 1
+                continue
+            
+            # Detailed information comes from the batched detail stage
+            if detailed_taxon is None:
+                print(f"  ✗ Failed to fetch details")
+                failure_count += 1
+                continue
+            
+            # Fetch state-level native range data
+            state_native_range = fetch_state_native_range(taxon_id, log_path)
+            
+            # Transform to PlantFinder format
+            plant_data = transform_to_plantfinder_format(detailed_taxon, state_native_range)
+            
+            # Save the data
+            save_plant_data(plant_data, log_path)
+            success_count += 1
+            print(f"  ✓ Successfully processed")
     
-    if not success:
+    except TaxaSearchError as e:
+        log_message(f"Taxa search result: {str(e)}", log_path)
         print()
         print("=" * 70)
         print("✗ Batch job completed with errors")
         log_message("Batch job completed with errors - could not fetch taxa", log_path)
         return 1
     
-    if not taxa:
+    if processed == 0:
         print()
         print("=" * 70)
         print("⚠ No taxa found")
         log_message("Batch job completed - no taxa found", log_path)
         return 0
     
-    # Apply limit if specified
-    if LIMIT:
-        taxa = taxa[:LIMIT]
-        print(f"\nProcessing {len(taxa)} plants (limited to {LIMIT})...")
-    else:
-        print(f"\nProcessing {len(taxa)} plants...")
-    
-    # Process each taxon
-    success_count = 0
-    failure_count = 0
-    skipped_count = 0
-    
-    for i, taxon in enumerate(taxa, 1):
-        print(f"\n[{i}/{len(taxa)}]")
-        
-        taxon_id = taxon.get('id')
-        scientific_name = taxon.get('name', 'Unknown')
-        common_name = taxon.get('preferred_common_name', '')
-        iconic_taxon = taxon.get('iconic_taxon_name', '')
-        
-        print(f"  Processing: {scientific_name}")
-        if common_name:
-            print(f"  Common name: {common_name}")
-        
-        # Validate that this is actually a plant
-        if iconic_taxon != 'Plantae':
-            print(f"  ⚠ Skipping: Not a plant (iconic_taxon_name: {iconic_taxon})")
-            log_message(f"Skipped non-plant taxon: {scientific_name} (iconic_taxon: {iconic_taxon})", log_path)
-            skipped_count += 1
-            continue
-        
-        # Fetch detailed information
-        detailed_taxon = fetch_taxon_details(taxon_id, log_path)
-        
-        if detailed_taxon is None:
-            print(f"  ✗ Failed to fetch details")
-            failure_count += 1
-            continue
-        
-        # Fetch state-level native range data
-        state_native_range = fetch_state_native_range(taxon_id, log_path)
-        
-        # Transform to PlantFinder format
-        plant_data = transform_to_plantfinder_format(detailed_taxon, state_native_range)
-        
-        # Save the data
-        save_plant_data(plant_data, log_path)
-        success_count += 1
-        print(f"  ✓ Successfully processed")
-    
     # Summary
     print()
     print("=" * 70)
@@ -676,6 +782,8 @@ def main():
         print(f"✗ Failed to process {failure_count} plants")
     
     log_message(f"Processed {success_count} plants successfully, {skipped_count} skipped, {failure_count} failures", log_path)
+    if not USE_TEST_MODE:
+        log_message(get_http_cache().stats_line(), log_path)
     log_message("Batch job completed", log_path)
     
     print()
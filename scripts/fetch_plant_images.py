@@ -23,12 +23,12 @@ import os
 import json
 import re
 from datetime import datetime
-from urllib.request import Request, urlopen, urlretrieve
-from urllib.error import URLError, HTTPError
 from urllib.parse import quote, unquote
-import socket
 from io import BytesIO
 
+from http_cache import get_http_cache
+from http_transport import configure_transport, make_request as shared_make_request, open_url
+
 # Try to import PIL for image optimization
 try:
     from PIL import Image
@@ -76,21 +76,14 @@ def log_message(message):
 
 
 def make_request(url, headers=None):
-    """Make an HTTP request with proper headers and error handling."""
+    """Make an HTTP request with proper headers and error handling (over the shared keep-alive transport)."""
     if headers is None:
         headers = {
             'User-Agent': USER_AGENT,
             'Accept': 'application/json'
         }
     
-    request = Request(url, headers=headers)
-    try:
-        with urlopen(request, timeout=TIMEOUT) as response:
-            return response.read().decode('utf-8', errors='ignore'), response.status
-    except HTTPError as e:
-        return None, e.code
-    except (URLError, socket.timeout) as e:
-        return None, 0
+    return shared_make_request(url, headers=headers, retries=1, timeout=TIMEOUT)
 
 
 def search_wikipedia_image(scientific_name, common_name):
@@ -358,7 +351,7 @@ def download_image(image_url, plant_id, source='wikipedia'):
         log_message(f"    Downloading from {source} to: {filepath}")
         
         # Download image data
-        opener = urlopen(Request(image_url, headers={'User-Agent': USER_AGENT}), timeout=TIMEOUT)
+        opener = open_url(image_url, headers={'User-Agent': USER_AGENT}, timeout=TIMEOUT)
         image_data = opener.read()
         
         # Get original size
@@ -466,6 +459,9 @@ def main():
     print()
     
     log_message(f"Batch job started (version {SCRIPT_VERSION})")
+    
+    # Revalidate unchanged Wikipedia/iNaturalist API responses against the on-disk cache
+    configure_transport(timeout=TIMEOUT, cache=get_http_cache())
     if TEST_MODE:
         log_message("Running in TEST MODE - no files will be modified")
     if LIMIT:
@@ -549,6 +545,7 @@ def main():
     log_message(f"Successfully processed: {success_count} plants")
     log_message(f"Failed: {failure_count} plants")
     log_message(f"Skipped: {skipped_count} plants")
+    log_message(get_http_cache().stats_line())
     log_message(f"Total plants without images remaining: {len(plants_without_images) - success_count}")
     
     return 0 if failure_count < success_count else 1
@@ -14,10 +14,11 @@ import sys
 import json
 import pathlib
 import time
-from urllib.request import Request, urlopen
 from urllib.error import URLError, HTTPError
 from datetime import datetime, timezone
 
+from http_transport import open_url
+
 # USDA API configuration
 BASE = "https://plantsservices.sc.egov.usda.gov"
 UA = "Mozilla/5.0 (compatible; PLANTS-downloader/1.0)"
@@ -66,11 +67,11 @@ def dfs_find_masterid(node):
 def get_master_id(symbol: str) -> int:
     """Get MasterId for a USDA plant symbol."""
     url = f"{BASE}/api/PlantProfile?symbol={symbol}"
-    req = Request(url, headers={"User-Agent": UA, "Accept": "application/json"})
+    headers = {"User-Agent": UA, "Accept": "application/json"}
     
     try:
-        with urlopen(req, timeout=30) as r:
-            data = json.load(r)
+        with open_url(url, headers=headers, timeout=30) as r:
+            data = json.loads(r.read())
         mid = dfs_find_masterid(data)
         
         if mid is None:
@@ -103,8 +104,7 @@ def download_distribution(symbol: str, master_id: int) -> pathlib.Path:
     }
     
     try:
-        req = Request(url, data=payload, headers=headers, method="POST")
-        with urlopen(req, timeout=60) as r:
+        with open_url(url, data=payload, headers=headers, method="POST", timeout=60) as r:
             data = r.read()
         
         # Save to distribution directory
@@ -212,10 +212,6 @@ def main():
         else:
             failure_count += 1
         
-        # Rate limiting - be respectful to the API
-        if idx < len(plants):
-            time.sleep(2)
-        
         print()
     
     # Summary
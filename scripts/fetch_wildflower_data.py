@@ -5,34 +5,85 @@ This script scrapes plant data from the wildflower.org database,
 parses individual plant pages, and saves the data into source control.
 
 The script handles pagination automatically by:
-1. Using start/pagecount parameters to fetch pages sequentially
+1. Fetching the first page with start/pagecount parameters
 2. Extracting the total result count from the first page
-3. Iterating through all pages until all results are fetched
+3. Fetching all remaining pages concurrently, since their start offsets are known
 4. Logging the total number of pages and plant links extracted
 
+Plant pages go through a three-stage pipeline: a fetcher thread downloads
+pages under the shared rate limiter, a pool of parser processes extracts the
+plant data, and a writer thread saves the JSON files. The stages are linked
+by bounded queues, so parsing never holds up the next fetch.
+
 Usage:
     python fetch_wildflower_data.py          # Normal mode - fetch from website
     python fetch_wildflower_data.py --test   # Test mode - use mock data
+    python fetch_wildflower_data.py --parse-workers 4  # Parser processes (0 = parse in-process)
+    python fetch_wildflower_data.py --reparse  # Re-parse archived pages offline, no requests
+    python fetch_wildflower_data.py --restart  # Start a new crawl instead of resuming one
+    python fetch_wildflower_data.py --max-age 7  # Re-fetch pages last fetched 7+ days ago (0 = all)
+    python fetch_wildflower_data.py --max-pages 500  # Request at most 500 plant pages this run
+
+Progress is recorded in a crawl ledger (crawl_ledger.py, CRAWL_LEDGER_FILE):
+collection pages fetched, plant links found and each plant's status. A run
+that stops partway is resumed by the next run, which only fetches the
+collection pages and plants that are still missing.
+
+The ledger also remembers, per plant page, when it was last fetched, the hash
+of its body and its ETag/Last-Modified validators. A plant page is requested
+again only if it is new in the collection, was last fetched more than
+REFRESH_AFTER_DAYS ago, or (with validators) a conditional request reports a
+change; pages whose body hash did not change are not parsed or rewritten.
+At most MAX_PAGES_PER_RUN plant pages are requested per run, new plants
+first; the rest stay pending in the crawl for the next run.
+
+--test keeps its ledger and archived pages apart from real runs
+(CRAWL_LEDGER_FILE, PAGE_ARCHIVE_ROOT), so mock pages never reach the
+production page archive.
+
+--reparse re-runs PlantDataParser over the archived page of every saved plant
+(see page_archive.py), rewrites only the records whose extracted data changed
+and prints how many records changed per field.
 
 Configuration:
     Edit the script to change:
     - COLLECTION_NAME: The collection to fetch (default: "bamona")
     - PAGECOUNT: Number of results per page (default: 100)
+    - COLLECTION_FETCH_WORKERS: Collection pages requested at once (default: 4)
+    - PARSE_WORKERS: Parser processes (default: one per CPU)
+    - PARSE_CPU_BUDGET: CPU seconds per page before parsing is abandoned (default: 10;
+      checked after parsing when pages are parsed in-process)
+    - REFRESH_AFTER_DAYS: Age at which a page is re-fetched unconditionally (default: 30)
+    - MAX_PAGES_PER_RUN: Plant page requests per run, 0 for no limit (default: 0)
+    Request pacing for www.wildflower.org is set in rate_limiter.HOST_RATE_LIMITS.
 """
 
 import sys
 import os
+import hashlib
 import json
+import multiprocessing
 import re
-from datetime import datetime
-from urllib.request import Request, urlopen, HTTPCookieProcessor, build_opener
-from urllib.error import URLError, HTTPError
+import queue
+import signal
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from html.parser import HTMLParser
 import http.cookiejar
-import socket
+
+from crawl_ledger import CrawlLedger
+from http_cache import get_http_cache
+from page_archive import PAGE_ARCHIVE_DIR, PageArchiveError, get_page_archive
+from http_transport import (
+    ACCEPT_ENCODING, HTTPTransport, fetch_response as shared_fetch_response,
+    make_request as shared_make_request, stream_request as shared_stream_request
+)
 
 # Configuration
-SCRAPER_VERSION = "2.1.0"  # Version tracking for data model changes
+SCRAPER_VERSION = "2.3.0"  # Version tracking for data model changes
 COLLECTION_NAME = "bamona"  # Collection to fetch (bamona = butterflies and moths of North America)
 PAGECOUNT = 100  # Number of results per page (configurable)
 TARGET_URL = f"https://www.wildflower.org/collections/collection.php?start=0&collection={COLLECTION_NAME}&pagecount={PAGECOUNT}"
@@ -41,7 +92,36 @@ BASE_URL = "https://www.wildflower.org"
 OUTPUT_DIR = "src/data/wildflower-org"
 LOG_FILE = "fetch_log.txt"
 TIMEOUT = 30  # Request timeout in seconds
+COLLECTION_FETCH_WORKERS = 4  # Collection pages requested at once (per-host limits still apply)
+PARSE_WORKERS = os.cpu_count() or 1  # Parser processes (0 parses in the main process)
+PIPELINE_QUEUE_SIZE = 8  # Pages buffered between pipeline stages (bounds memory use)
+PARSE_CPU_BUDGET = 10.0  # CPU seconds a plant page may take to parse before it is skipped (0 = no limit)
+REFRESH_AFTER_DAYS = 30  # Re-fetch a plant page unconditionally once its last fetch is this old
+MAX_PAGES_PER_RUN = 0  # Plant page requests per run (0 = no limit); the rest wait for the next run
 USE_TEST_MODE = '--test' in sys.argv
+USE_REPARSE = '--reparse' in sys.argv  # Re-parse archived pages instead of crawling
+RESTART_CRAWL = '--restart' in sys.argv  # Abandon an interrupted crawl instead of resuming it
+LIVE_CRAWL_LEDGER_FILE = ".cache/crawl/wildflower.sqlite3"
+CRAWL_LEDGER_FILE = ".cache/crawl/wildflower-test.sqlite3" if USE_TEST_MODE else LIVE_CRAWL_LEDGER_FILE
+# Mock pages never mix with real fetches in the page archive
+PAGE_ARCHIVE_ROOT = ".cache/pages-test" if USE_TEST_MODE else PAGE_ARCHIVE_DIR
+
+for i, arg in enumerate(sys.argv):
+    if arg == '--parse-workers' and i + 1 < len(sys.argv):
+        try:
+            PARSE_WORKERS = max(0, int(sys.argv[i + 1]))
+        except ValueError:
+            print(f"Warning: Invalid parse worker count '{sys.argv[i + 1]}', ignoring")
+    elif arg == '--max-age' and i + 1 < len(sys.argv):
+        try:
+            REFRESH_AFTER_DAYS = max(0.0, float(sys.argv[i + 1]))
+        except ValueError:
+            print(f"Warning: Invalid max age '{sys.argv[i + 1]}', ignoring")
+    elif arg == '--max-pages' and i + 1 < len(sys.argv):
+        try:
+            MAX_PAGES_PER_RUN = max(0, int(sys.argv[i + 1]))
+        except ValueError:
+            print(f"Warning: Invalid page budget '{sys.argv[i + 1]}', ignoring")
 
 
 # Mock data for testing when website blocks requests
@@ -262,16 +342,64 @@ MOCK_PLANT_DETAILS = {
 }
 
 
+# Patterns for the total number of results on a collection page, in order of preference.
+# Matches look like "Showing results 1-100 of 250 plants", "Results: 1-100 of 250" or "Total: 250".
+TOTAL_RESULTS_PATTERNS = [
+    re.compile(r'of\s+(\d+)\s+(?:plants?|results?)', re.IGNORECASE),
+    re.compile(r'total[:\s]+(\d+)', re.IGNORECASE),
+    re.compile(r'(?<!\d)(\d+)\s+total', re.IGNORECASE),
+]
+# Characters carried over between streamed chunks so a match split across two chunks is found
+TOTAL_RESULTS_OVERLAP = 128
+
+
 class PlantLinkParser(HTMLParser):
-    """HTML parser to extract plant links from the collection page."""
+    """
+    HTML parser to extract plant links from the collection page.
+    
+    The page can be fed in chunks as it downloads (see stream_request); the
+    total results count is then picked up from the streamed text as well.
+    """
     
     def __init__(self):
         super().__init__()
         self.plant_links = []
         self.pagination_links = []
+        # Membership checks for the lists above
+        self._seen_plant_links = set()
+        self._seen_pagination_links = set()
         self.in_plant_link = False
         self.current_link = None
         self.total_results = None
+        self.chars_fed = 0
+        # First match per TOTAL_RESULTS_PATTERNS entry, and the unscanned tail of the stream
+        self._total_matches = [None] * len(TOTAL_RESULTS_PATTERNS)
+        self._scan_tail = ''
+    
+    def feed(self, data):
+        self.chars_fed += len(data)
+        self._scan_total_results(data)
+        super().feed(data)
+    
+    def close(self):
+        self._scan_total_results('', final=True)
+        super().close()
+    
+    def _scan_total_results(self, data, final=False):
+        """Look for the total results count in the stream, without keeping the page in memory."""
+        if all(match is not None for match in self._total_matches):
+            return
+        window = self._scan_tail + data
+        for i, pattern in enumerate(TOTAL_RESULTS_PATTERNS):
+            if self._total_matches[i] is not None:
+                continue
+            for match in pattern.finditer(window):
+                # A match touching the end of the window may still grow (e.g. "25" of "250")
+                if match.end() < len(window) or final:
+                    self._total_matches[i] = int(match.group(1))
+                    break
+        self._scan_tail = window[-TOTAL_RESULTS_OVERLAP:]
+        self.total_results = next((total for total in self._total_matches if total is not None), None)
     
     def handle_starttag(self, tag, attrs):
         if tag == 'a':
@@ -283,12 +411,14 @@ class PlantLinkParser(HTMLParser):
                 self.in_plant_link = True
             # Look for pagination links
             elif 'collection.php' in href and ('page=' in href or 'start=' in href):
-                if href not in self.pagination_links:
+                if href not in self._seen_pagination_links:
+                    self._seen_pagination_links.add(href)
                     self.pagination_links.append(href)
     
     def handle_endtag(self, tag):
         if tag == 'a' and self.in_plant_link:
-            if self.current_link and self.current_link not in self.plant_links:
+            if self.current_link and self.current_link not in self._seen_plant_links:
+                self._seen_plant_links.add(self.current_link)
                 self.plant_links.append(self.current_link)
             self.in_plant_link = False
             self.current_link = None
@@ -297,80 +427,434 @@ class PlantLinkParser(HTMLParser):
         """Extract total number of results from HTML content."""
         # Look for patterns like "Showing results 1-100 of 250 plants"
         # or "Results: 1-100 of 250" or "Total: 250"
-        patterns = [
-            r'of\s+(\d+)\s+(?:plants?|results?)',
-            r'total[:\s]+(\d+)',
-            r'(\d+)\s+total',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, html_content, re.IGNORECASE)
+        for pattern in TOTAL_RESULTS_PATTERNS:
+            match = pattern.search(html_content)
             if match:
                 return int(match.group(1))
         
         return None
 
 
+# Plant detail pages are read in one pass by PlantDataParser, which collects
+# "<strong>Label:</strong> value" pairs under the heading they appear below.
+# These are the sections the extractors use.
+SECTION_CHARACTERISTICS = 'Plant Characteristics'
+SECTION_BLOOM = 'Bloom Information'
+SECTION_DISTRIBUTION = 'Distribution'
+SECTION_GROWING = 'Growing Conditions'
+SECTION_BENEFIT = 'Benefit'
+
+# Tags the tokenizer gives a meaning to
+HEADING_TAGS = {'h1', 'h2', 'h3', 'h4', 'h5', 'h6'}
+LABEL_TAGS = {'strong', 'b'}
+SKIPPED_CONTENT_TAGS = {'script', 'style'}
+# Tags that end a labeled value, e.g. "<strong>Duration:</strong> Perennial<br />"
+VALUE_BREAK_TAGS = {'br', 'p', 'div', 'li', 'ul', 'ol', 'dt', 'dd', 'tr', 'td', 'th', 'table'} | HEADING_TAGS | LABEL_TAGS
+# Attributes whose value names a field, e.g. <h1 class="scientific-name">
+FIELD_ATTRIBUTES = ('class', 'id')
+
+# Element class (or id) names for pages that mark fields up that way
+SCI_NAME_CLASS_RE = re.compile(r'scientific[- ]?name|binomial', re.IGNORECASE)
+COMMON_NAME_CLASS_RE = re.compile(r'common[- ]?name', re.IGNORECASE)
+FAMILY_CLASS_RE = re.compile(r'family', re.IGNORECASE)
+DESCRIPTION_CLASS_RE = re.compile(r'description', re.IGNORECASE)
+HEIGHT_CLASS_RE = re.compile(r'height|tall', re.IGNORECASE)
+SPREAD_CLASS_RE = re.compile(r'spread|width', re.IGNORECASE)
+BLOOM_COLOR_CLASS_RE = re.compile(r'bloom[- ]?color', re.IGNORECASE)
+BLOOM_TIME_CLASS_RE = re.compile(r'bloom[- ]?time', re.IGNORECASE)
+
+# Patterns applied to an already extracted field value.
+# Numbers start where a run of digits starts ((?<!\d)) and a fraction needs a
+# space before it ("1 1/2"), so a long run of digits is tried from one
+# position only and split just one way: matching stays linear in its length.
+NUMBER = r'(?<!\d)\d+(?:\s+\d+/\d+)?'
+HEIGHT_DESCRIPTION_RE = re.compile(rf'({NUMBER}[-–]\d+(?:\s+\d+/\d+)?\s*(?:ft|feet|in|inches)\.?\s+(?:tall|perennial|annual|biennial))', re.IGNORECASE)
+HEIGHT_RANGE_RE = re.compile(rf'({NUMBER})\s*[-–]\s*(\d+(?:\s+\d+/\d+)?)\s*(inches?|feet?|ft|in|cm)', re.IGNORECASE)
+HEIGHT_SINGLE_RE = re.compile(rf'({NUMBER})\s*(inches?|feet?|ft|in|cm)', re.IGNORECASE)
+SPREAD_RANGE_RE = re.compile(r'(?<!\d)(\d+)[-–](\d+)\s*(inches?|feet?|ft|in)', re.IGNORECASE)
+SPREAD_SINGLE_RE = re.compile(r'(?<!\d)(\d+)\s*(inches?|feet?|ft|in)', re.IGNORECASE)
+BLOOM_COLOR_LABEL_RE = re.compile(r'^bloom\s*color\s*:\s*', re.IGNORECASE)
+BLOOM_TIME_LABEL_RE = re.compile(r'^bloom\s*time\s*:\s*', re.IGNORECASE)
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Labeled values with a fixed vocabulary on wildflower.org
+LIGHT_REQUIREMENT_VALUES = {
+    'sun': 'full_sun', 'full sun': 'full_sun',
+    'part sun': 'partial_sun', 'partial sun': 'partial_sun',
+    'part shade': 'partial_shade', 'partial shade': 'partial_shade',
+    'shade': 'full_shade', 'full shade': 'full_shade',
+}
+SOIL_MOISTURE_VALUES = ('dry', 'medium', 'moist', 'wet')
+LIFESPAN_VALUES = ('perennial', 'annual', 'biennial')
+
+# Keyword checks answered once per section (PageScan.keywords).
+# Whole-word keywords (\bword\b) come from the set of words in the section,
+# built in a single pass; each entry lists the word forms that count.
+PAGE_WORD_KEYWORDS = [
+    # Moisture
+    ('dry', ('dry',)),
+    ('moist', ('moist',)),
+    ('wet', ('wet',)),
+    # Soil
+    ('sand', ('sand', 'sandy')),
+    ('loam', ('loam', 'loamy')),
+    ('clay', ('clay', 'clayey')),
+    ('rocky', ('rocky',)),
+    ('limestone', ('limestone',)),
+    ('caliche', ('caliche',)),
+    # Wildlife
+    ('bees', ('bee', 'bees')),
+    ('butterflies', ('butterfly', 'butterflies')),
+    ('hummingbirds', ('hummingbird', 'hummingbirds')),
+    ('moths', ('moth', 'moths')),
+    # Lifespan
+    ('perennial', ('perennial',)),
+    ('annual', ('annual',)),
+    ('biennial', ('biennial',)),
+]
+# Phrase keywords: (name, pattern, literal). The pattern only runs when the
+# literal occurs in the lowercased text, which rules out most sections cheaply.
+PAGE_PHRASE_KEYWORDS = [
+    # Light
+    ('full_sun', r'full\s+sun', 'sun'),
+    ('partial_sun', r'partial\s+sun', 'sun'),
+    ('partial_shade', r'partial\s+shade', 'shade'),
+    ('full_shade', r'full\s+shade|deep\s+shade', 'shade'),
+    # Moisture
+    ('drought_tolerant', r'drought[- ]tolerant', 'drought'),
+    # Wildlife
+    ('monarch', r'monarch', 'monarch'),
+    # Landscape uses
+    ('pollinator_garden', r'pollinator\s+garden', 'garden'),
+    ('rain_garden', r'rain\s+garden', 'garden'),
+    ('xeriscaping', r'xeriscape|xeriscaping', 'xeriscap'),
+    ('native_garden', r'native\s+garden', 'garden'),
+    ('woodland_garden', r'woodland\s+garden', 'garden'),
+]
+WORD_RE = re.compile(r'\w+')
+WORD_KEYWORD_RES = {name: re.compile(r'\b(?:%s)\b' % '|'.join(words), re.IGNORECASE)
+                    for name, words in PAGE_WORD_KEYWORDS}
+PHRASE_KEYWORD_RES = {name: re.compile(pattern, re.IGNORECASE) for name, pattern, _ in PAGE_PHRASE_KEYWORDS}
+
+# Checks for one word followed later on the same line by another, e.g.
+# "medium ... moisture" (see followed_on_line). They span the text between
+# the words, so they can overlap other keywords and keep their own scan.
+MEDIUM_WORD_RE = re.compile(r'\bmedium\b', re.IGNORECASE)
+MODERATE_WORD_RE = re.compile(r'moderate', re.IGNORECASE)
+MOISTURE_WORD_RE = re.compile(r'moisture', re.IGNORECASE)
+BIRD_WORD_RE = re.compile(r'\bbirds?\b', re.IGNORECASE)
+BIRD_FOOD_WORD_RE = re.compile(r'\b(?:eat|food|seed)', re.IGNORECASE)
+
+# Hardiness zones
+ZONE_RANGE_RE = re.compile(r'zones?\s*:?\s*(\d+)[-–](\d+)', re.IGNORECASE)
+ZONE_SINGLE_RE = re.compile(r'zone\s*(\d+)', re.IGNORECASE)
+
+# Distribution
+STATE_TO_CODE = {
+    'alabama': 'AL', 'alaska': 'AK', 'arizona': 'AZ', 'arkansas': 'AR',
+    'california': 'CA', 'colorado': 'CO', 'connecticut': 'CT', 'delaware': 'DE',
+    'florida': 'FL', 'georgia': 'GA', 'hawaii': 'HI', 'idaho': 'ID',
+    'illinois': 'IL', 'indiana': 'IN', 'iowa': 'IA', 'kansas': 'KS',
+    'kentucky': 'KY', 'louisiana': 'LA', 'maine': 'ME', 'maryland': 'MD',
+    'massachusetts': 'MA', 'michigan': 'MI', 'minnesota': 'MN', 'mississippi': 'MS',
+    'missouri': 'MO', 'montana': 'MT', 'nebraska': 'NE', 'nevada': 'NV',
+    'new hampshire': 'NH', 'new jersey': 'NJ', 'new mexico': 'NM', 'new york': 'NY',
+    'north carolina': 'NC', 'north dakota': 'ND', 'ohio': 'OH', 'oklahoma': 'OK',
+    'oregon': 'OR', 'pennsylvania': 'PA', 'rhode island': 'RI', 'south carolina': 'SC',
+    'south dakota': 'SD', 'tennessee': 'TN', 'texas': 'TX', 'utah': 'UT',
+    'vermont': 'VT', 'virginia': 'VA', 'washington': 'WA', 'west virginia': 'WV',
+    'wisconsin': 'WI', 'wyoming': 'WY'
+}
+STATE_CODES = set(STATE_TO_CODE.values()) | {'DC'}  # Include DC
+PROVINCE_TO_CODE = {
+    'alberta': 'AB', 'british columbia': 'BC', 'manitoba': 'MB',
+    'new brunswick': 'NB', 'newfoundland': 'NL', 'newfoundland and labrador': 'NL',
+    'northwest territories': 'NT', 'nova scotia': 'NS', 'nunavut': 'NU',
+    'ontario': 'ON', 'prince edward island': 'PE', 'quebec': 'QC',
+    'saskatchewan': 'SK', 'yukon': 'YT'
+}
+PROVINCE_CODES = set(PROVINCE_TO_CODE.values())
+TWO_LETTER_CODE_RE = re.compile(r'\b([A-Z]{2})\b')
+STATE_NAMES_RE = re.compile(r'(?:Alabama|Alaska|Arizona|Arkansas|California|Colorado|Connecticut|Delaware|Florida|Georgia|Hawaii|Idaho|Illinois|Indiana|Iowa|Kansas|Kentucky|Louisiana|Maine|Maryland|Massachusetts|Michigan|Minnesota|Mississippi|Missouri|Montana|Nebraska|Nevada|New Hampshire|New Jersey|New Mexico|New York|North Carolina|North Dakota|Ohio|Oklahoma|Oregon|Pennsylvania|Rhode Island|South Carolina|South Dakota|Tennessee|Texas|Utah|Vermont|Virginia|Washington|West Virginia|Wisconsin|Wyoming)', re.IGNORECASE)
+# Case-sensitive lowercase versions, much faster on already lowercased (ASCII) text
+STATE_NAMES_LOWER_RE = re.compile(STATE_NAMES_RE.pattern.lower())
+PROVINCE_NAMES_RE = re.compile(r'(?:Alberta|British Columbia|Manitoba|New Brunswick|Newfoundland and Labrador|Newfoundland|Northwest Territories|Nova Scotia|Nunavut|Ontario|Prince Edward Island|Quebec|Saskatchewan|Yukon)', re.IGNORECASE)
+PROVINCE_NAMES_LOWER_RE = re.compile(PROVINCE_NAMES_RE.pattern.lower())
+
+
+def parse_fractional(s):
+    """Parse a number that may carry a fraction, e.g. "1 1/2" -> 1.5."""
+    parts = s.split()
+    if len(parts) == 2 and '/' in parts[1]:
+        whole = int(parts[0])
+        frac_parts = parts[1].split('/')
+        return whole + int(frac_parts[0]) / int(frac_parts[1])
+    return float(s)
+
+
+def followed_on_line(text, first_re, then_re):
+    """
+    True if a line of text has a match of first_re followed by one of then_re.
+    
+    Same answer as searching for first + '.*' + then, in linear time: the
+    regex retries '.*' from every match of first_re, but only the first match
+    on a line needs checking, since any later one leaves less of the line
+    for then_re.
+    """
+    for line in text.split('\n'):
+        first = first_re.search(line)
+        if first and then_re.search(line, first.end()):
+            return True
+    return False
+
+
+def split_list(value):
+    """Split a comma-separated field value, e.g. "Orange , Yellow" -> ['Orange', 'Yellow']."""
+    return [item.strip() for item in value.split(',') if item.strip()] if value else []
+
+
+class PageScan:
+    """
+    Keyword and name scans over one block of page text (a section or the whole page).
+    
+    ASCII text is lowercased once, which keeps every character position, so
+    case-insensitive checks become plain lookups and case-sensitive scans.
+    Other text falls back to the case-insensitive patterns.
+    """
+    
+    def __init__(self, text):
+        self.text = text
+        self.lower = text.lower() if text.isascii() else None
+        self.words = set(WORD_RE.findall(self.lower)) if self.lower is not None else None
+        self.keywords = set()
+        
+        for name, words in PAGE_WORD_KEYWORDS:
+            if self.words is not None:
+                found = any(word in self.words for word in words)
+            else:
+                found = WORD_KEYWORD_RES[name].search(text) is not None
+            if found:
+                self.keywords.add(name)
+        
+        for name, _, literal in PAGE_PHRASE_KEYWORDS:
+            if self.lower is not None and literal not in self.lower:
+                continue
+            if PHRASE_KEYWORD_RES[name].search(text):
+                self.keywords.add(name)
+    
+    def state_names(self):
+        """All state names in the text (lowercased), like STATE_NAMES_RE.findall."""
+        if self.lower is not None:
+            return STATE_NAMES_LOWER_RE.findall(self.lower)
+        return [name.lower() for name in STATE_NAMES_RE.findall(self.text)]
+    
+    def province_names(self):
+        """All province names in the text (lowercased), like PROVINCE_NAMES_RE.findall."""
+        if self.lower is not None:
+            return PROVINCE_NAMES_LOWER_RE.findall(self.lower)
+        return [name.lower() for name in PROVINCE_NAMES_RE.findall(self.text)]
+
+
 class PlantDataParser(HTMLParser):
-    """HTML parser to extract plant data from individual plant pages."""
+    """
+    HTML parser to extract plant data from individual plant pages.
+    
+    The page is tokenized once into `fields`, a mapping of section heading to
+    label to value built from "<strong>Label:</strong> value" pairs, e.g.
+    fields['Bloom Information']['Bloom Color'] == 'Orange, Yellow'. Headings,
+    paragraphs, the text of elements with a class or id, and the text of each
+    section are collected in the same pass. Extractors read these instead of
+    searching the raw HTML, and keyword checks only look at the section the
+    field belongs to, so a "Sun" in a plant's name or a state code in a footer
+    no longer counts.
+    """
     
-    def __init__(self):
-        super().__init__()
-        self.plant_data = {}
-        self.current_tag = None
-        self.current_data = []
+    def reset(self):
+        super().reset()
+        self.html = None
+        self.fields = {}
+        self.headings = []
+        self.paragraphs = []
+        self.class_texts = []
+        self.section_texts = {}
+        self._section = ''
+        self._skip_depth = 0
+        self._heading = None
+        self._label_parts = None
+        self._label = None
+        self._value_parts = None
+        self._paragraph = None
+        self._pending_classes = []
+        self._scans = {}
+    
+    def tokenize(self, html_content):
+        """Tokenize a page once; later calls with the same page are free."""
+        if self.html is not html_content:
+            self.reset()
+            self.feed(html_content)
+            self.close()
+            self.html = html_content
+        return self.fields
     
     def handle_starttag(self, tag, attrs):
-        self.current_tag = tag
+        if tag in SKIPPED_CONTENT_TAGS:
+            self._skip_depth += 1
+            return
+        if tag in VALUE_BREAK_TAGS:
+            self._end_value()
+        
+        if tag in HEADING_TAGS:
+            self._heading = (tag, [])
+        elif tag in LABEL_TAGS:
+            self._label_parts = []
+        elif tag == 'p':
+            self._paragraph = []
+        elif tag == 'br' and self._paragraph is not None:
+            self._paragraph.append(' ')
+        
+        for name, value in attrs:
+            if name in FIELD_ATTRIBUTES and value:
+                self._pending_classes.append(value)
+    
+    def handle_endtag(self, tag):
+        if tag in SKIPPED_CONTENT_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+            return
+        
+        if tag in HEADING_TAGS and self._heading is not None and self._heading[0] == tag:
+            text = WHITESPACE_RE.sub(' ', ''.join(self._heading[1])).strip()
+            self._heading = None
+            if text:
+                self.headings.append((tag, text))
+                self._section = text
+        elif tag in LABEL_TAGS and self._label_parts is not None:
+            text = WHITESPACE_RE.sub(' ', ''.join(self._label_parts)).strip()
+            self._label_parts = None
+            if text.endswith(':') and len(text) > 1:
+                self._label = text[:-1].rstrip()
+                self._value_parts = []
+            return
+        elif tag == 'p' and self._paragraph is not None:
+            text = WHITESPACE_RE.sub(' ', ''.join(self._paragraph)).strip()
+            self._paragraph = None
+            if text:
+                self.paragraphs.append(text)
+        
+        if tag in VALUE_BREAK_TAGS:
+            self._end_value()
     
     def handle_data(self, data):
-        if self.current_tag and data.strip():
-            self.current_data.append(data.strip())
-    
-    def extract_text(self, html_content, pattern):
-        """Extract text matching a pattern from HTML."""
-        match = re.search(pattern, html_content, re.IGNORECASE | re.DOTALL)
-        return match.group(1).strip() if match else None
-    
-    def extract_list(self, html_content, pattern):
-        """Extract comma-separated list from HTML."""
-        text = self.extract_text(html_content, pattern)
-        if text:
-            # Split by comma and clean up
-            return [item.strip() for item in text.split(',') if item.strip()]
-        return []
+        if self._skip_depth:
+            return
+        
+        if self._heading is not None:
+            self._heading[1].append(data)
+        if self._label_parts is not None:
+            self._label_parts.append(data)
+        elif self._value_parts is not None:
+            self._value_parts.append(data)
+        if self._paragraph is not None:
+            self._paragraph.append(data)
+        
+        text = data.strip()
+        if not text:
+            return
+        self.section_texts.setdefault(self._section, []).append(text)
+        if self._pending_classes:
+            self.class_texts.extend((name, text) for name in self._pending_classes)
+            self._pending_classes = []
+    
+    def close(self):
+        super().close()
+        self._end_value()
+    
+    def _end_value(self):
+        """Store the value collected since the last label (the first value for a label wins)."""
+        if self._label is None:
+            return
+        value = WHITESPACE_RE.sub(' ', ''.join(self._value_parts)).strip()
+        if value:
+            self.fields.setdefault(self._section, {}).setdefault(self._label, value)
+        self._label = None
+        self._value_parts = None
+    
+    def field(self, labels, *sections):
+        """
+        Look up a labeled value.
+        
+        Args:
+            labels: Label or tuple of labels to try, in order (case-insensitive)
+            *sections: Sections to look in (case-insensitive); all sections if none given
+        
+        Returns:
+            The value, or None if no section has one of the labels
+        """
+        if isinstance(labels, str):
+            labels = (labels,)
+        wanted = {section.lower() for section in sections}
+        for label in labels:
+            label = label.lower()
+            for section, values in self.fields.items():
+                if wanted and section.lower() not in wanted:
+                    continue
+                for name, value in values.items():
+                    if name.lower() == label:
+                        return value
+        return None
+    
+    def class_text(self, pattern):
+        """Text of the first element whose class or id matches `pattern`."""
+        for name, text in self.class_texts:
+            if pattern.search(name):
+                return text
+        return None
+    
+    def heading(self, tag):
+        """Text of the first heading with the given tag."""
+        for heading_tag, text in self.headings:
+            if heading_tag == tag:
+                return text
+        return None
+    
+    def scan(self, *sections):
+        """
+        PageScan over the text of the given sections, built once per page.
+        
+        Falls back to the text of the whole page when it has none of the
+        sections (pages without the usual headings), or when none are given.
+        """
+        key = tuple(section.lower() for section in sections)
+        if key not in self._scans:
+            texts = [text for section, text in self.section_texts.items()
+                     if not key or section.lower() in key]
+            if not texts:
+                texts = self.section_texts.values()
+            # One line per text node, so line-bounded patterns stay within a field
+            self._scans[key] = PageScan('\n'.join('\n'.join(text) for text in texts))
+        return self._scans[key]
     
     def extract_height_range(self, html_content):
         """Extract height range from HTML."""
-        height_text = self.extract_text(html_content, r'<[^>]*(?:height|tall)[^>]*>([^<]+)')
+        self.tokenize(html_content)
+        height_text = self.class_text(HEIGHT_CLASS_RE)
         if not height_text:
-            # Try pattern with <strong> tags
-            height_text = self.extract_text(html_content, r'<strong>(?:Height|Size Notes?):</strong>\s*([^<]+)')
-        if not height_text:
-            # Try to find height in size notes
-            height_text = self.extract_text(html_content, r'Size Notes?:\s*([^<]+)')
+            height_text = self.field(('Height', 'Size Notes', 'Size Note'), SECTION_CHARACTERISTICS)
         if not height_text:
             # Try to find height in general description (e.g., "1 1/2-2 ft. perennial")
-            height_text = self.extract_text(html_content, r'(\d+(?:\s*\d+/\d+)?[-–]\d+(?:\s*\d+/\d+)?\s*(?:ft|feet|in|inches)\.?\s+(?:tall|perennial|annual|biennial))')
+            description = self.paragraphs[0] if self.paragraphs else ''
+            match = HEIGHT_DESCRIPTION_RE.search(description)
+            height_text = match.group(1) if match else None
         if not height_text:
             return None
         
         # Try to parse range like "12-36 inches" or "1-3 feet" or "1 1/2-2 ft"
-        range_match = re.search(r'(\d+(?:\s*\d+/\d+)?)\s*[-–]\s*(\d+(?:\s*\d+/\d+)?)\s*(inches?|feet?|ft|in|cm)', height_text, re.IGNORECASE)
+        range_match = HEIGHT_RANGE_RE.search(height_text)
         if range_match:
             min_str = range_match.group(1).strip()
             max_str = range_match.group(2).strip()
             unit = range_match.group(3).lower()
             
             # Parse fractional values like "1 1/2"
-            def parse_fractional(s):
-                parts = s.split()
-                if len(parts) == 2 and '/' in parts[1]:
-                    whole = int(parts[0])
-                    frac_parts = parts[1].split('/')
-                    return whole + int(frac_parts[0]) / int(frac_parts[1])
-                return float(s)
-            
             min_val = parse_fractional(min_str)
             max_val = parse_fractional(max_str)
             
@@ -385,20 +869,12 @@ class PlantDataParser(HTMLParser):
             return {'min': int(min_val), 'max': int(max_val), 'unit': 'inches'}
         
         # Try single value like "24 inches"
-        single_match = re.search(r'(\d+(?:\s*\d+/\d+)?)\s*(inches?|feet?|ft|in|cm)', height_text, re.IGNORECASE)
+        single_match = HEIGHT_SINGLE_RE.search(height_text)
         if single_match:
             val_str = single_match.group(1).strip()
             unit = single_match.group(2).lower()
             
             # Parse fractional values
-            def parse_fractional(s):
-                parts = s.split()
-                if len(parts) == 2 and '/' in parts[1]:
-                    whole = int(parts[0])
-                    frac_parts = parts[1].split('/')
-                    return whole + int(frac_parts[0]) / int(frac_parts[1])
-                return float(s)
-            
             val = parse_fractional(val_str)
             
             if 'feet' in unit or unit == 'ft':
@@ -412,12 +888,13 @@ class PlantDataParser(HTMLParser):
     
     def extract_spread_range(self, html_content):
         """Extract spread/width range from HTML."""
-        spread_text = self.extract_text(html_content, r'<[^>]*(?:spread|width)[^>]*>([^<]+)')
+        self.tokenize(html_content)
+        spread_text = self.class_text(SPREAD_CLASS_RE)
         if not spread_text:
             return None
         
         # Try to parse range like "12-24 inches" or "1-2 feet"
-        range_match = re.search(r'(\d+)[-–](\d+)\s*(inches?|feet?|ft|in)', spread_text, re.IGNORECASE)
+        range_match = SPREAD_RANGE_RE.search(spread_text)
         if range_match:
             min_val = int(range_match.group(1))
             max_val = int(range_match.group(2))
@@ -431,7 +908,7 @@ class PlantDataParser(HTMLParser):
             return {'min': min_val, 'max': max_val, 'unit': 'inches'}
         
         # Try single value like "18 inches"
-        single_match = re.search(r'(\d+)\s*(inches?|feet?|ft|in)', spread_text, re.IGNORECASE)
+        single_match = SPREAD_SINGLE_RE.search(spread_text)
         if single_match:
             val = int(single_match.group(1))
             unit = single_match.group(2).lower()
@@ -444,56 +921,64 @@ class PlantDataParser(HTMLParser):
         return None
     
     def extract_light_requirements(self, html_content):
-        """Extract light/sun requirements."""
+        """Extract light/sun requirements from Growing Conditions."""
+        self.tokenize(html_content)
+        keywords = self.scan(SECTION_GROWING).keywords
         light_data = {}
         
+        # "Light Requirement: Sun , Part Shade"
+        for value in split_list(self.field('Light Requirement', SECTION_GROWING)):
+            key = LIGHT_REQUIREMENT_VALUES.get(value.lower())
+            if key:
+                light_data[key] = True
+        
         # Look for common light requirement indicators
-        if re.search(r'full\s+sun', html_content, re.IGNORECASE):
-            light_data['full_sun'] = True
-        if re.search(r'partial\s+sun', html_content, re.IGNORECASE):
-            light_data['partial_sun'] = True
-        if re.search(r'partial\s+shade', html_content, re.IGNORECASE):
-            light_data['partial_shade'] = True
-        if re.search(r'full\s+shade|deep\s+shade', html_content, re.IGNORECASE):
-            light_data['full_shade'] = True
+        for key in ('full_sun', 'partial_sun', 'partial_shade', 'full_shade'):
+            if key in keywords:
+                light_data[key] = True
         
         return light_data if light_data else None
     
     def extract_moisture_requirements(self, html_content):
-        """Extract moisture/water requirements."""
+        """Extract moisture/water requirements from Growing Conditions."""
+        self.tokenize(html_content)
+        scan = self.scan(SECTION_GROWING)
+        keywords = scan.keywords
         moisture_data = {}
         
-        if re.search(r'\bdry\b', html_content, re.IGNORECASE):
+        # "Soil Moisture: Dry , Medium"
+        moisture_words = set(WORD_RE.findall((self.field('Soil Moisture', SECTION_GROWING) or '').lower()))
+        for value in SOIL_MOISTURE_VALUES:
+            if value in moisture_words:
+                moisture_data[value] = True
+        
+        if 'dry' in keywords:
             moisture_data['dry'] = True
-        if re.search(r'\bmedium\b.*moisture|moderate.*moisture', html_content, re.IGNORECASE):
+        if (followed_on_line(scan.text, MEDIUM_WORD_RE, MOISTURE_WORD_RE)
+                or followed_on_line(scan.text, MODERATE_WORD_RE, MOISTURE_WORD_RE)):
             moisture_data['medium'] = True
-        if re.search(r'\bmoist\b', html_content, re.IGNORECASE):
+        if 'moist' in keywords:
             moisture_data['moist'] = True
-        if re.search(r'\bwet\b', html_content, re.IGNORECASE):
+        if 'wet' in keywords:
             moisture_data['wet'] = True
-        if re.search(r'drought[- ]tolerant', html_content, re.IGNORECASE):
+        drought_tolerance = self.field('Drought Tolerance', SECTION_GROWING)
+        if 'drought_tolerant' in keywords or (drought_tolerance or '').lower() == 'high':
             moisture_data['droughtTolerant'] = True
         
         return moisture_data if moisture_data else None
     
     def extract_soil_types(self, html_content):
-        """Extract soil type information."""
+        """Extract soil type information from Growing Conditions and the native habitat."""
+        self.tokenize(html_content)
+        keywords = set(self.scan(SECTION_GROWING).keywords)
+        habitat = self.field('Native Habitat', SECTION_DISTRIBUTION)
+        if habitat:
+            keywords |= PageScan(habitat).keywords
         soil_data = {}
-        soil_types = []
         
         # Look for common soil types
-        if re.search(r'\bsand(?:y)?\b', html_content, re.IGNORECASE):
-            soil_types.append('sand')
-        if re.search(r'\bloam(?:y)?\b', html_content, re.IGNORECASE):
-            soil_types.append('loam')
-        if re.search(r'\bclay(?:ey)?\b', html_content, re.IGNORECASE):
-            soil_types.append('clay')
-        if re.search(r'\brocky\b', html_content, re.IGNORECASE):
-            soil_types.append('rocky')
-        if re.search(r'\blimestone\b', html_content, re.IGNORECASE):
-            soil_types.append('limestone')
-        if re.search(r'\bcaliche\b', html_content, re.IGNORECASE):
-            soil_types.append('caliche')
+        soil_types = [soil for soil in ('sand', 'loam', 'clay', 'rocky', 'limestone', 'caliche')
+                      if soil in keywords]
         
         if soil_types:
             soil_data['types'] = soil_types
@@ -502,15 +987,17 @@ class PlantDataParser(HTMLParser):
     
     def extract_hardiness_zones(self, html_content):
         """Extract USDA hardiness zones."""
+        self.tokenize(html_content)
+        text = self.scan().text
         # Look for patterns like "Zone 3-8" or "Zones 5, 6, 7"
-        zone_match = re.search(r'zones?\s*:?\s*(\d+)[-–](\d+)', html_content, re.IGNORECASE)
+        zone_match = ZONE_RANGE_RE.search(text)
         if zone_match:
             start = int(zone_match.group(1))
             end = int(zone_match.group(2))
             return [str(z) for z in range(start, end + 1)]
         
         # Look for individual zones
-        zone_matches = re.findall(r'zone\s*(\d+)', html_content, re.IGNORECASE)
+        zone_matches = ZONE_SINGLE_RE.findall(text)
         if zone_matches:
             return list(set(zone_matches))
         
@@ -518,109 +1005,56 @@ class PlantDataParser(HTMLParser):
     
     def extract_native_range(self, html_content):
         """Extract native range/distribution information as state codes."""
-        # Mapping of state names to two-letter codes
-        state_to_code = {
-            'alabama': 'AL', 'alaska': 'AK', 'arizona': 'AZ', 'arkansas': 'AR',
-            'california': 'CA', 'colorado': 'CO', 'connecticut': 'CT', 'delaware': 'DE',
-            'florida': 'FL', 'georgia': 'GA', 'hawaii': 'HI', 'idaho': 'ID',
-            'illinois': 'IL', 'indiana': 'IN', 'iowa': 'IA', 'kansas': 'KS',
-            'kentucky': 'KY', 'louisiana': 'LA', 'maine': 'ME', 'maryland': 'MD',
-            'massachusetts': 'MA', 'michigan': 'MI', 'minnesota': 'MN', 'mississippi': 'MS',
-            'missouri': 'MO', 'montana': 'MT', 'nebraska': 'NE', 'nevada': 'NV',
-            'new hampshire': 'NH', 'new jersey': 'NJ', 'new mexico': 'NM', 'new york': 'NY',
-            'north carolina': 'NC', 'north dakota': 'ND', 'ohio': 'OH', 'oklahoma': 'OK',
-            'oregon': 'OR', 'pennsylvania': 'PA', 'rhode island': 'RI', 'south carolina': 'SC',
-            'south dakota': 'SD', 'tennessee': 'TN', 'texas': 'TX', 'utah': 'UT',
-            'vermont': 'VT', 'virginia': 'VA', 'washington': 'WA', 'west virginia': 'WV',
-            'wisconsin': 'WI', 'wyoming': 'WY'
-        }
-        
-        state_codes = set()
-        
-        # Method 1: Look for two-letter state codes in comma-separated list
-        # Pattern: "USA: AL, AR, AZ, CA, CO, ..." or just "AL, AR, AZ, ..."
-        code_pattern = r'\b([A-Z]{2})\b'
-        codes_found = re.findall(code_pattern, html_content)
-        for code in codes_found:
-            # Verify it's a valid state code
-            if code in state_to_code.values() or code in ['DC']:  # Include DC
-                state_codes.add(code)
-        
-        # Method 2: Look for full state names
-        states_pattern = r'(?:Alabama|Alaska|Arizona|Arkansas|California|Colorado|Connecticut|Delaware|Florida|Georgia|Hawaii|Idaho|Illinois|Indiana|Iowa|Kansas|Kentucky|Louisiana|Maine|Maryland|Massachusetts|Michigan|Minnesota|Mississippi|Missouri|Montana|Nebraska|Nevada|New Hampshire|New Jersey|New Mexico|New York|North Carolina|North Dakota|Ohio|Oklahoma|Oregon|Pennsylvania|Rhode Island|South Carolina|South Dakota|Tennessee|Texas|Utah|Vermont|Virginia|Washington|West Virginia|Wisconsin|Wyoming)'
-        
-        states = re.findall(states_pattern, html_content, re.IGNORECASE)
-        if states:
-            # Convert state names to two-letter codes
-            for state in states:
-                state_lower = state.lower()
-                if state_lower in state_to_code:
-                    state_codes.add(state_to_code[state_lower])
+        self.tokenize(html_content)
+        scan = self.scan(SECTION_DISTRIBUTION)
+        
+        # Method 1: Two-letter state codes, e.g. "USA: AL, AR, AZ, CA, CO, ..."
+        codes_text = self.field('USA', SECTION_DISTRIBUTION) or scan.text
+        state_codes = {code for code in TWO_LETTER_CODE_RE.findall(codes_text) if code in STATE_CODES}
+        
+        # Method 2: Full state names, converted to two-letter codes
+        for state_lower in scan.state_names():
+            if state_lower in STATE_TO_CODE:
+                state_codes.add(STATE_TO_CODE[state_lower])
         
         # Return unique state codes, sorted alphabetically
-        return sorted(list(state_codes)) if state_codes else None
+        return sorted(state_codes) if state_codes else None
     
     def extract_canada_range(self, html_content):
         """Extract Canada province/territory codes."""
-        # Mapping of province names to two-letter codes
-        province_to_code = {
-            'alberta': 'AB', 'british columbia': 'BC', 'manitoba': 'MB',
-            'new brunswick': 'NB', 'newfoundland': 'NL', 'newfoundland and labrador': 'NL',
-            'northwest territories': 'NT', 'nova scotia': 'NS', 'nunavut': 'NU',
-            'ontario': 'ON', 'prince edward island': 'PE', 'quebec': 'QC',
-            'saskatchewan': 'SK', 'yukon': 'YT'
-        }
-        
+        self.tokenize(html_content)
         province_codes = set()
         
-        # Method 1: Look for two-letter province codes in comma-separated list
-        # Pattern: "Canada: NL, ON, QC" or "<strong>Canada:</strong> NL, ON, QC"
-        # Match everything after "Canada" until the next </div> or end of line
-        canada_section = re.search(r'Canada[^>]*>?\s*([A-Z,\s]+?)(?:</div>|$)', html_content, re.IGNORECASE | re.MULTILINE)
-        if canada_section:
-            code_pattern = r'\b([A-Z]{2})\b'
-            codes_found = re.findall(code_pattern, canada_section.group(1))
-            for code in codes_found:
-                # Verify it's a valid province code
-                if code in province_to_code.values():
-                    province_codes.add(code)
-        
-        # Method 2: Look for full province names
-        provinces_pattern = r'(?:Alberta|British Columbia|Manitoba|New Brunswick|Newfoundland and Labrador|Newfoundland|Northwest Territories|Nova Scotia|Nunavut|Ontario|Prince Edward Island|Quebec|Saskatchewan|Yukon)'
-        
-        provinces = re.findall(provinces_pattern, html_content, re.IGNORECASE)
-        if provinces:
-            # Convert province names to two-letter codes
-            for province in provinces:
-                province_lower = province.lower()
-                if province_lower in province_to_code:
-                    province_codes.add(province_to_code[province_lower])
+        # Method 1: Two-letter province codes, e.g. "Canada: NL, ON, QC"
+        for code in TWO_LETTER_CODE_RE.findall(self.field('Canada', SECTION_DISTRIBUTION) or ''):
+            # Verify it's a valid province code
+            if code in PROVINCE_CODES:
+                province_codes.add(code)
+        
+        # Method 2: Full province names, converted to two-letter codes
+        for province_lower in self.scan(SECTION_DISTRIBUTION).province_names():
+            if province_lower in PROVINCE_TO_CODE:
+                province_codes.add(PROVINCE_TO_CODE[province_lower])
         
         # Return unique province codes, sorted alphabetically
-        return sorted(list(province_codes)) if province_codes else None
+        return sorted(province_codes) if province_codes else None
     
     def extract_wildlife_value(self, html_content):
-        """Extract wildlife and pollinator information."""
+        """Extract wildlife and pollinator information from the Benefit section."""
+        self.tokenize(html_content)
+        scan = self.scan(SECTION_BENEFIT)
+        keywords = scan.keywords
         wildlife_data = {}
         
         # Pollinators
-        pollinators = []
-        if re.search(r'\bbees?\b', html_content, re.IGNORECASE):
-            pollinators.append('bees')
-        if re.search(r'\bbutterfl(?:y|ies)\b', html_content, re.IGNORECASE):
-            pollinators.append('butterflies')
-        if re.search(r'\bhummingbirds?\b', html_content, re.IGNORECASE):
-            pollinators.append('hummingbirds')
-        if re.search(r'\bmoths?\b', html_content, re.IGNORECASE):
-            pollinators.append('moths')
+        pollinators = [name for name in ('bees', 'butterflies', 'hummingbirds', 'moths') if name in keywords]
         
         if pollinators:
             wildlife_data['pollinators'] = pollinators
         
         # Host plant information
         host_for = []
-        monarch_match = re.search(r'monarch', html_content, re.IGNORECASE)
-        if monarch_match:
+        if 'monarch' in keywords:
             host_for.append('Monarch Butterfly')
         
         if host_for:
@@ -628,7 +1062,7 @@ class PlantDataParser(HTMLParser):
         
         # Food source
         food_for = []
-        if re.search(r'\bbirds?\b.*\b(?:eat|food|seed)', html_content, re.IGNORECASE):
+        if followed_on_line(scan.text, BIRD_WORD_RE, BIRD_FOOD_WORD_RE):
             food_for.append('birds')
         
         if food_for:
@@ -646,44 +1080,28 @@ class PlantDataParser(HTMLParser):
         Returns: (plant_data dict, raw_html snippet)
         """
         data = {}
+        self.tokenize(html_content)
         
         # Basic Identification
         # Try multiple patterns for scientific name
-        sci_name = self.extract_text(html_content, r'<h1[^>]*>([^<]+(?:L\.|Mill\.|DC\.|Nutt\.|Torr\.|Gray)?)</h1>')
-        if not sci_name:
-            sci_name = self.extract_text(html_content, r'<[^>]*(?:scientific[- ]?name|binomial)[^>]*>([^<]+)')
+        sci_name = self.heading('h1') or self.class_text(SCI_NAME_CLASS_RE)
         if sci_name:
-            # Clean up scientific name (remove extra whitespace, trailing periods)
-            sci_name = re.sub(r'\s+', ' ', sci_name).strip()
             data['scientificName'] = sci_name
         
         # Try multiple patterns for common name
-        common_name = self.extract_text(html_content, r'<h2[^>]*>([^<]+)</h2>')
-        if not common_name:
-            common_name = self.extract_text(html_content, r'<[^>]*common[- ]?name[^>]*>([^<]+)')
+        common_name = self.heading('h2') or self.class_text(COMMON_NAME_CLASS_RE)
         if common_name:
-            # Clean up common name
-            common_name = re.sub(r'\s+', ' ', common_name).strip()
             data['commonName'] = common_name
         
-        # Try multiple patterns for family
-        family = self.extract_text(html_content, r'<[^>]*(?:plant-)?family[^>]*>\s*<strong>([^<]+)</strong>')
-        if not family:
-            family = self.extract_text(html_content, r'<[^>]*family[^>]*>([^<]+)')
+        # Family, e.g. <div class="plant-family"><strong>Asteraceae (...)</strong></div>
+        family = self.class_text(FAMILY_CLASS_RE)
         if family:
-            # Clean up family name
-            family = re.sub(r'\s+', ' ', family).strip()
-            data['family'] = family
-        
-        # Description - look for paragraph tags or description divs
-        description = self.extract_text(html_content, r'<p[^>]*>([^<]+(?:<[^>]+>[^<]+)*)</p>')
-        if not description:
-            description = self.extract_text(html_content, r'<[^>]*description[^>]*>([^<]+)')
+            data['family'] = WHITESPACE_RE.sub(' ', family)
+        
+        # Description - first paragraph or description element
+        description = self.paragraphs[0] if self.paragraphs else self.class_text(DESCRIPTION_CLASS_RE)
         if description:
-            # Clean up description (remove HTML tags, normalize whitespace)
-            description = re.sub(r'<[^>]+>', '', description)
-            description = re.sub(r'\s+', ' ', description).strip()
-            data['description'] = description
+            data['description'] = WHITESPACE_RE.sub(' ', description)
         
         # Physical Characteristics
         characteristics = {}
@@ -696,51 +1114,34 @@ class PlantDataParser(HTMLParser):
         if spread:
             characteristics['spread'] = spread
         
-        bloom_colors_raw = self.extract_list(html_content, r'<[^>]*bloom[- ]?color[^>]*>([^<]+)')
-        if not bloom_colors_raw:
-            # Try with <strong> tag pattern
-            bloom_colors_text = self.extract_text(html_content, r'<strong>Bloom Color:</strong>\s*([^<]+)')
-            if bloom_colors_text:
-                bloom_colors_raw = [bloom_colors_text]
-        if bloom_colors_raw:
-            # Clean up extracted colors by removing label text
-            bloom_colors = []
-            for color in bloom_colors_raw:
-                # Remove common prefixes like "Bloom Color:"
-                cleaned = re.sub(r'^bloom\s*color\s*:\s*', '', color, flags=re.IGNORECASE).strip()
-                if cleaned:
-                    # Split by comma to handle multiple colors
-                    colors_list = [c.strip() for c in cleaned.split(',')]
-                    bloom_colors.extend(colors_list)
+        bloom_color_text = (self.class_text(BLOOM_COLOR_CLASS_RE)
+                            or self.field('Bloom Color', SECTION_BLOOM))
+        if bloom_color_text:
+            # Remove label text like "Bloom Color:" and split "Orange, Yellow"
+            bloom_colors = split_list(BLOOM_COLOR_LABEL_RE.sub('', bloom_color_text))
             if bloom_colors:
                 characteristics['bloomColor'] = bloom_colors
         
-        bloom_time_raw = self.extract_list(html_content, r'<[^>]*bloom[- ]?time[^>]*>([^<]+)')
-        if not bloom_time_raw:
-            # Try with <strong> tag pattern
-            bloom_time_text = self.extract_text(html_content, r'<strong>Bloom Time:</strong>\s*([^<]+)')
-            if bloom_time_text:
-                bloom_time_raw = [bloom_time_text]
-        if bloom_time_raw:
-            # Clean up extracted bloom times by removing label text
-            bloom_time = []
-            for time in bloom_time_raw:
-                # Remove common prefixes like "Bloom Time:"
-                cleaned = re.sub(r'^bloom\s*time\s*:\s*', '', time, flags=re.IGNORECASE).strip()
-                if cleaned:
-                    # Split by comma to handle "May, Jun, Jul, Aug, Sep" format
-                    months_or_seasons = [t.strip() for t in cleaned.split(',')]
-                    bloom_time.extend(months_or_seasons)
+        bloom_time_text = (self.class_text(BLOOM_TIME_CLASS_RE)
+                           or self.field('Bloom Time', SECTION_BLOOM))
+        if bloom_time_text:
+            # Remove label text like "Bloom Time:" and split "May, Jun, Jul, Aug, Sep"
+            bloom_time = split_list(BLOOM_TIME_LABEL_RE.sub('', bloom_time_text))
             if bloom_time:
                 characteristics['bloomPeriod'] = bloom_time
         
-        # Look for lifespan (annual/perennial/biennial)
-        if re.search(r'\bperennial\b', html_content, re.IGNORECASE):
-            characteristics['lifespan'] = 'perennial'
-        elif re.search(r'\bannual\b', html_content, re.IGNORECASE):
-            characteristics['lifespan'] = 'annual'
-        elif re.search(r'\bbiennial\b', html_content, re.IGNORECASE):
-            characteristics['lifespan'] = 'biennial'
+        # Lifespan from "Duration: Perennial", else annual/perennial/biennial in the section
+        duration_words = set(WORD_RE.findall((self.field('Duration', SECTION_CHARACTERISTICS) or '').lower()))
+        keywords = self.scan(SECTION_CHARACTERISTICS).keywords
+        for lifespan in LIFESPAN_VALUES:
+            if lifespan in duration_words:
+                characteristics['lifespan'] = lifespan
+                break
+        else:
+            for lifespan in LIFESPAN_VALUES:
+                if lifespan in keywords:
+                    characteristics['lifespan'] = lifespan
+                    break
         
         if characteristics:
             data['characteristics'] = characteristics
@@ -789,17 +1190,14 @@ class PlantDataParser(HTMLParser):
             data['ecology'] = ecology
         
         # Look for landscape use keywords
-        landscape_uses = []
-        if re.search(r'pollinator\s+garden', html_content, re.IGNORECASE):
-            landscape_uses.append('pollinator garden')
-        if re.search(r'rain\s+garden', html_content, re.IGNORECASE):
-            landscape_uses.append('rain garden')
-        if re.search(r'xeriscape|xeriscaping', html_content, re.IGNORECASE):
-            landscape_uses.append('xeriscaping')
-        if re.search(r'native\s+garden', html_content, re.IGNORECASE):
-            landscape_uses.append('native garden')
-        if re.search(r'woodland\s+garden', html_content, re.IGNORECASE):
-            landscape_uses.append('woodland garden')
+        keywords = self.scan(SECTION_BENEFIT).keywords
+        landscape_uses = [use for key, use in (
+            ('pollinator_garden', 'pollinator garden'),
+            ('rain_garden', 'rain garden'),
+            ('xeriscaping', 'xeriscaping'),
+            ('native_garden', 'native garden'),
+            ('woodland_garden', 'woodland garden'),
+        ) if key in keywords]
         
         if landscape_uses:
             if 'ecology' not in data:
@@ -826,18 +1224,54 @@ def log_message(message, log_path):
     print(log_entry.strip())
 
 
-# Global URL opener with cookie support for maintaining sessions
-_url_opener = None
+# Keep-alive transport with cookie support for maintaining sessions
+_session_transport = None
 
-def get_url_opener():
-    """Get or create a URL opener with cookie support for session management."""
-    global _url_opener
-    if _url_opener is None:
+def get_session_transport():
+    """Get or create a pooled HTTP transport with cookie support for session management."""
+    global _session_transport
+    if _session_transport is None:
         # Create cookie jar to maintain session
         cookie_jar = http.cookiejar.CookieJar()
-        cookie_processor = HTTPCookieProcessor(cookie_jar)
-        _url_opener = build_opener(cookie_processor)
-    return _url_opener
+        # Unchanged pages are revalidated against the on-disk cache instead of re-downloaded
+        _session_transport = HTTPTransport(timeout=TIMEOUT, cookie_jar=cookie_jar,
+                                           cache=get_http_cache())
+    return _session_transport
+
+
+# Comprehensive browser-like headers to avoid bot detection
+DEFAULT_REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': ACCEPT_ENCODING,
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Cache-Control': 'max-age=0',
+    'DNT': '1'
+}
+
+
+# Headers for collection pages after the first, which a browser reaches from the site
+COLLECTION_PAGE_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': ACCEPT_ENCODING,
+    'Connection': 'keep-alive',
+    'Referer': 'https://www.wildflower.org/',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'same-origin',
+    'Sec-Fetch-User': '?1',
+    'Cache-Control': 'max-age=0',
+    'DNT': '1'
+}
 
 
 def make_request(url, headers=None, use_session=True, retries=3, backoff_factor=2):
@@ -854,82 +1288,64 @@ def make_request(url, headers=None, use_session=True, retries=3, backoff_factor=
     Returns:
         Tuple of (content, status_code) where content is None on error
     """
-    import time
+    if headers is None:
+        headers = DEFAULT_REQUEST_HEADERS
+    
+    # Session requests keep cookies; others go through the shared transport.
+    # Both reuse keep-alive connections and decode compressed bodies.
+    transport = get_session_transport() if use_session else None
+    
+    return shared_make_request(url, headers=headers, retries=retries,
+                               backoff_factor=backoff_factor, timeout=TIMEOUT,
+                               transport=transport)
+
+
+def fetch_page_response(url, headers=None, use_session=True, retries=3, backoff_factor=2):
+    """
+    Like make_request, but return the whole response (for its headers).
     
+    Returns:
+        Tuple of (response, status_code) where response is None on error
+    """
     if headers is None:
-        # Use comprehensive browser-like headers to avoid bot detection
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Sec-Fetch-User': '?1',
-            'Cache-Control': 'max-age=0',
-            'DNT': '1'
-        }
-    
-    last_error = None
-    last_status = 0
-    
-    for attempt in range(retries):
-        try:
-            request = Request(url, headers=headers)
-            
-            if use_session:
-                # Use opener with cookie support for session management
-                opener = get_url_opener()
-                response = opener.open(request, timeout=TIMEOUT)
-            else:
-                # Use basic urlopen without session
-                response = urlopen(request, timeout=TIMEOUT)
-            
-            # Read and decode content
-            content = response.read()
-            
-            # Handle gzip/deflate encoding if present
-            if response.info().get('Content-Encoding') == 'gzip':
-                import gzip
-                import io
-                content = gzip.decompress(content)
-            elif response.info().get('Content-Encoding') == 'deflate':
-                import zlib
-                content = zlib.decompress(content)
-            
-            # Decode to string
-            decoded_content = content.decode('utf-8', errors='ignore')
-            
-            return decoded_content, response.status
-            
-        except HTTPError as e:
-            last_error = e
-            last_status = e.code
-            # Don't retry on 403 (Forbidden) or 404 (Not Found) - these won't change
-            if e.code in [403, 404]:
-                break
-            # Retry on other errors with exponential backoff
-            if attempt < retries - 1:
-                delay = backoff_factor ** attempt
-                print(f"  ⚠ HTTP Error {e.code}, retrying in {delay} seconds... (attempt {attempt + 1}/{retries})")
-                time.sleep(delay)
-        except (URLError, socket.timeout) as e:
-            last_error = e
-            last_status = 0
-            # Retry on network errors with exponential backoff
-            if attempt < retries - 1:
-                delay = backoff_factor ** attempt
-                print(f"  ⚠ Network error, retrying in {delay} seconds... (attempt {attempt + 1}/{retries})")
-                time.sleep(delay)
-        except Exception as e:
-            print(f"  Unexpected error in make_request: {type(e).__name__}: {str(e)}")
-            return None, 0
+        headers = DEFAULT_REQUEST_HEADERS
+    
+    transport = get_session_transport() if use_session else None
+    
+    return shared_fetch_response(url, headers=headers, retries=retries,
+                                 backoff_factor=backoff_factor, timeout=TIMEOUT,
+                                 transport=transport)
+
+
+def stream_request(url, make_parser, headers=None, use_session=True, retries=3, backoff_factor=2):
+    """
+    Like make_request, but feed the page to a parser while it downloads.
+    
+    The body is decompressed incrementally and never held in memory as a whole
+    (unless the HTTP cache keeps a copy). Each retry gets a fresh parser.
+    
+    Args:
+        url: The URL to request
+        make_parser: Callable returning a new parser (anything with feed/close)
+        headers: Optional custom headers dict (default: make_request's browser headers)
+        use_session: Whether to use session/cookie management (default: True)
+        retries: Number of retries on failure (default: 3)
+        backoff_factor: Multiplier for exponential backoff delay (default: 2)
+    
+    Returns:
+        Tuple of (parser, status_code) where parser is None on error
+    """
+    if headers is None:
+        headers = DEFAULT_REQUEST_HEADERS
     
-    # All retries failed
-    return None, last_status
+    transport = get_session_transport() if use_session else None
+    
+    parser, status_code = shared_stream_request(url, make_parser, headers=headers, retries=retries,
+                                                backoff_factor=backoff_factor, timeout=TIMEOUT,
+                                                transport=transport)
+    if parser is not None:
+        parser.close()
+    return parser, status_code
 
 
 def extract_plant_id(url):
@@ -952,8 +1368,14 @@ def extract_plant_id(url):
     return hashlib.md5(url.encode()).hexdigest()[:8]
 
 
-def save_plant_data(plant_id, plant_url, plant_data_tuple, log_path):
-    """Save plant data as JSON file in source control."""
+def save_plant_data(plant_id, plant_url, plant_data_tuple, log_path, archive_key=None):
+    """
+    Save plant data as JSON file in source control.
+    
+    The full page is kept in the page archive (page_archive.py) and the JSON
+    records its archive_key; the raw_html snippet is only stored for pages
+    that could not be archived.
+    """
     filename = f"{plant_id}.json"
     filepath = os.path.join(OUTPUT_DIR, filename)
     
@@ -965,9 +1387,12 @@ def save_plant_data(plant_id, plant_url, plant_data_tuple, log_path):
         'source_url': plant_url,
         'scraped_at': datetime.now().isoformat(),
         'scraper_version': SCRAPER_VERSION,
-        'raw_html': raw_html,
-        'plant_data': plant_data
     }
+    if archive_key:
+        full_data['archive_key'] = archive_key
+    else:
+        full_data['raw_html'] = raw_html
+    full_data['plant_data'] = plant_data
     
     with open(filepath, 'w', encoding='utf-8') as f:
         json.dump(full_data, f, indent=2, ensure_ascii=False)
@@ -976,10 +1401,69 @@ def save_plant_data(plant_id, plant_url, plant_data_tuple, log_path):
     return filepath
 
 
+# Crawl ledger for the current run, opened by main()
+CRAWL_LEDGER = None
+
+
+def collection_page_url(start_index):
+    """URL of the collection page starting at a result offset."""
+    return f"https://www.wildflower.org/collections/collection.php?start={start_index}&collection={COLLECTION_NAME}&pagecount={PAGECOUNT}"
+
+
+def fetch_collection_page(start_index):
+    """
+    Fetch one collection page and extract its plant links.
+    
+    A page already fetched in the current crawl (see CRAWL_LEDGER) is read
+    from the ledger instead. Safe to call from several threads; the shared
+    transport applies the per-host rate and concurrency limits.
+    
+    Returns: (plant_links: list or None on failure, total_results: int or None, status_code)
+    """
+    page_number = start_index // PAGECOUNT + 1
+    if CRAWL_LEDGER is not None and CRAWL_LEDGER.page_done(start_index):
+        plant_links = CRAWL_LEDGER.page_links(start_index)
+        print(f"  ✓ Page {page_number} already fetched in this crawl ({len(plant_links)} plant links)")
+        return plant_links, CRAWL_LEDGER.total_results(), None
+    
+    current_url = collection_page_url(start_index)
+    print(f"  Fetching page {page_number}: {current_url}")
+    
+    # Add referer header for subsequent pages to appear more browser-like
+    headers = COLLECTION_PAGE_HEADERS if start_index > 0 else None
+    
+    try:
+        # The page is parsed while it downloads
+        parser, status_code = stream_request(current_url, PlantLinkParser, headers=headers)
+    except Exception as e:
+        print(f"  ✗ Error fetching page {page_number}: {type(e).__name__}: {str(e)}")
+        parser, status_code = None, None
+    
+    if parser is None:
+        print(f"  ✗ Failed to fetch page {page_number} (Status: {status_code})")
+        if CRAWL_LEDGER is not None:
+            CRAWL_LEDGER.record_page_failure(start_index, f"HTTP {status_code}")
+        return None, None, status_code
+    
+    print(f"  ✓ Page {page_number}: HTTP {status_code}, {parser.chars_fed} characters, "
+          f"{len(parser.plant_links)} plant links")
+    if CRAWL_LEDGER is not None:
+        CRAWL_LEDGER.record_page(start_index, parser.plant_links)
+        if start_index == 0 and parser.total_results:
+            CRAWL_LEDGER.set_total_results(parser.total_results)
+    return parser.plant_links, parser.total_results, status_code
+
+
 def fetch_wildflower_collection():
     """
     Fetch the plant collection pages (handling pagination) and extract plant links.
-    Uses manual pagination with start/pagecount parameters to fetch all pages.
+    
+    The first page gives the total number of results, from which every other
+    start= offset is known; those pages are then fetched concurrently
+    (COLLECTION_FETCH_WORKERS, within the per-host rate and concurrency
+    limits). Without a total, pages are walked one by one until a page adds
+    no new links. Links are merged in page order without duplicates.
+    
     Returns: (success: bool, plant_links: list, message: str)
     """
     try:
@@ -994,6 +1478,8 @@ def fetch_wildflower_collection():
             # Extract total results from mock data
             total_results = parser.extract_total_results(MOCK_COLLECTION_HTML)
             plant_links = parser.plant_links
+            if CRAWL_LEDGER is not None and not CRAWL_LEDGER.page_done(0):
+                CRAWL_LEDGER.record_page(0, plant_links)
             
             print(f"✓ Mock data loaded")
             print(f"✓ Found {len(plant_links)} plant links in test data")
@@ -1008,102 +1494,64 @@ def fetch_wildflower_collection():
         print(f"Attempting to fetch collection pages from: {TARGET_URL}")
         print(f"Configuration: pagecount={PAGECOUNT}, collection={COLLECTION_NAME}")
         
-        # Add a small initial delay to be polite to the server
-        import time
-        time.sleep(1)
+        # The first page gives the total number of results
+        first_links, total_results, status_code = fetch_collection_page(0)
+        if first_links is None:
+            # If we can't fetch the first page, abort
+            error_msg = f"Failed to fetch first page (Status: {status_code})"
+            if status_code == 403:
+                error_msg += "\n  This website may be blocking automated requests."
+                error_msg += "\n  Possible solutions:"
+                error_msg += "\n  1. Run with --test flag to use mock data"
+                error_msg += "\n  2. Try again later (the site may have rate limiting)"
+                error_msg += "\n  3. Check if the website requires API access or has changed their policies"
+            return False, [], error_msg
+        
+        page_links = {0: first_links}  # start offset -> plant links
+        failed_pages = []
         
-        all_plant_links = []
-        page_count = 0
-        start_index = 0
-        total_results = None
-        
-        # Fetch pages until we've retrieved all results
-        while True:
-            page_count += 1
-            
-            # Construct URL with current start index
-            current_url = f"https://www.wildflower.org/collections/collection.php?start={start_index}&collection={COLLECTION_NAME}&pagecount={PAGECOUNT}"
-            
-            print(f"\n  Fetching page {page_count}: {current_url}")
-            print(f"  (Results {start_index + 1} - {start_index + PAGECOUNT})")
-            
-            # Add referer header for subsequent pages to appear more browser-like
-            headers = None
-            if page_count > 1:
-                # For subsequent pages, add a referer header
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.9',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'Connection': 'keep-alive',
-                    'Referer': 'https://www.wildflower.org/',
-                    'Upgrade-Insecure-Requests': '1',
-                    'Sec-Fetch-Dest': 'document',
-                    'Sec-Fetch-Mode': 'navigate',
-                    'Sec-Fetch-Site': 'same-origin',
-                    'Sec-Fetch-User': '?1',
-                    'Cache-Control': 'max-age=0',
-                    'DNT': '1'
-                }
-            
-            content, status_code = make_request(current_url, headers=headers)
+        if total_results:
+            total_pages = (total_results + PAGECOUNT - 1) // PAGECOUNT
+            print(f"  ✓ Total results available: {total_results}")
+            print(f"  ✓ Fetching the remaining {total_pages - 1} page(s) concurrently")
             
-            if content is None:
-                print(f"  ✗ Failed to fetch page (Status: {status_code})")
-                if page_count == 1:
-                    # If we can't fetch the first page, abort
-                    error_msg = f"Failed to fetch first page (Status: {status_code})"
-                    if status_code == 403:
-                        error_msg += "\n  This website may be blocking automated requests."
-                        error_msg += "\n  Possible solutions:"
-                        error_msg += "\n  1. Run with --test flag to use mock data"
-                        error_msg += "\n  2. Try again later (the site may have rate limiting)"
-                        error_msg += "\n  3. Check if the website requires API access or has changed their policies"
-                    return False, [], error_msg
-                else:
-                    # If we've fetched at least one page, continue with what we have
-                    print(f"  ⚠ Stopping pagination after {page_count - 1} successful page(s)")
+            offsets = list(range(PAGECOUNT, total_results, PAGECOUNT))
+            with ThreadPoolExecutor(max_workers=COLLECTION_FETCH_WORKERS) as executor:
+                for start_index, (links, _, _) in zip(offsets, executor.map(fetch_collection_page, offsets)):
+                    if links is None:
+                        failed_pages.append(start_index)
+                    else:
+                        page_links[start_index] = links
+        else:
+            # No total on the first page: walk pages until one adds no new plants
+            seen = set(first_links)
+            start_index = 0
+            while True:
+                start_index += PAGECOUNT
+                links, _, _ = fetch_collection_page(start_index)
+                if links is None:
+                    failed_pages.append(start_index)
                     break
-            
-            print(f"  ✓ HTTP Status Code: {status_code}")
-            print(f"  ✓ Content length: {len(content)} characters")
-            
-            # Parse HTML to extract plant links
-            parser = PlantLinkParser()
-            parser.feed(content)
-            
-            # Extract total results from first page
-            if total_results is None:
-                total_results = parser.extract_total_results(content)
-                if total_results:
-                    print(f"  ✓ Total results available: {total_results}")
-                    total_pages = (total_results + PAGECOUNT - 1) // PAGECOUNT
-                    print(f"  ✓ Will fetch {total_pages} page(s) to retrieve all results")
-            
-            # Add plant links from this page
-            new_plants = [link for link in parser.plant_links if link not in all_plant_links]
-            all_plant_links.extend(new_plants)
-            print(f"  ✓ Found {len(new_plants)} new plant links on this page (total so far: {len(all_plant_links)})")
-            
-            # Check if we should continue pagination
-            if len(new_plants) == 0:
-                print(f"  ✓ No more new plants found, stopping pagination")
-                break
-            
-            # If we know the total, check if we've fetched everything
-            if total_results and len(all_plant_links) >= total_results:
-                print(f"  ✓ Fetched all {total_results} results, stopping pagination")
-                break
-            
-            # Move to next page
-            start_index += PAGECOUNT
-            
-            # Be nice to the server - add a delay between pages (2 seconds to appear more human-like)
-            import time
-            print(f"  Waiting 2 seconds before next request...")
-            time.sleep(2)
+                new_links = [link for link in links if link not in seen]
+                if not new_links:
+                    print(f"  ✓ No more new plants found, stopping pagination")
+                    break
+                seen.update(new_links)
+                page_links[start_index] = links
         
+        # Merge links in page order, keeping each link's first occurrence
+        all_plant_links = []
+        seen = set()
+        for start_index in sorted(page_links):
+            for link in page_links[start_index]:
+                if link not in seen:
+                    seen.add(link)
+                    all_plant_links.append(link)
+        page_count = len(page_links)
+        
+        if failed_pages:
+            print(f"\n⚠ {len(failed_pages)} collection page(s) failed (offsets {', '.join(map(str, failed_pages))}); "
+                  f"continuing with the pages that were fetched")
         print(f"\n✓ Fetched {page_count} collection page(s)")
         print(f"✓ Found {len(all_plant_links)} total plant links")
         if total_results:
@@ -1117,11 +1565,104 @@ def fetch_wildflower_collection():
         return False, [], error_msg
 
 
-def fetch_plant_detail(plant_url, log_path):
+def absolute_plant_url(plant_url):
+    """Plant URLs from the collection page may be relative to BASE_URL."""
+    if plant_url.startswith('http'):
+        return plant_url
+    return BASE_URL + ('/' if not plant_url.startswith('/') else '') + plant_url
+
+
+def archive_page(plant_url, content):
     """
-    Fetch an individual plant detail page and extract data.
-    Returns: (success: bool, plant_data: dict)
+    Keep the full page in the page archive.
+    
+    Returns:
+        Archive key, or None if the page could not be archived
+    """
+    try:
+        return get_page_archive(PAGE_ARCHIVE_ROOT).put(absolute_plant_url(plant_url), content)
+    except OSError as e:
+        print(f"  ⚠ Could not archive page: {e}")
+        return None
+
+
+# Why a plant page is requested this run, in the order the page budget is spent
+REFRESH_NEW = 'new'  # Never fetched, or its saved record is missing
+REFRESH_STALE = 'stale'  # Last fetched REFRESH_AFTER_DAYS or more ago
+REFRESH_CHECK = 'check'  # Conditional request; processed only if the page changed
+REFRESH_ORDER = (REFRESH_NEW, REFRESH_STALE, REFRESH_CHECK)
+
+
+def refresh_reason(plant_url, seen, now=None):
+    """
+    Apply the refresh policy to one plant page.
+    
+    Args:
+        plant_url: Plant page URL from the collection
+        seen: Freshness of its last fetch (CrawlLedger.freshness), or None
+        now: Current time (default: now)
+    
+    Returns:
+        REFRESH_NEW, REFRESH_STALE or REFRESH_CHECK, or None if the page was
+        fetched recently and has no validators to check it with
+    """
+    saved_path = os.path.join(OUTPUT_DIR, f"{extract_plant_id(plant_url)}.json")
+    if seen is None or not os.path.exists(saved_path):
+        return REFRESH_NEW
+    now = now or datetime.now()
+    if now - datetime.fromisoformat(seen['fetched_at']) >= timedelta(days=REFRESH_AFTER_DAYS):
+        return REFRESH_STALE
+    if seen['etag'] or seen['last_modified']:
+        return REFRESH_CHECK
+    return None
+
+
+def plan_refresh(plant_links):
+    """
+    Decide which plant pages to request this run.
+    
+    Requested pages are ordered new, then stale, then checks (page order
+    within each), and cut off at MAX_PAGES_PER_RUN.
+    
+    Returns:
+        Tuple of (planned, fresh, deferred): planned is a list of
+        (plant_url, reason, seen) to request now, fresh the plant links that
+        need no request, deferred the plant links left for a later run
     """
+    now = datetime.now()
+    planned = []
+    fresh = []
+    for plant_url in plant_links:
+        seen = CRAWL_LEDGER.freshness(absolute_plant_url(plant_url)) if CRAWL_LEDGER is not None else None
+        reason = refresh_reason(plant_url, seen, now)
+        if reason is None:
+            fresh.append(plant_url)
+        else:
+            planned.append((plant_url, reason, seen))
+    
+    planned.sort(key=lambda plan: REFRESH_ORDER.index(plan[1]))
+    deferred = []
+    if MAX_PAGES_PER_RUN and len(planned) > MAX_PAGES_PER_RUN:
+        deferred = [plant_url for plant_url, _, _ in planned[MAX_PAGES_PER_RUN:]]
+        planned = planned[:MAX_PAGES_PER_RUN]
+    return planned, fresh, deferred
+
+
+def fetch_plant_page(plant_url, seen=None):
+    """
+    Fetch an individual plant detail page.
+    
+    Args:
+        plant_url: Plant page URL (may be relative to BASE_URL)
+        seen: Freshness of the last fetch (CrawlLedger.freshness); its
+            validators make the request conditional
+    
+    Returns:
+        Tuple of (content, validators): content is the HTML, '' if the server
+        answered 304 Not Modified, or None on failure; validators is a dict
+        with the response's etag and last_modified (None when absent)
+    """
+    validators = {'etag': None, 'last_modified': None}
     try:
         if USE_TEST_MODE:
             # Extract plant ID from URL for mock data lookup
@@ -1131,90 +1672,498 @@ def fetch_plant_detail(plant_url, log_path):
             
             # Get mock HTML for this plant
             if plant_id in MOCK_PLANT_DETAILS:
-                content = MOCK_PLANT_DETAILS[plant_id]
-            else:
-                # Default mock data for unknown plants
-                content = f"""
+                return MOCK_PLANT_DETAILS[plant_id], validators
+            # Default mock data for unknown plants
+            return f"""
                 <html><body>
                 <h1 class="scientific-name">Unknown Plant {plant_id}</h1>
                 <h2 class="common-name">Test Plant</h2>
                 <div class="description">Mock plant data for testing.</div>
                 </body></html>
-                """
-            
-            # Parse plant data from HTML
-            parser = PlantDataParser()
-            plant_data, raw_html = parser.extract_plant_info(content)
-            
-            print(f"  ✓ Successfully loaded test plant data")
-            return True, (plant_data, raw_html)
+                """, validators
         
         # Real mode - fetch from website
         # Ensure URL is absolute
-        if not plant_url.startswith('http'):
-            plant_url = BASE_URL + ('/' if not plant_url.startswith('/') else '') + plant_url
+        plant_url = absolute_plant_url(plant_url)
         
         print(f"  Fetching plant: {plant_url}")
         
-        content, status_code = make_request(plant_url)
+        headers = DEFAULT_REQUEST_HEADERS
+        # Our own validators make the transport skip the HTTP cache, so the
+        # site itself answers (304 Not Modified when the page did not change)
+        if seen is not None and (seen['etag'] or seen['last_modified']):
+            headers = dict(headers)
+            if seen['etag']:
+                headers['If-None-Match'] = seen['etag']
+            if seen['last_modified']:
+                headers['If-Modified-Since'] = seen['last_modified']
         
-        if content is None:
-            print(f"  ✗ Failed to fetch plant (Status: {status_code})")
-            return False, None
+        response, status_code = fetch_page_response(plant_url, headers=headers)
         
-        # Parse plant data from HTML
-        parser = PlantDataParser()
-        plant_data, raw_html = parser.extract_plant_info(content)
-        
-        print(f"  ✓ Successfully fetched plant data")
+        if response is None:
+            print(f"  ✗ Failed to fetch plant (Status: {status_code})")
+            return None, validators
         
-        return True, (plant_data, raw_html)
+        validators['etag'] = response.headers.get('ETag')
+        validators['last_modified'] = response.headers.get('Last-Modified')
+        if status_code == 304:
+            return '', validators
+        return response.text(), validators
         
     except Exception as e:
         print(f"  ✗ Error fetching plant: {type(e).__name__}: {str(e)}")
+        return None, validators
+
+
+class ParseBudgetExceeded(Exception):
+    """Parsing a page used more than PARSE_CPU_BUDGET seconds of CPU time."""
+
+
+def _parse_budget_exceeded(signum, frame):
+    raise ParseBudgetExceeded(f"parsing used more than {PARSE_CPU_BUDGET:g} CPU seconds")
+
+
+def parse_plant_page(content):
+    """
+    Extract plant data from a plant detail page.
+    
+    Module-level so it can run in a parser worker process. In a worker,
+    parsing is abandoned once it has used PARSE_CPU_BUDGET seconds of CPU
+    time (measured with a virtual interval timer where the platform has one),
+    so one malformed page cannot stall the crawl. The interval timer counts
+    the CPU time of the whole process, so in-process parsing (no worker
+    processes, or no timer) instead measures this thread's CPU time and
+    rejects the page once it is parsed; it cannot cut a slow parse short.
+    
+    Returns: (plant_data dict, raw_html snippet)
+    
+    Raises:
+        ParseBudgetExceeded if the page used up the CPU budget
+    """
+    if not PARSE_CPU_BUDGET:
+        return PlantDataParser().extract_plant_info(content)
+    if (multiprocessing.parent_process() is None or not hasattr(signal, 'setitimer')
+            or threading.current_thread() is not threading.main_thread()):
+        # Not a parser worker: the fetcher and writer threads share this process's CPU time
+        start = time.thread_time()
+        result = PlantDataParser().extract_plant_info(content)
+        if time.thread_time() - start > PARSE_CPU_BUDGET:
+            raise ParseBudgetExceeded(f"parsing used more than {PARSE_CPU_BUDGET:g} CPU seconds")
+        return result
+    
+    previous_handler = signal.signal(signal.SIGVTALRM, _parse_budget_exceeded)
+    signal.setitimer(signal.ITIMER_VIRTUAL, PARSE_CPU_BUDGET)
+    try:
+        return PlantDataParser().extract_plant_info(content)
+    finally:
+        signal.setitimer(signal.ITIMER_VIRTUAL, 0)
+        signal.signal(signal.SIGVTALRM, previous_handler)
+
+
+def fetch_plant_detail(plant_url, log_path):
+    """
+    Fetch an individual plant detail page and extract data.
+    Returns: (success: bool, plant_data: dict)
+    """
+    content, _ = fetch_plant_page(plant_url)
+    if not content:
+        return False, None
+    
+    try:
+        plant_data = parse_plant_page(content)
+    except Exception as e:
+        print(f"  ✗ Error parsing plant: {type(e).__name__}: {str(e)}")
         return False, None
+    
+    print(f"  ✓ Successfully fetched plant data")
+    return True, plant_data
+
+
+def _put(work_queue, item, stop):
+    """Put an item on a bounded queue, giving up if the pipeline is stopping."""
+    while not stop.is_set():
+        try:
+            work_queue.put(item, timeout=0.5)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def iter_parsed_pages(pages, workers=None):
+    """
+    Parse plant pages in a pool of worker processes.
+    
+    At most PIPELINE_QUEUE_SIZE pages are being parsed at once, so a slow
+    consumer holds back `pages` instead of piling up parsed results. Results
+    come back in input order.
+    
+    Args:
+        pages: Iterable of (key, html_content) pairs; html_content None marks a failed fetch
+        workers: Parser processes (default PARSE_WORKERS); 0 parses in this process
+    
+    Yields:
+        Tuples of (key, (plant_data, raw_html), error): parsed is None if
+        fetching or parsing failed, and error then describes a parsing
+        failure (None for a failed fetch)
+    """
+    workers = PARSE_WORKERS if workers is None else workers
+    executor = None
+    if workers > 0:
+        try:
+            # Never fork: process_plants starts the parser pool while its fetcher and writer
+            # threads run, and a forked child can inherit a lock one of them holds
+            start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+            executor = ProcessPoolExecutor(max_workers=workers,
+                                           mp_context=multiprocessing.get_context(start_method))
+        except (OSError, NotImplementedError) as e:
+            print(f"  ⚠ Parser processes unavailable ({e}), parsing in-process")
+    
+    def result(key, job):
+        if job is None:
+            return key, None, None
+        try:
+            return key, job.result() if executor is not None else parse_plant_page(job), None
+        except Exception as e:
+            print(f"  ✗ Error parsing plant: {type(e).__name__}: {str(e)}")
+            return key, None, f"{type(e).__name__}: {e}"
+    
+    pending = deque()
+    try:
+        for key, content in pages:
+            if content is None:
+                job = None
+            elif executor is not None:
+                job = executor.submit(parse_plant_page, content)
+            else:
+                job = content
+            pending.append((key, job))
+            
+            while len(pending) > PIPELINE_QUEUE_SIZE or (pending and pending[0][1] is None):
+                yield result(*pending.popleft())
+        
+        while pending:
+            yield result(*pending.popleft())
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
 
 
-def process_plants(plant_links, log_path):
-    """Process individual plant pages and save their data."""
+def process_plants(planned, log_path):
+    """
+    Process individual plant pages and save their data.
+    
+    A fetcher thread downloads the pages (paced by the shared rate limiter)
+    and archives them, iter_parsed_pages parses them in worker processes, and
+    a writer thread saves the results. Bounded queues between the stages keep memory use
+    flat and let the next fetch start while earlier pages are parsed.
+    
+    Pages that did not change since their last fetch (304 Not Modified, or
+    the same body hash) skip parsing and keep their saved record.
+    
+    Args:
+        planned: List of (plant_url, reason, seen) from plan_refresh
+        log_path: Log file path
+    
+    Returns:
+        Tuple of (success_count, failure_count, unchanged_count)
+    """
     success_count = 0
     failure_count = 0
+    unchanged_count = 0
     
-    # Process all plants found in the collection
-    plants_to_process = plant_links
+    total = len(planned)
     
-    print(f"\nProcessing {len(plants_to_process)} plants...")
+    print(f"\nProcessing {total} plants...")
     
-    for i, plant_url in enumerate(plants_to_process, 1):
-        print(f"\n[{i}/{len(plants_to_process)}]")
-        
-        # Fetch plant detail page
-        success, plant_data = fetch_plant_detail(plant_url, log_path)
-        
-        if success and plant_data is not None:
-            # Extract plant ID and save data
-            plant_id = extract_plant_id(plant_url)
-            save_plant_data(plant_id, plant_url, plant_data, log_path)
-            success_count += 1
-        else:
-            failure_count += 1
-        
-        # Be nice to the server - add a delay between plant requests (1.5 seconds)
-        import time
-        if i < len(plants_to_process):  # Don't wait after the last plant
-            time.sleep(1.5)
+    done = object()
+    stop = threading.Event()
+    page_queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    write_queue = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+    writer_error = []
+    
+    def fetch_stage():
+        try:
+            for i, (plant_url, reason, seen) in enumerate(planned, 1):
+                print(f"\n[{i}/{total}] ({reason})")
+                content, validators = fetch_plant_page(plant_url, seen if reason == REFRESH_CHECK else None)
+                fetch = None
+                if content is not None:
+                    sha256 = hashlib.sha256(content.encode('utf-8')).hexdigest() if content else None
+                    unchanged = reason != REFRESH_NEW and (sha256 is None or sha256 == seen['sha256'])
+                    fetch = dict(validators, sha256=sha256, unchanged=unchanged)
+                    if unchanged:
+                        print(f"  ✓ Unchanged since last fetch")
+                        content = None
+                key = archive_page(plant_url, content) if content else None
+                if not _put(page_queue, ((plant_url, key, fetch), content), stop):
+                    return
+        finally:
+            _put(page_queue, done, stop)
+    
+    def queued_pages():
+        while True:
+            try:
+                item = page_queue.get(timeout=0.5)
+            except queue.Empty:
+                if stop.is_set():
+                    return
+                continue
+            if item is done:
+                return
+            yield item
+    
+    def write_stage():
+        try:
+            write_results()
+        except Exception as e:
+            # Stop the other stages instead of leaving them blocked on a full queue
+            writer_error.append(f"{type(e).__name__}: {e}")
+            stop.set()
+    
+    def write_results():
+        nonlocal success_count, failure_count, unchanged_count
+        while True:
+            item = write_queue.get()
+            if item is done:
+                return
+            (plant_url, key, fetch), plant_data, error = item
+            if fetch is not None and fetch['unchanged']:
+                unchanged_count += 1
+            elif plant_data is None:
+                if error is None:
+                    error = "fetch failed"
+                else:
+                    # Kept in the ledger as the plant's last error; later runs retry it
+                    log_message(f"Skipped {plant_url}: {error}", log_path)
+            else:
+                try:
+                    # Extract plant ID and save data
+                    plant_id = extract_plant_id(plant_url)
+                    save_plant_data(plant_id, plant_url, plant_data, log_path, archive_key=key)
+                except Exception as e:
+                    print(f"  ✗ Error saving plant: {type(e).__name__}: {str(e)}")
+                    error = f"{type(e).__name__}: {e}"
+            if error is not None:
+                failure_count += 1
+            elif not fetch['unchanged']:
+                success_count += 1
+            if CRAWL_LEDGER is not None:
+                if error is None:
+                    # Only now, so a page that failed to parse or save is not taken as up to date
+                    CRAWL_LEDGER.record_fetch(absolute_plant_url(plant_url), fetch['sha256'],
+                                              fetch['etag'], fetch['last_modified'])
+                CRAWL_LEDGER.record_plant(plant_url, ok=error is None, error=error)
+    
+    fetcher = threading.Thread(target=fetch_stage, daemon=True)
+    writer = threading.Thread(target=write_stage, daemon=True)
+    fetcher.start()
+    writer.start()
+    
+    parsed_pages = iter_parsed_pages(queued_pages())
+    try:
+        for item in parsed_pages:
+            if not _put(write_queue, item, stop):
+                break
+    finally:
+        parsed_pages.close()
+        stop.set()
+        # The writer drains the queue until done; a writer that died takes nothing more
+        while writer.is_alive():
+            try:
+                write_queue.put(done, timeout=0.5)
+                break
+            except queue.Full:
+                continue
+        writer.join()
+    
+    if writer_error:
+        print(f"\n✗ Saving results stopped: {writer_error[0]}")
+        log_message(f"Plant processing stopped, writer failed: {writer_error[0]}", log_path)
     
     print(f"\n✓ Successfully processed {success_count} plants")
+    if unchanged_count > 0:
+        print(f"✓ {unchanged_count} plants unchanged since their last fetch")
     if failure_count > 0:
         print(f"✗ Failed to process {failure_count} plants")
     
-    return success_count, failure_count
+    return success_count, failure_count, unchanged_count
+
+
+def flatten_fields(data, prefix=''):
+    """Flatten nested plant data to {dotted.path: value}; lists are leaf values."""
+    fields = {}
+    for name, value in data.items():
+        path = f"{prefix}{name}"
+        if isinstance(value, dict) and value:
+            fields.update(flatten_fields(value, path + '.'))
+        else:
+            fields[path] = value
+    return fields
+
+
+def diff_fields(old_data, new_data):
+    """
+    Compare two plant_data dicts field by field.
+    
+    Returns:
+        Dict of {dotted.path: 'added' | 'removed' | 'changed'}
+    """
+    old_fields = flatten_fields(old_data or {})
+    new_fields = flatten_fields(new_data or {})
+    changes = {}
+    for path in old_fields.keys() | new_fields.keys():
+        if path not in old_fields:
+            changes[path] = 'added'
+        elif path not in new_fields:
+            changes[path] = 'removed'
+        elif old_fields[path] != new_fields[path]:
+            changes[path] = 'changed'
+    return changes
+
+
+def iter_saved_plants():
+    """Yield (filepath, record) for every plant JSON file in OUTPUT_DIR."""
+    for filename in sorted(os.listdir(OUTPUT_DIR)):
+        if not filename.endswith('.json'):
+            continue
+        filepath = os.path.join(OUTPUT_DIR, filename)
+        try:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                yield filepath, json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"  ⚠ Skipping {filename}: {e}")
+
+
+def archived_fetch_of(archive, ledger, record):
+    """
+    Archive key of the page a record without archive_key was parsed from.
+    
+    Only fetches made at or before the record's scraped_at whose body hash
+    is the one the crawl ledger recorded for the page are trusted; of those
+    the most recent is used.
+    
+    Returns:
+        Archive key, or None if no archived fetch qualifies
+    """
+    url = absolute_plant_url(record.get('source_url', ''))
+    seen = ledger.freshness(url)
+    try:
+        # scraped_at is local time; archive fetch times are UTC
+        scraped_at = datetime.fromisoformat(record['scraped_at']).astimezone(timezone.utc)
+    except (KeyError, TypeError, ValueError):
+        return None
+    if seen is None or not seen['sha256']:
+        return None
+    for entry in reversed(archive.fetches(url)):
+        if (datetime.fromisoformat(entry['fetched_at']) <= scraped_at
+                and entry['sha256'] == seen['sha256']):
+            return entry['key']
+    return None
+
+
+def reparse_plants():
+    """
+    Re-parse every saved plant from its archived page, without network access.
+    
+    Pages are parsed by iter_parsed_pages across PARSE_WORKERS processes.
+    Pages come from the real page archive (never the --test one); records
+    saved without an archive key use archived_fetch_of. A record is
+    rewritten only when its extracted plant_data changes; the fetch metadata
+    (source_url, scraped_at, archive_key) is kept.
+    
+    Returns:
+        Tuple of (changed_count, unchanged_count, missing_count, failure_count)
+    """
+    # Real fetches only, even with --test: mock pages must never become plant data
+    archive = get_page_archive(PAGE_ARCHIVE_DIR)
+    ledger = CrawlLedger(LIVE_CRAWL_LEDGER_FILE)
+    missing = []
+    
+    def archived_pages():
+        for filepath, record in iter_saved_plants():
+            key = record.get('archive_key') or archived_fetch_of(archive, ledger, record)
+            try:
+                content = archive.get_text(key) if key else None
+            except PageArchiveError as e:
+                print(f"  ✗ {os.path.basename(filepath)}: {e}")
+                content = None
+            if content is None:
+                missing.append(filepath)
+                continue
+            yield (filepath, record, key), content
+    
+    changed_count = 0
+    unchanged_count = 0
+    failure_count = 0
+    field_changes = {}  # path -> {'added': n, 'removed': n, 'changed': n}
+    
+    for (filepath, record, key), parsed, _ in iter_parsed_pages(archived_pages()):
+        if parsed is None:
+            failure_count += 1
+            continue
+        plant_data, _ = parsed
+        changes = diff_fields(record.get('plant_data'), plant_data)
+        if not changes:
+            unchanged_count += 1
+            continue
+        
+        for path, kind in changes.items():
+            counts = field_changes.setdefault(path, {'added': 0, 'removed': 0, 'changed': 0})
+            counts[kind] += 1
+        
+        record['scraper_version'] = SCRAPER_VERSION
+        record['archive_key'] = key
+        record.pop('raw_html', None)
+        # Keep plant_data last, as save_plant_data writes it
+        record.pop('plant_data', None)
+        record['plant_data'] = plant_data
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(record, f, indent=2, ensure_ascii=False)
+        changed_count += 1
+    ledger.close()
+    
+    print(f"\n✓ Re-parsed {changed_count + unchanged_count} plants: "
+          f"{changed_count} changed, {unchanged_count} unchanged")
+    if missing:
+        print(f"⚠ {len(missing)} plants have no trusted archived page (fetch them again to archive them)")
+    if failure_count:
+        print(f"✗ Failed to parse {failure_count} plants")
+    
+    if field_changes:
+        print("\nChanges per field:")
+        width = max(len(path) for path in field_changes)
+        for path in sorted(field_changes):
+            counts = field_changes[path]
+            total = sum(counts.values())
+            details = ', '.join(f"{n} {kind}" for kind, n in counts.items() if n)
+            print(f"  {path.ljust(width)}  {total:5d} records ({details})")
+    
+    return changed_count, unchanged_count, len(missing), failure_count
+
+
+def reparse_main(log_path):
+    """--reparse: refresh every saved plant from the page archive."""
+    log_message("Re-parse started (archived pages, no network)", log_path)
+    changed, unchanged, missing, failures = reparse_plants()
+    log_message(f"Re-parsed plants: {changed} changed, {unchanged} unchanged, "
+                f"{missing} not archived, {failures} failures", log_path)
+    
+    print()
+    print("=" * 70)
+    if failures == 0:
+        print("✓ Re-parse completed successfully")
+        return 0
+    print(f"⚠ Re-parse completed with {failures} failures")
+    return 0 if changed + unchanged > 0 else 1
 
 
 def main():
     """Main execution function."""
     print("=" * 70)
-    if USE_TEST_MODE:
+    if USE_REPARSE:
+        print("Wildflower.org Data Scraper - Re-parse Archived Pages")
+    elif USE_TEST_MODE:
         print("Wildflower.org Data Scraper - Batch Job (TEST MODE)")
     else:
         print("Wildflower.org Data Scraper - Batch Job")
@@ -1226,11 +2175,24 @@ def main():
     ensure_output_directory()
     log_path = os.path.join(OUTPUT_DIR, LOG_FILE)
     
+    if USE_REPARSE:
+        return reparse_main(log_path)
+    
     # Log start
     mode = "test mode" if USE_TEST_MODE else "normal mode"
     log_message(f"Batch job started ({mode})", log_path)
     log_message(f"Target URL: {TARGET_URL}", log_path)
     
+    # Resume an interrupted crawl, or start a new one
+    global CRAWL_LEDGER
+    CRAWL_LEDGER = CrawlLedger(CRAWL_LEDGER_FILE)
+    if CRAWL_LEDGER.begin(f"collection={COLLECTION_NAME}&pagecount={PAGECOUNT}", restart=RESTART_CRAWL):
+        counts = CRAWL_LEDGER.counts()
+        log_message(f"Resuming crawl {CRAWL_LEDGER.crawl_id}: {counts['done']} plants done, "
+                    f"{counts['pending'] + counts['failed']} not done yet", log_path)
+    else:
+        log_message(f"Starting crawl {CRAWL_LEDGER.crawl_id}", log_path)
+    
     # Fetch collection page and extract plant links
     success, plant_links, message = fetch_wildflower_collection()
     log_message(f"Collection fetch result: {message}", log_path)
@@ -1257,10 +2219,35 @@ def main():
         log_message("Batch job completed - no plant links found", log_path)
         return 0
     
-    # Process individual plant pages
-    success_count, failure_count = process_plants(plant_links, log_path)
-    
-    log_message(f"Processed {success_count} plants successfully, {failure_count} failures", log_path)
+    # Process individual plant pages, skipping those done earlier in this crawl
+    pending_links = CRAWL_LEDGER.pending_plants()
+    if len(pending_links) < len(plant_links):
+        log_message(f"Skipping {len(plant_links) - len(pending_links)} plants already done in this crawl", log_path)
+    
+    # Only request pages that are new, stale or may have changed, within the page budget
+    planned, fresh, deferred = plan_refresh(pending_links)
+    for plant_url in fresh:
+        CRAWL_LEDGER.record_plant(plant_url, ok=True)
+    reasons = [reason for _, reason, _ in planned]
+    log_message(f"Refresh plan: requesting {reasons.count(REFRESH_NEW)} new, {reasons.count(REFRESH_STALE)} stale, "
+                f"{reasons.count(REFRESH_CHECK)} to check, {len(fresh)} fetched within "
+                f"{REFRESH_AFTER_DAYS:g} days (not requested)", log_path)
+    if deferred:
+        log_message(f"Page budget of {MAX_PAGES_PER_RUN} reached: {len(deferred)} plants left for the next run",
+                    log_path)
+    success_count, failure_count, unchanged_count = process_plants(planned, log_path)
+    
+    log_message(f"Processed {success_count} plants successfully, {unchanged_count} unchanged, "
+                f"{failure_count} failures", log_path)
+    if CRAWL_LEDGER.finish_if_complete():
+        log_message(f"Crawl {CRAWL_LEDGER.crawl_id} complete", log_path)
+    else:
+        counts = CRAWL_LEDGER.counts()
+        log_message(f"Crawl {CRAWL_LEDGER.crawl_id} incomplete ({counts['done']} plants done); "
+                    f"the next run resumes it", log_path)
+    log_message(get_page_archive(PAGE_ARCHIVE_ROOT).stats_line(), log_path)
+    if not USE_TEST_MODE:
+        log_message(get_http_cache().stats_line(), log_path)
     
     print()
     print("=" * 70)
@@ -1271,7 +2258,7 @@ def main():
     else:
         print(f"⚠ Batch job completed with {failure_count} failures")
         log_message(f"Batch job completed with {failure_count} failures", log_path)
-        return 0 if success_count > 0 else 1
+        return 0 if success_count + unchanged_count > 0 else 1
 
 
 if __name__ == "__main__":
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Local stand-in HTTP server that records and replays responses for the fetch scripts.
+
+The scripts' --test modes use inline mock data (MOCK_COLLECTION_HTML,
+MOCK_PLANT_DETAILS, MOCK_TAXA_RESPONSE), so they never exercise networking,
+pagination or rate limiting. This server sits between a script and the real
+services and lets a whole run be repeated offline:
+
+- record mode forwards every request to the real host (through the shared
+  transport, so the normal per-host rate limits apply) and saves the response
+  in a fixture store
+- replay mode answers from the fixture store only, with configurable latency
+  and injected 5xx errors, 403 Forbidden and 429 Too Many Requests responses
+
+Scripts are pointed at the server with the PLANTFINDER_HTTP_STANDIN environment
+variable. The shared transport (http_transport.py) then sends every request to
+the stand-in with the original absolute URL as the request target, like a
+plain HTTP proxy. Rate limiting still uses the original host names, and the
+on-disk HTTP cache is bypassed so every request reaches the stand-in.
+
+Usage:
+    # 1. Record a real run into the fixture store
+    python scripts/fixture_server.py --record &
+    PLANTFINDER_HTTP_STANDIN=http://127.0.0.1:8765 python scripts/fetch_inaturalist_data.py --limit 20
+
+    # 2. Replay it offline with 200ms latency, 2% 503s and 1% 429s
+    python scripts/fixture_server.py --latency 0.2 --error-rate 0.02 --inject-429 0.01 &
+    time PLANTFINDER_HTTP_STANDIN=http://127.0.0.1:8765 python scripts/fetch_inaturalist_data.py --limit 20
+
+Options:
+    --record            Forward to the real hosts and store responses
+    --fixtures DIR      Fixture store directory (default: .cache/fixtures)
+    --host HOST         Interface to listen on (default: 127.0.0.1)
+    --port PORT         Port to listen on (default: 8765)
+    --latency SECONDS   Added delay per replayed response (default: 0)
+    --jitter SECONDS    Random extra delay, 0..jitter (default: 0)
+    --error-rate P      Probability of answering 503 Service Unavailable
+    --inject-403 P      Probability of answering 403 Forbidden
+    --inject-429 P      Probability of answering 429 with Retry-After
+    --retry-after SECONDS  Retry-After sent with injected 429/503 (default: 1)
+    --seed N            Random seed for reproducible fault injection
+"""
+
+import hashlib
+import json
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.error import URLError, HTTPError
+from urllib.parse import urlsplit
+
+from http_transport import HTTPTransport
+
+# Configuration
+FIXTURES_DIR = ".cache/fixtures"  # Relative to the repository root (gitignored)
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Headers that describe one hop or the encoding of the body. Fixtures store the
+# decoded body, so these are dropped when recording and recomputed when serving.
+SKIPPED_HEADERS = {
+    'connection', 'keep-alive', 'proxy-authenticate', 'proxy-authorization',
+    'te', 'trailer', 'transfer-encoding', 'upgrade',
+    'content-encoding', 'content-length',
+}
+
+
+class FixtureStore:
+    """Recorded responses keyed by method, absolute URL and request body."""
+
+    def __init__(self, root=FIXTURES_DIR):
+        self.root = root
+        self._lock = threading.Lock()
+
+    def key(self, method, url, body=None):
+        digest = hashlib.sha256(f"{method.upper()} {url}\n".encode('utf-8'))
+        if body:
+            digest.update(body)
+        return digest.hexdigest()
+
+    def _paths(self, key):
+        directory = os.path.join(self.root, key[:2])
+        return directory, os.path.join(directory, key + '.body'), os.path.join(directory, key + '.json')
+
+    def save(self, method, url, body, status, reason, headers, response_body):
+        """
+        Store one response.
+
+        Args:
+            method: Request method
+            url: Absolute request URL
+            body: Request body (bytes or None)
+            status: Response status code
+            reason: Response reason phrase
+            headers: List of (name, value) response header pairs
+            response_body: Decoded response body (bytes)
+        """
+        key = self.key(method, url, body)
+        directory, body_path, meta_path = self._paths(key)
+        meta = {
+            'method': method.upper(),
+            'url': url,
+            'status': status,
+            'reason': reason,
+            'headers': [[name, value] for name, value in headers if name.lower() not in SKIPPED_HEADERS],
+            'recorded_at': time.time(),
+        }
+        with self._lock:
+            os.makedirs(directory, exist_ok=True)
+            with open(body_path, 'wb') as f:
+                f.write(response_body)
+            with open(meta_path, 'w', encoding='utf-8') as f:
+                json.dump(meta, f, indent=2)
+
+    def load(self, method, url, body=None):
+        """
+        Find a recorded response.
+
+        Returns:
+            Tuple of (meta, response_body), or None if nothing was recorded
+        """
+        _, body_path, meta_path = self._paths(self.key(method, url, body))
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(body_path, 'rb') as f:
+                return meta, f.read()
+        except (OSError, ValueError):
+            return None
+
+
+class StandInServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding the fixture store and fault-injection settings."""
+
+    daemon_threads = True
+
+    def __init__(self, address, store, record=False, latency=0.0, jitter=0.0, error_rate=0.0,
+                 forbidden_rate=0.0, too_many_rate=0.0, retry_after=1, seed=None):
+        super().__init__(address, StandInHandler)
+        self.store = store
+        self.record = record
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.forbidden_rate = forbidden_rate
+        self.too_many_rate = too_many_rate
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+        # Upstream client for record mode (never routed back to a stand-in)
+        self.upstream = HTTPTransport(standin='') if record else None
+        self.stats = {'served': 0, 'recorded': 0, 'missing': 0, 'injected': 0}
+        self._lock = threading.Lock()
+
+    def count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def pick_fault(self):
+        """Roll for an injected failure: returns a status code or None."""
+        with self._lock:
+            roll = self.random.random()
+        for status, rate in ((403, self.forbidden_rate), (429, self.too_many_rate), (503, self.error_rate)):
+            if roll < rate:
+                return status
+            roll -= rate
+        return None
+
+    def delay(self):
+        with self._lock:
+            extra = self.random.uniform(0, self.jitter) if self.jitter else 0.0
+        return self.latency + extra
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Answers proxy-style requests (absolute URL as the request target)."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass  # The server prints a summary at the end instead
+
+    def do_GET(self):
+        self.handle_any()
+
+    def do_POST(self):
+        self.handle_any()
+
+    def do_HEAD(self):
+        self.handle_any()
+
+    def handle_any(self):
+        url = self.path
+        if not urlsplit(url).scheme:
+            self.reply(400, 'Bad Request', [('Content-Type', 'text/plain')],
+                       b"Expected an absolute URL (set PLANTFINDER_HTTP_STANDIN in the client)")
+            return
+
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else None
+
+        if self.server.record:
+            self.forward(url, body)
+            return
+
+        time.sleep(self.server.delay())
+
+        fault = self.server.pick_fault()
+        if fault is not None:
+            self.server.count('injected')
+            headers = [('Content-Type', 'text/plain')]
+            if fault in (429, 503):
+                headers.append(('Retry-After', str(self.server.retry_after)))
+            self.reply(fault, 'Injected fault', headers, f"Injected {fault}".encode('utf-8'))
+            return
+
+        fixture = self.server.store.load(self.command, url, body)
+        if fixture is None:
+            self.server.count('missing')
+            print(f"  ⚠ No fixture for {self.command} {url}")
+            self.reply(404, 'No fixture', [('Content-Type', 'text/plain'), ('X-Fixture-Missing', '1')],
+                       b"No recorded response for this request")
+            return
+
+        meta, response_body = fixture
+        self.server.count('served')
+        self.reply(meta['status'], meta.get('reason', ''), meta['headers'], response_body)
+
+    def forward(self, url, body):
+        """Record mode: fetch from the real host, store and relay the response."""
+        headers = {name: value for name, value in self.headers.items()
+                   if name.lower() not in SKIPPED_HEADERS and name.lower() != 'host'}
+        try:
+            response = self.server.upstream.open(url, headers=headers, data=body, method=self.command)
+            status, reason, response_headers, response_body = (
+                response.status, response.reason, list(response.headers.items()), response.body
+            )
+        except HTTPError as e:
+            status, reason = e.code, e.reason
+            response_headers = list(e.headers.items()) if e.headers is not None else []
+            response_body = e.read()
+        except URLError as e:
+            print(f"  ✗ Upstream error for {url}: {e.reason}")
+            self.reply(502, 'Bad Gateway', [('Content-Type', 'text/plain')], str(e.reason).encode('utf-8'))
+            return
+
+        self.server.store.save(self.command, url, body, status, reason, response_headers, response_body)
+        self.server.count('recorded')
+        print(f"  ✓ Recorded {self.command} {url} ({status})")
+        self.reply(status, reason, response_headers, response_body)
+
+    def reply(self, status, reason, headers, body):
+        self.send_response(status, reason)
+        for name, value in headers:
+            if name.lower() not in SKIPPED_HEADERS:
+                self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+
+def parse_args(argv):
+    """Parse command line options (see module docstring)."""
+    options = {
+        'record': False, 'fixtures': FIXTURES_DIR, 'host': DEFAULT_HOST, 'port': DEFAULT_PORT,
+        'latency': 0.0, 'jitter': 0.0, 'error_rate': 0.0, 'forbidden_rate': 0.0,
+        'too_many_rate': 0.0, 'retry_after': 1, 'seed': None,
+    }
+    flags = {
+        '--fixtures': ('fixtures', str), '--host': ('host', str), '--port': ('port', int),
+        '--latency': ('latency', float), '--jitter': ('jitter', float),
+        '--error-rate': ('error_rate', float), '--inject-403': ('forbidden_rate', float),
+        '--inject-429': ('too_many_rate', float), '--retry-after': ('retry_after', int),
+        '--seed': ('seed', int),
+    }
+    for i, arg in enumerate(argv):
+        if arg == '--record':
+            options['record'] = True
+        elif arg in flags and i + 1 < len(argv):
+            name, convert = flags[arg]
+            try:
+                options[name] = convert(argv[i + 1])
+            except ValueError:
+                print(f"Warning: Invalid value '{argv[i + 1]}' for {arg}, ignoring")
+    return options
+
+
+def main():
+    """Run the stand-in server until interrupted."""
+    options = parse_args(sys.argv[1:])
+    store = FixtureStore(options.pop('fixtures'))
+    address = (options.pop('host'), options.pop('port'))
+    server = StandInServer(address, store, **options)
+
+    mode = "record" if server.record else "replay"
+    print("=" * 70)
+    print(f"HTTP stand-in server ({mode} mode)")
+    print("=" * 70)
+    print(f"Fixtures: {store.root}")
+    print(f"Listening on http://{address[0]}:{server.server_port}")
+    print(f"Point scripts at it with: PLANTFINDER_HTTP_STANDIN=http://{address[0]}:{server.server_port}")
+    print()
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        stats = server.stats
+        print()
+        print(f"Served {stats['served']}, recorded {stats['recorded']}, "
+              f"missing {stats['missing']}, injected {stats['injected']}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Adaptive per-host concurrency with circuit breaking for the PlantFinder data scripts.
+
+WILDFLOWER_403_FIX.md and BATCH_PROCESS_403_FIX.md describe runs that kept
+hammering a host after it had started refusing requests: make_request gave up
+on a 403 for that one URL and moved straight on to the next one. This module
+gives every host two controls that the shared transport applies to each request:
+
+- an AIMD concurrency limit (additive increase, multiplicative decrease):
+  the number of requests allowed in flight grows by about one per round of
+  healthy responses, and is halved on 429 Too Many Requests, any 5xx server
+  error (500, 502, 503, 504, ...) or a network error
+- a circuit breaker: after CIRCUIT_403_THRESHOLD consecutive 403 Forbidden
+  responses the circuit opens and requests to the host fail immediately with
+  CircuitOpenError, without being sent. Once the probe interval has passed a
+  single probe request is let through; if it succeeds the circuit closes, if
+  it is refused again the interval doubles (up to MAX_PROBE_INTERVAL)
+
+The token buckets in rate_limiter.py still set the request rate; this module
+decides how many of those requests may overlap.
+
+Configuration:
+    Per-host limits live in HOST_CONCURRENCY_LIMITS below. Unlisted hosts use
+    DEFAULT_CONCURRENCY_LIMITS.
+
+Usage:
+    from host_concurrency import get_host_concurrency
+
+    controller = get_host_concurrency()
+    slot = controller.acquire("www.wildflower.org")   # may raise CircuitOpenError
+    try:
+        ...send the request...
+    finally:
+        controller.release(slot, status_code)         # None for a network error
+
+The shared transport (http_transport.py) does this for every request.
+"""
+
+import threading
+import time
+from urllib.error import URLError
+
+# Per-host concurrency: starting limit and the range AIMD may move it in
+HOST_CONCURRENCY_LIMITS = {
+    'api.inaturalist.org': {'initial': 2, 'min': 1, 'max': 4},
+    # wildflower.org blocks aggressive clients (see WILDFLOWER_403_FIX.md)
+    'www.wildflower.org': {'initial': 1, 'min': 1, 'max': 2},
+    'plantsservices.sc.egov.usda.gov': {'initial': 2, 'min': 1, 'max': 4},
+    'en.wikipedia.org': {'initial': 2, 'min': 1, 'max': 4},
+    'commons.wikimedia.org': {'initial': 2, 'min': 1, 'max': 4},
+}
+DEFAULT_CONCURRENCY_LIMITS = {'initial': 2, 'min': 1, 'max': 4}
+
+# Statuses that mean "slow down": halve the host's concurrency (so does every 5xx)
+BACKOFF_STATUSES = (429,)
+
+# Circuit breaker
+CIRCUIT_403_THRESHOLD = 3  # Consecutive 403s that open the circuit
+INITIAL_PROBE_INTERVAL = 60  # Seconds before the first probe request
+MAX_PROBE_INTERVAL = 15 * 60  # Longest wait between probes
+
+
+class CircuitOpenError(URLError):
+    """The host's circuit is open: the request was not sent."""
+
+    def __init__(self, host, retry_in, status=403):
+        super().__init__(f"circuit open for {host} after repeated HTTP {status} (next probe in {retry_in:.0f}s)")
+        self.host = host
+        self.retry_in = retry_in
+        # Status that opened the circuit, reported by make_request as the failure status
+        self.status = status
+
+
+class Slot:
+    """One admitted request; handed back to HostController.release()."""
+
+    def __init__(self, host, probe=False):
+        self.host = host
+        self.probe = probe
+        self.started = time.monotonic()
+
+
+class HostController:
+    """AIMD concurrency limit and circuit breaker for a single host. Thread-safe."""
+
+    def __init__(self, host, initial=2, minimum=1, maximum=4):
+        self.host = host
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = float(min(max(initial, self.minimum), self.maximum))
+        self.in_flight = 0
+        # Requests started before the last decrease don't trigger another one
+        self.last_decrease = 0.0
+        # Circuit breaker state: 'closed', 'open' or 'half-open' (probe in flight)
+        self.state = 'closed'
+        self.consecutive_403 = 0
+        self.probe_interval = INITIAL_PROBE_INTERVAL
+        self.open_until = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        """
+        Wait for a free slot under the current limit.
+
+        Returns:
+            Slot to pass to release()
+
+        Raises:
+            CircuitOpenError if the circuit is open (or a probe is already in flight)
+        """
+        with self._cond:
+            probe = False
+            if self.state != 'closed':
+                now = time.monotonic()
+                if self.state == 'open' and now >= self.open_until:
+                    self.state = 'half-open'
+                    probe = True
+                    print(f"  ⏳ Probing {self.host} after circuit was open...")
+                else:
+                    raise CircuitOpenError(self.host, max(0.0, self.open_until - now))
+
+            while not probe and self.in_flight >= int(self.limit):
+                self._cond.wait()
+                if self.state != 'closed':
+                    raise CircuitOpenError(self.host, max(0.0, self.open_until - time.monotonic()))
+
+            self.in_flight += 1
+            return Slot(self.host, probe)
+
+    def release(self, slot, status_code):
+        """
+        Free a slot and adapt to the response.
+
+        Args:
+            slot: Slot returned by acquire()
+            status_code: HTTP status of the response, or None for a network error
+        """
+        with self._cond:
+            self.in_flight -= 1
+            now = time.monotonic()
+
+            if status_code == 403:
+                self.consecutive_403 += 1
+                if slot.probe:
+                    self._open(now, self.probe_interval * 2)
+                elif self.state == 'closed' and self.consecutive_403 >= CIRCUIT_403_THRESHOLD:
+                    self._open(now, INITIAL_PROBE_INTERVAL)
+            elif status_code is None or status_code in BACKOFF_STATUSES or status_code >= 500:
+                if slot.probe:
+                    self._open(now, self.probe_interval)
+                elif slot.started >= self.last_decrease:
+                    # Multiplicative decrease, at most once per round of requests
+                    self.limit = max(self.minimum, self.limit / 2)
+                    self.last_decrease = now
+            else:
+                self.consecutive_403 = 0
+                if slot.probe:
+                    self.state = 'closed'
+                    self.probe_interval = INITIAL_PROBE_INTERVAL
+                    print(f"  ✓ {self.host} is answering again, circuit closed")
+                # Additive increase: about +1 per `limit` healthy responses
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+
+            self._cond.notify_all()
+
+    def _open(self, now, interval):
+        self.state = 'open'
+        self.probe_interval = min(interval, MAX_PROBE_INTERVAL)
+        self.open_until = now + self.probe_interval
+        self.limit = float(self.minimum)
+        print(f"  ✗ {self.host} keeps refusing requests, circuit open for {self.probe_interval:.0f}s")
+
+
+class HostConcurrency:
+    """Collection of per-host controllers."""
+
+    def __init__(self, host_limits=None):
+        self.host_limits = dict(HOST_CONCURRENCY_LIMITS if host_limits is None else host_limits)
+        self._controllers = {}
+        self._lock = threading.Lock()
+
+    def controller(self, host):
+        """Get or create the controller for a host."""
+        host = (host or '').lower()
+        with self._lock:
+            controller = self._controllers.get(host)
+            if controller is None:
+                limits = self.host_limits.get(host, DEFAULT_CONCURRENCY_LIMITS)
+                controller = HostController(host, limits.get('initial', 2), limits.get('min', 1),
+                                            limits.get('max', 4))
+                self._controllers[host] = controller
+            return controller
+
+    def acquire(self, host):
+        """Admit one request to `host` (see HostController.acquire)."""
+        return self.controller(host).acquire()
+
+    def release(self, slot, status_code):
+        """Finish a request admitted by acquire()."""
+        self.controller(slot.host).release(slot, status_code)
+
+
+# Shared controllers used by all scripts in this process
+_host_concurrency = None
+_host_concurrency_lock = threading.Lock()
+
+
+def get_host_concurrency():
+    """Get or create the process-wide shared concurrency controllers."""
+    global _host_concurrency
+    with _host_concurrency_lock:
+        if _host_concurrency is None:
+            _host_concurrency = HostConcurrency()
+        return _host_concurrency
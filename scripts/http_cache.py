@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Persistent on-disk HTTP response cache for the nightly fetch jobs.
+
+The scheduled workflows download the same collection pages, taxon records and
+Wikipedia API responses every night, even when nothing changed. This cache
+stores each response body together with its validators (ETag, Last-Modified)
+and lets the transport:
+- serve a response straight from disk while it is younger than its host's TTL
+- send a conditional request (If-None-Match / If-Modified-Since) once it is
+  older, and reuse the cached body when the server answers 304 Not Modified
+
+Only hosts listed in HOST_CACHE_TTLS are cached, only successful GET responses
+are stored, and responses marked Cache-Control: no-store are skipped. The cache
+is bounded by MAX_CACHE_BYTES; the least recently used entries are evicted first.
+
+Layout (under HTTP_CACHE_DIR):
+    ab/ab12...ef.body   Response body (decoded bytes)
+    ab/ab12...ef.json   Metadata: url, status, headers, validators, stored_at
+The body file's modification time doubles as its last-access time for LRU.
+
+Usage:
+    from http_cache import get_http_cache
+    from http_transport import configure_transport
+
+    configure_transport(cache=get_http_cache())
+"""
+
+import hashlib
+import http.client
+import json
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+# Configuration
+HTTP_CACHE_DIR = ".cache/http"  # Relative to the repository root (gitignored)
+MAX_CACHE_BYTES = 512 * 1024 * 1024  # Evict least recently used entries beyond this
+
+# Per-host time-to-live in seconds. Within the TTL a cached response is used
+# without contacting the server; after it the response is revalidated.
+# 20 hours means a nightly run always revalidates, while re-runs later the
+# same day are served from disk.
+HOST_CACHE_TTLS = {
+    'www.wildflower.org': 20 * 60 * 60,
+    'api.inaturalist.org': 20 * 60 * 60,
+    'en.wikipedia.org': 20 * 60 * 60,
+}
+
+# Response headers kept with a cached body
+STORED_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Cache-Control', 'Date', 'Expires')
+
+
+class CacheEntry:
+    """A cached response loaded from disk."""
+
+    def __init__(self, key, meta, body_path):
+        self.key = key
+        self.url = meta['url']
+        self.status = meta.get('status', 200)
+        self.headers = meta.get('headers', {})
+        self.stored_at = meta.get('stored_at', 0)
+        self.body_path = body_path
+
+    @property
+    def etag(self):
+        return self.headers.get('ETag')
+
+    @property
+    def last_modified(self):
+        return self.headers.get('Last-Modified')
+
+    def has_validators(self):
+        return bool(self.etag or self.last_modified)
+
+    def age(self):
+        return time.time() - self.stored_at
+
+    def read_body(self):
+        with open(self.body_path, 'rb') as f:
+            return f.read()
+
+    def header_message(self):
+        """Return the stored headers as an http.client.HTTPMessage."""
+        message = http.client.HTTPMessage()
+        for name, value in self.headers.items():
+            message[name] = value
+        return message
+
+
+class HTTPCache:
+    """Disk-backed response cache with per-host TTLs and size-bounded LRU eviction."""
+
+    def __init__(self, cache_dir=HTTP_CACHE_DIR, max_bytes=MAX_CACHE_BYTES, host_ttls=None):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.host_ttls = dict(HOST_CACHE_TTLS if host_ttls is None else host_ttls)
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._total_bytes = None  # Computed lazily on first store
+
+    def record(self, outcome):
+        """Count a lookup outcome: 'hits', 'revalidated' or 'misses'."""
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def is_cacheable(self, url):
+        """True if responses for this URL's host should be cached."""
+        host = (urlsplit(url).hostname or '').lower()
+        return host in self.host_ttls
+
+    def ttl_for(self, url):
+        host = (urlsplit(url).hostname or '').lower()
+        return self.host_ttls.get(host, 0)
+
+    def _key(self, url):
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _paths(self, key):
+        directory = os.path.join(self.cache_dir, key[:2])
+        return directory, os.path.join(directory, key + '.body'), os.path.join(directory, key + '.json')
+
+    def lookup(self, url):
+        """
+        Find a cached response for a URL.
+
+        Returns:
+            CacheEntry or None when nothing usable is cached
+        """
+        key = self._key(url)
+        _, body_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if meta.get('url') != url or not os.path.exists(body_path):
+            return None
+        return CacheEntry(key, meta, body_path)
+
+    def is_fresh(self, entry):
+        """True while the entry is younger than its host's TTL."""
+        return entry.age() < self.ttl_for(entry.url)
+
+    def conditional_headers(self, entry):
+        """Request headers that ask the server to validate the cached copy."""
+        headers = {}
+        if entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+        return headers
+
+    def touch(self, entry):
+        """Mark an entry as recently used (the LRU clock is the body's mtime)."""
+        try:
+            os.utime(entry.body_path)
+        except OSError:
+            pass
+
+    def refresh(self, entry, response_headers=None):
+        """Record a successful revalidation (304): reset the entry's age and update validators."""
+        meta = {
+            'url': entry.url,
+            'status': entry.status,
+            'headers': dict(entry.headers),
+            'stored_at': time.time(),
+        }
+        if response_headers is not None:
+            for name in ('ETag', 'Last-Modified', 'Cache-Control', 'Date', 'Expires'):
+                value = response_headers.get(name)
+                if value:
+                    meta['headers'][name] = value
+        _, _, meta_path = self._paths(entry.key)
+        self._write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+        self.touch(entry)
+
+    def store(self, url, status, headers, body):
+        """
+        Store a response body and its validators.
+
+        Args:
+            url: Request URL
+            status: HTTP status code (only 200 is stored)
+            headers: Response headers mapping
+            body: Decoded response body (bytes)
+        """
+        if status != 200:
+            return
+        cache_control = (headers.get('Cache-Control') or '').lower()
+        if 'no-store' in cache_control:
+            return
+
+        key = self._key(url)
+        directory, body_path, meta_path = self._paths(key)
+        meta = {
+            'url': url,
+            'status': status,
+            'headers': {name: headers.get(name) for name in STORED_HEADERS if headers.get(name)},
+            'stored_at': time.time(),
+        }
+
+        with self._lock:
+            os.makedirs(directory, exist_ok=True)
+            previous_size = os.path.getsize(body_path) if os.path.exists(body_path) else 0
+            self._write_atomic(body_path, body)
+            self._write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_total_bytes()
+            else:
+                self._total_bytes += len(body) - previous_size
+
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _write_atomic(self, path, data):
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _iter_bodies(self):
+        if not os.path.isdir(self.cache_dir):
+            return
+        for sub in os.listdir(self.cache_dir):
+            directory = os.path.join(self.cache_dir, sub)
+            if not os.path.isdir(directory):
+                continue
+            for name in os.listdir(directory):
+                if name.endswith('.body'):
+                    path = os.path.join(directory, name)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    yield path, stat.st_size, stat.st_mtime
+
+    def _scan_total_bytes(self):
+        return sum(size for _, size, _ in self._iter_bodies())
+
+    def _evict(self):
+        """Delete least recently used entries until the cache is at 90% of its limit."""
+        target = int(self.max_bytes * 0.9)
+        entries = sorted(self._iter_bodies(), key=lambda item: item[2])
+        total = sum(size for _, size, _ in entries)
+        for body_path, size, _ in entries:
+            if total <= target:
+                break
+            meta_path = body_path[:-len('.body')] + '.json'
+            for path in (body_path, meta_path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= size
+        self._total_bytes = total
+
+    def stats_line(self):
+        """One-line summary for the end-of-run log."""
+        return (f"HTTP cache: {self.hits} fresh hit(s), {self.revalidated} revalidated (304), "
+                f"{self.misses} miss(es)")
+
+
+# Shared cache used by all scripts in this process
+_http_cache = None
+_http_cache_lock = threading.Lock()
+
+
+def get_http_cache():
+    """Get or create the process-wide shared HTTP cache."""
+    global _http_cache
+    with _http_cache_lock:
+        if _http_cache is None:
+            _http_cache = HTTPCache()
+        return _http_cache
@@ -0,0 +1,638 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP transport for the PlantFinder data scripts.
+
+Every fetch script used to call urlopen() for each request, which opens a new
+TCP connection (and TLS session) every time. This module keeps a small pool of
+persistent keep-alive connections per host, so repeated requests to the same
+API (api.inaturalist.org, en.wikipedia.org, www.wildflower.org, ...) reuse an
+already-negotiated connection.
+
+Every request is also paced by the per-host token buckets in rate_limiter.py,
+so scripts no longer need to sleep between requests themselves, and admitted
+by the per-host AIMD concurrency limit and circuit breaker in
+host_concurrency.py, which stops a run from hammering a host that refuses it. A transport
+can optionally be given an on-disk HTTPCache (http_cache.py) to serve and
+revalidate GET responses.
+
+The public helpers mirror what the scripts already expect:
+- make_request(url, ...) returns (content, status_code), content is None on error
+- fetch_response(url, ...) is the same but returns the Response, for callers
+  that need response headers
+- open_url(url, ...) behaves like urlopen(): it returns a response object and
+  raises HTTPError / URLError on failure
+- stream_request(url, make_consumer, ...) feeds the decoded page to a consumer
+  (e.g. an HTMLParser) chunk by chunk while it is still arriving
+
+Response bodies are decompressed incrementally as they are read from the
+socket. gzip and deflate are always supported, brotli and zstd when the
+optional brotli (or brotlicffi) and zstandard packages are installed. The
+Accept-Encoding header of every request is set to exactly the encodings this
+process can decode (ACCEPT_ENCODING).
+
+Usage:
+    from http_transport import make_request, open_url
+
+    content, status = make_request("https://api.inaturalist.org/v1/taxa/47604")
+
+    response = open_url(image_url, headers={'User-Agent': USER_AGENT})
+    image_data = response.read()
+
+Configuration:
+    - DEFAULT_POOL_SIZE: Maximum open connections per host (default: 4)
+    - configure_transport(pool_size=..., cache=...) reconfigures the shared transport
+    - PLANTFINDER_HTTP_STANDIN=http://127.0.0.1:8765 sends every request to a
+      local stand-in server instead (see fixture_server.py)
+    - Optional: pip install brotli zstandard (adds br/zstd to Accept-Encoding)
+"""
+
+import codecs
+import http.client
+import io
+import os
+import queue
+import socket
+import ssl
+import threading
+import time
+import zlib
+from urllib.error import URLError, HTTPError
+from urllib.parse import urlsplit, urljoin
+from urllib.request import Request
+
+from host_concurrency import CircuitOpenError, get_host_concurrency
+from rate_limiter import get_rate_limiter
+
+# Optional decoders for Content-Encoding: br and zstd
+try:
+    import brotlicffi as brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotli
+        BROTLI_AVAILABLE = True
+    except ImportError:
+        BROTLI_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Configuration
+DEFAULT_POOL_SIZE = 4  # Maximum persistent connections kept per host
+DEFAULT_TIMEOUT = 30  # Request timeout in seconds
+MAX_REDIRECTS = 5  # Redirects followed before giving up (same limit as urllib)
+STREAM_CHUNK_SIZE = 64 * 1024  # Bytes read from the socket at a time
+
+# Content codings we can decode; only these are advertised in Accept-Encoding
+SUPPORTED_ENCODINGS = ['gzip', 'deflate'] + (['br'] if BROTLI_AVAILABLE else []) + (['zstd'] if ZSTD_AVAILABLE else [])
+ACCEPT_ENCODING = ', '.join(SUPPORTED_ENCODINGS)
+
+# Environment variable naming a stand-in server (fixture_server.py) that receives every request
+STANDIN_ENV_VAR = 'PLANTFINDER_HTTP_STANDIN'
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+CONDITIONAL_HEADERS = ('if-none-match', 'if-modified-since')  # Caller-supplied revalidation bypasses the cache
+
+# Errors that mean a reused keep-alive connection was closed by the server
+# while it sat idle in the pool. The request is retried once on a new connection.
+STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+    ConnectionAbortedError,
+)
+
+
+class Response:
+    """A fully-read HTTP response (the body is buffered so the connection can be reused)."""
+
+    def __init__(self, url, status, reason, headers, body, from_cache=False):
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+        # True when the body came from the on-disk HTTP cache
+        self.from_cache = from_cache
+
+    def read(self):
+        """Return the (decoded) response body as bytes."""
+        return self.body
+
+    def info(self):
+        """Return the response headers, like urllib's response.info()."""
+        return self.headers
+
+    def getcode(self):
+        return self.status
+
+    def text(self, encoding='utf-8'):
+        """Return the body decoded as text, ignoring undecodable bytes."""
+        return self.body.decode(encoding, errors='ignore')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class ConnectionPool:
+    """Pool of persistent connections to a single scheme://host:port."""
+
+    def __init__(self, scheme, host, port, size=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        # Bounds the number of connections (idle + in use) to this host
+        self._slots = threading.BoundedSemaphore(size)
+        # Most recently used connection first, it is the least likely to be stale
+        self._idle = queue.LifoQueue()
+
+    def _new_connection(self):
+        if self.scheme == 'https':
+            return http.client.HTTPSConnection(
+                self.host, self.port, timeout=self.timeout,
+                context=ssl.create_default_context()
+            )
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def acquire(self):
+        """
+        Take a connection from the pool, blocking while all slots are in use.
+
+        Returns:
+            Tuple of (connection, reused) where reused is True for a kept-alive connection
+        """
+        self._slots.acquire()
+        try:
+            return self._idle.get_nowait(), True
+        except queue.Empty:
+            return self._new_connection(), False
+
+    def release(self, connection, reusable=True):
+        """Return a connection to the pool, or close it if it cannot be reused."""
+        try:
+            if reusable:
+                self._idle.put(connection)
+            else:
+                connection.close()
+        finally:
+            self._slots.release()
+
+    def close(self):
+        """Close every idle connection."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+class HTTPTransport:
+    """Keep-alive HTTP client with one connection pool per host."""
+
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT, cookie_jar=None,
+                 rate_limiter=None, cache=None, standin=None, concurrency=None):
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self.cookie_jar = cookie_jar
+        # Optional http_cache.HTTPCache for GET responses
+        self.cache = cache
+        # Per-host pacing, shared with every other transport in the process by default
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        # Per-host adaptive concurrency and circuit breaking, shared the same way
+        self.concurrency = concurrency or get_host_concurrency()
+        # Stand-in server URL (default: $PLANTFINDER_HTTP_STANDIN, '' to disable)
+        self.standin = (os.environ.get(STANDIN_ENV_VAR) if standin is None else standin) or None
+        self._pools = {}
+        self._lock = threading.Lock()
+
+    def _get_pool(self, scheme, host, port):
+        key = (scheme, host, port)
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = ConnectionPool(scheme, host, port, self.pool_size, self.timeout)
+                self._pools[key] = pool
+            return pool
+
+    def _send(self, method, url, headers, data, timeout, on_chunk=None, keep_body=True):
+        """
+        Send a single request (no redirects) and return a Response.
+
+        The body is decompressed as it is read. For 2xx responses, on_chunk (if
+        given) receives each decoded chunk as it arrives; with keep_body=False
+        the body is then not buffered at all (Response.body is empty).
+        """
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ('http', 'https'):
+            raise URLError(f"unsupported URL scheme: {parts.scheme}")
+        host = parts.hostname
+        port = parts.port or (443 if scheme == 'https' else 80)
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+
+        if self.standin:
+            # Proxy-style: connect to the stand-in and send the absolute URL
+            standin = urlsplit(self.standin)
+            scheme, host, port = 'http', standin.hostname, standin.port or 80
+            path = url
+
+        # Let the cookie jar add its Cookie header, using urllib's Request as the adapter
+        cookie_request = None
+        if self.cookie_jar is not None:
+            cookie_request = Request(url, headers=headers, method=method)
+            self.cookie_jar.add_cookie_header(cookie_request)
+            headers = dict(cookie_request.header_items())
+
+        # Advertise exactly the encodings we can decode
+        headers = {k: v for k, v in headers.items() if k.lower() != 'accept-encoding'}
+        headers['Accept-Encoding'] = ACCEPT_ENCODING
+
+        pool = self._get_pool(scheme, host, port)
+
+        # One extra attempt in case a pooled connection went stale while idle
+        for attempt in range(2):
+            connection, reused = pool.acquire()
+            reusable = False
+            streamed = False
+            try:
+                if timeout is not None:
+                    connection.timeout = timeout
+                    if connection.sock is not None:
+                        connection.sock.settimeout(timeout)
+                connection.request(method, path, body=data, headers=headers)
+                raw = connection.getresponse()
+
+                stream = on_chunk is not None and 200 <= raw.status < 300
+                decoder = ContentDecoder(raw.headers.get('Content-Encoding'))
+                chunks = []
+                while True:
+                    chunk = raw.read(STREAM_CHUNK_SIZE)
+                    decoded = decoder.decompress(chunk) if chunk else decoder.flush()
+                    if decoded:
+                        if stream:
+                            streamed = True
+                            on_chunk(decoded)
+                        if keep_body or not stream:
+                            chunks.append(decoded)
+                    if not chunk:
+                        break
+                body = b''.join(chunks)
+                reusable = not raw.will_close
+            except STALE_CONNECTION_ERRORS as e:
+                if reused and attempt == 0 and not streamed:
+                    continue
+                raise URLError(e)
+            except (socket.timeout, OSError, http.client.HTTPException) as e:
+                raise URLError(e)
+            finally:
+                pool.release(connection, reusable)
+
+            if cookie_request is not None:
+                self.cookie_jar.extract_cookies(raw, cookie_request)
+
+            return Response(url, raw.status, raw.reason, raw.headers, body)
+
+    def open(self, url, headers=None, data=None, method=None, timeout=None, rate_limit=True,
+             on_chunk=None):
+        """
+        Perform a request, following redirects, with the same semantics as urlopen().
+
+        Args:
+            url: The URL to request
+            headers: Optional headers dict
+            data: Optional request body (bytes); implies POST unless method is given
+            method: HTTP method (default: GET, or POST when data is given)
+            timeout: Request timeout in seconds (default: transport timeout)
+            rate_limit: Wait for the host's token bucket first (default: True). Async
+                callers that already reserved a token themselves pass False.
+            on_chunk: Optional callable given each decoded chunk of a successful
+                response body as it arrives. The body is then only buffered if
+                the cache needs it.
+
+        A request that carries its own If-None-Match or If-Modified-Since
+        header skips the cache lookup, so the server is always asked and its
+        304 Not Modified reaches the caller; a 200 answer is still cached.
+
+        Returns:
+            Response object
+
+        Raises:
+            HTTPError for 4xx/5xx responses, URLError for network failures
+            (CircuitOpenError, a URLError, if the host's circuit is open)
+        """
+        headers = dict(headers or {})
+        method = method or ('POST' if data is not None else 'GET')
+        timeout = timeout if timeout is not None else self.timeout
+
+        cache = self.cache
+        if cache is None or self.standin or method != 'GET' or not cache.is_cacheable(url):
+            return self._open(url, headers, data, method, timeout, rate_limit,
+                              on_chunk, keep_body=on_chunk is None)
+
+        conditional = any(name.lower() in CONDITIONAL_HEADERS for name in headers)
+        entry = None if conditional else cache.lookup(url)
+        if entry is not None:
+            if cache.is_fresh(entry):
+                cache.record('hits')
+                cache.touch(entry)
+                return self._cached_response(entry, on_chunk)
+            if entry.has_validators():
+                headers.update(cache.conditional_headers(entry))
+
+        response = self._open(url, headers, data, method, timeout, rate_limit, on_chunk)
+
+        if response.status == 304 and entry is not None:
+            # Not modified: keep the cached body, only the validators/age change
+            cache.record('revalidated')
+            cache.refresh(entry, response.headers)
+            return self._cached_response(entry, on_chunk)
+        if response.status == 304:
+            # Answer to the caller's own conditional request
+            return response
+
+        cache.record('misses')
+        cache.store(url, response.status, response.headers, response.body)
+        return response
+
+    def _cached_response(self, entry, on_chunk=None):
+        response = Response(entry.url, entry.status, 'OK', entry.header_message(),
+                            entry.read_body(), from_cache=True)
+        if on_chunk is not None:
+            for start in range(0, len(response.body), STREAM_CHUNK_SIZE):
+                on_chunk(response.body[start:start + STREAM_CHUNK_SIZE])
+        return response
+
+    def _open(self, url, headers, data, method, timeout, rate_limit=True, on_chunk=None, keep_body=True):
+        """Send a request and follow redirects (no caching)."""
+        for _ in range(MAX_REDIRECTS + 1):
+            host = urlsplit(url).hostname
+            slot = self.concurrency.acquire(host)
+            status = None
+            try:
+                if rate_limit:
+                    self.rate_limiter.acquire(host)
+                rate_limit = True  # Redirect hops are always paced
+                response = self._send(method, url, headers, data, timeout, on_chunk, keep_body)
+                status = response.status
+            finally:
+                self.concurrency.release(slot, status)
+            self.rate_limiter.observe(host, response.status, response.headers)
+
+            location = response.headers.get('Location')
+            if response.status in REDIRECT_CODES and location:
+                url = urljoin(url, location)
+                if response.status in (301, 302, 303) and method not in ('GET', 'HEAD'):
+                    # Browsers and urllib switch to GET and drop the body here
+                    method, data = 'GET', None
+                    headers = {k: v for k, v in headers.items()
+                               if k.lower() not in ('content-type', 'content-length')}
+                continue
+
+            if response.status >= 400:
+                # As with urllib, the error body stays readable through e.read()
+                raise HTTPError(url, response.status, response.reason, response.headers,
+                                io.BytesIO(response.body))
+            return response
+
+        raise HTTPError(url, response.status, "Too many redirects", response.headers, None)
+
+    def close(self):
+        """Close all idle pooled connections."""
+        with self._lock:
+            for pool in self._pools.values():
+                pool.close()
+            self._pools.clear()
+
+
+class ContentDecoder:
+    """
+    Incremental decoder for one Content-Encoding (http.client does not decode for us).
+
+    Unknown or unsupported encodings are passed through unchanged.
+    """
+
+    def __init__(self, content_encoding):
+        self.encoding = (content_encoding or '').strip().lower()
+        self._obj = None
+        self._first = True
+        if self.encoding in ('gzip', 'x-gzip'):
+            self._obj = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif self.encoding == 'deflate':
+            self._obj = zlib.decompressobj()
+        elif self.encoding == 'br' and BROTLI_AVAILABLE:
+            self._obj = brotli.Decompressor()
+        elif self.encoding == 'zstd' and ZSTD_AVAILABLE:
+            self._obj = zstandard.ZstdDecompressor().decompressobj()
+
+    def decompress(self, data):
+        """Decode the next chunk of the body."""
+        if self._obj is None or not data:
+            return data
+        if self.encoding == 'br':
+            return self._obj.process(data) if hasattr(self._obj, 'process') else self._obj.decompress(data)
+        if self.encoding == 'deflate' and self._first:
+            self._first = False
+            try:
+                return self._obj.decompress(data)
+            except zlib.error:
+                # Some servers send raw deflate without the zlib header
+                self._obj = zlib.decompressobj(-zlib.MAX_WBITS)
+        return self._obj.decompress(data)
+
+    def flush(self):
+        """Return whatever is left once the body has been read."""
+        if self._obj is not None and self.encoding in ('gzip', 'x-gzip', 'deflate'):
+            return self._obj.flush()
+        return b''
+
+
+def decode_content(body, content_encoding):
+    """Decode a complete body with the given Content-Encoding."""
+    decoder = ContentDecoder(content_encoding)
+    return decoder.decompress(body) + decoder.flush()
+
+
+# Shared transport used by all scripts in this process
+_transport = None
+_transport_lock = threading.Lock()
+
+
+def get_transport():
+    """Get or create the process-wide shared transport."""
+    global _transport
+    with _transport_lock:
+        if _transport is None:
+            _transport = HTTPTransport()
+        return _transport
+
+
+def configure_transport(pool_size=None, timeout=None, cookie_jar=None, cache=None):
+    """
+    Reconfigure the shared transport (call before making requests).
+
+    Args:
+        pool_size: Maximum persistent connections per host
+        timeout: Default request timeout in seconds
+        cookie_jar: Optional http.cookiejar.CookieJar for session cookies
+        cache: Optional http_cache.HTTPCache used for GET responses
+    """
+    global _transport
+    with _transport_lock:
+        if _transport is not None:
+            _transport.close()
+        _transport = HTTPTransport(
+            pool_size=pool_size or DEFAULT_POOL_SIZE,
+            timeout=timeout or DEFAULT_TIMEOUT,
+            cookie_jar=cookie_jar,
+            cache=cache,
+        )
+        return _transport
+
+
+def open_url(url, headers=None, data=None, method=None, timeout=None, transport=None):
+    """urlopen() replacement that goes through the shared keep-alive transport."""
+    transport = transport or get_transport()
+    return transport.open(url, headers=headers, data=data, method=method, timeout=timeout)
+
+
+def is_retryable_status(status_code):
+    """Default retry policy: 403 (Forbidden) and 404 (Not Found) won't change on retry."""
+    return status_code not in (403, 404)
+
+
+def fetch_response(url, headers=None, retries=3, backoff_factor=2, timeout=None,
+                   retry_on=is_retryable_status, transport=None):
+    """
+    Like make_request, but return the whole Response (status, headers and body).
+
+    Useful when the caller needs response headers such as ETag or
+    Last-Modified. A 304 Not Modified answer to a conditional request is
+    returned as a response with status 304 and an empty body.
+
+    Args:
+        url, headers, retries, backoff_factor, timeout, retry_on, transport: As for make_request
+
+    Returns:
+        Tuple of (response, status_code) where response is None on error
+    """
+    last_status = 0
+
+    for attempt in range(retries):
+        try:
+            response = open_url(url, headers=headers, timeout=timeout, transport=transport)
+            return response, response.status
+
+        except HTTPError as e:
+            last_status = e.code
+            if not retry_on(e.code):
+                break
+            if attempt < retries - 1:
+                delay = backoff_factor ** attempt
+                print(f"  ⚠ HTTP Error {e.code}, retrying in {delay} seconds... (attempt {attempt + 1}/{retries})")
+                time.sleep(delay)
+        except CircuitOpenError as e:
+            # The host keeps refusing us: don't send anything, don't retry
+            print(f"  ✗ {e.reason}")
+            last_status = e.status
+            break
+        except URLError:
+            last_status = 0
+            if attempt < retries - 1:
+                delay = backoff_factor ** attempt
+                print(f"  ⚠ Network error, retrying in {delay} seconds... (attempt {attempt + 1}/{retries})")
+                time.sleep(delay)
+        except Exception as e:
+            print(f"  Unexpected error in fetch_response: {type(e).__name__}: {str(e)}")
+            return None, 0
+
+    # All retries failed
+    return None, last_status
+
+
+def make_request(url, headers=None, retries=3, backoff_factor=2, timeout=None,
+                 retry_on=is_retryable_status, transport=None):
+    """
+    Make an HTTP GET request with error handling and retry logic.
+
+    Args:
+        url: The URL to request
+        headers: Optional headers dict
+        retries: Number of attempts (default: 3, use 1 to disable retries)
+        backoff_factor: Multiplier for exponential backoff delay (default: 2)
+        timeout: Request timeout in seconds (default: transport timeout)
+        retry_on: Predicate on the HTTP status code deciding whether to retry
+            (default: retry everything except 403 and 404)
+        transport: HTTPTransport to use (default: the shared transport)
+
+    Returns:
+        Tuple of (content, status_code) where content is None on error
+    """
+    response, status_code = fetch_response(url, headers=headers, retries=retries,
+                                           backoff_factor=backoff_factor, timeout=timeout,
+                                           retry_on=retry_on, transport=transport)
+    return (response.text() if response is not None else None), status_code
+
+
+def stream_request(url, make_consumer, headers=None, retries=3, backoff_factor=2, timeout=None,
+                   retry_on=is_retryable_status, transport=None):
+    """
+    Make an HTTP GET request and feed the decoded text to a consumer as it arrives.
+
+    Each attempt gets a fresh consumer from make_consumer(), so a retry never
+    feeds the same page twice. The consumer only needs a feed(text) method,
+    which makes an html.parser.HTMLParser a natural fit.
+
+    Args:
+        url: The URL to request
+        make_consumer: Callable returning a new consumer for each attempt
+        headers, retries, backoff_factor, timeout, retry_on, transport: As for make_request
+
+    Returns:
+        Tuple of (consumer, status_code) where consumer is None on error
+    """
+    transport = transport or get_transport()
+    last_status = 0
+
+    for attempt in range(retries):
+        consumer = make_consumer()
+        text_decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+        try:
+            response = transport.open(url, headers=headers, timeout=timeout,
+                                      on_chunk=lambda chunk: consumer.feed(text_decoder.decode(chunk)))
+            consumer.feed(text_decoder.decode(b'', final=True))
+            return consumer, response.status
+
+        except HTTPError as e:
+            last_status = e.code
+            if not retry_on(e.code):
+                break
+            if attempt < retries - 1:
+                delay = backoff_factor ** attempt
+                print(f"  ⚠ HTTP Error {e.code}, retrying in {delay} seconds... (attempt {attempt + 1}/{retries})")
+                time.sleep(delay)
+        except CircuitOpenError as e:
+            # The host keeps refusing us: don't send anything, don't retry
+            print(f"  ✗ {e.reason}")
+            last_status = e.status
+            break
+        except URLError:
+            last_status = 0
+            if attempt < retries - 1:
+                delay = backoff_factor ** attempt
+                print(f"  ⚠ Network error, retrying in {delay} seconds... (attempt {attempt + 1}/{retries})")
+                time.sleep(delay)
+        except Exception as e:
+            print(f"  Unexpected error in stream_request: {type(e).__name__}: {str(e)}")
+            return None, 0
+
+    # All retries failed
+    return None, last_status
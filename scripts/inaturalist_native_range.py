@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+State-level native range lookups against the iNaturalist API.
+
+Shared by fetch_inaturalist_data.py and update_existing_native_range.py.
+
+Checking whether a taxon is native to a state takes one
+observations/species_counts request per state. Those 50 requests used to run
+one after another with a fixed sleep before each. Here they are issued
+concurrently from an asyncio event loop:
+- every request first reserves a token from the shared per-host rate limiter,
+  so the total rate still respects the api.inaturalist.org budget
+- at most MAX_CONCURRENT_REQUESTS requests are in flight at once
+- if the API starts refusing us (401/403) or anything unexpected fails, the
+  remaining state queries are cancelled before they are sent
+
+Inverted harvest:
+    Per-taxon lookups cost 50 requests per taxon. NativeRangeIndex turns the
+    query around: for each state it pages once through species_counts filtered
+    to native plants and keeps the set of native taxon IDs. Native ranges for
+    any number of taxa then come from a local join, so the request count
+    depends on the number of states and pages, not on the catalogue size.
+    The harvested sets are saved to NATIVE_RANGE_INDEX_FILE with a timestamp
+    per state and reused until they are older than HARVEST_MAX_AGE_DAYS.
+
+Usage:
+    from inaturalist_native_range import fetch_state_native_range, load_native_range_index
+
+    native_states = fetch_state_native_range(47604, headers=REQUEST_HEADERS)
+
+    index = load_native_range_index(headers=REQUEST_HEADERS)
+    native_states = index.native_states(47604)
+"""
+
+import asyncio
+import json
+import math
+import os
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from urllib.error import URLError, HTTPError
+from urllib.parse import urlsplit
+
+from host_concurrency import CircuitOpenError
+from http_transport import get_transport, is_retryable_status
+
+# iNaturalist API configuration
+INATURALIST_API_BASE = "https://api.inaturalist.org/v1"
+MAX_CONCURRENT_REQUESTS = 4  # Requests in flight at once (the rate limiter sets the pace)
+RETRIES = 3  # Attempts per state query
+BACKOFF_FACTOR = 2  # Multiplier for exponential backoff delay
+
+# Inverted harvest configuration
+PLANTAE_TAXON_ID = 47126  # Harvest native plants only
+HARVEST_PER_PAGE = 500  # Maximum page size accepted by species_counts
+NATIVE_RANGE_INDEX_FILE = ".cache/inaturalist/state_native_taxa.json"  # Relative to the repository root
+HARVEST_MAX_AGE_DAYS = 30  # Re-harvest a state once its set is older than this
+
+# US State place IDs for iNaturalist API
+# These IDs are used to query state-level native range data
+US_STATE_PLACE_IDS = {
+    'Alabama': 19,
+    'Alaska': 6,
+    'Arizona': 40,
+    'Arkansas': 36,
+    'California': 14,
+    'Colorado': 34,
+    'Connecticut': 49,
+    'Delaware': 4,
+    'Florida': 7539,
+    'Georgia': 23,
+    'Hawaii': 11,
+    'Idaho': 22,
+    'Illinois': 35,
+    'Indiana': 20,
+    'Iowa': 24,
+    'Kansas': 25,
+    'Kentucky': 26,
+    'Louisiana': 27,
+    'Maine': 17,
+    'Maryland': 39,
+    'Massachusetts': 2,
+    'Michigan': 29,
+    'Minnesota': 38,
+    'Mississippi': 37,
+    'Missouri': 28,
+    'Montana': 16,
+    'Nebraska': 3,
+    'Nevada': 50,
+    'New Hampshire': 41,
+    'New Jersey': 51,
+    'New Mexico': 9,
+    'New York': 48,
+    'North Carolina': 30,
+    'North Dakota': 13,
+    'Ohio': 31,
+    'Oklahoma': 12,
+    'Oregon': 10,
+    'Pennsylvania': 42,
+    'Rhode Island': 8,
+    'South Carolina': 43,
+    'South Dakota': 44,
+    'Tennessee': 45,
+    'Texas': 18,
+    'Utah': 52,
+    'Vermont': 47,
+    'Virginia': 7,
+    'Washington': 46,
+    'West Virginia': 33,
+    'Wisconsin': 32,
+    'Wyoming': 15,
+}
+
+
+class NativeRangeError(Exception):
+    """The API refused our requests; the remaining state queries were cancelled."""
+
+
+def native_taxon_ids(data, place_id):
+    """
+    Yield the IDs of taxa a species_counts response marks as native in a place.
+
+    Args:
+        data: Parsed species_counts JSON response
+        place_id: iNaturalist place ID that was queried
+    """
+    for result in data.get('results', []):
+        taxon_data = result.get('taxon', {})
+        establishment_means = taxon_data.get('establishment_means', {})
+
+        # Check if it's marked as native
+        if establishment_means:
+            means = establishment_means.get('establishment_means', '')
+            place = establishment_means.get('place', {})
+
+            # Verify this is the right place and it's native
+            if means == 'native' and place.get('id') == place_id:
+                yield taxon_data.get('id')
+
+
+def is_native_in_place(data, place_id):
+    """
+    Check a species_counts response for a native establishment record in a place.
+
+    Args:
+        data: Parsed species_counts JSON response
+        place_id: iNaturalist place ID that was queried
+
+    Returns:
+        True if the taxon is marked native in that place
+    """
+    return any(True for _ in native_taxon_ids(data, place_id))
+
+
+async def fetch_json(url, headers, executor, transport=None, limiter=None):
+    """
+    Fetch and parse a JSON document without blocking the event loop.
+
+    The rate-limit wait happens in the event loop (so cancellation is immediate);
+    the blocking request itself runs on the executor's threads.
+
+    Returns:
+        Parsed JSON, or None if the request failed or the body was not JSON
+
+    Raises:
+        NativeRangeError if the API answers 401 or 403, or its circuit is open
+    """
+    transport = transport or get_transport()
+    limiter = limiter or transport.rate_limiter
+    host = urlsplit(url).hostname
+    loop = asyncio.get_running_loop()
+
+    for attempt in range(RETRIES):
+        await asyncio.sleep(limiter.reserve(host))
+        try:
+            response = await loop.run_in_executor(
+                executor, partial(transport.open, url, headers=headers, rate_limit=False)
+            )
+            return json.loads(response.text())
+        except CircuitOpenError as e:
+            raise NativeRangeError(f"iNaturalist API refused requests ({e.reason})")
+        except HTTPError as e:
+            if e.code in (401, 403):
+                raise NativeRangeError(f"iNaturalist API refused request (HTTP {e.code}): {url}")
+            if not is_retryable_status(e.code):
+                return None
+        except URLError:
+            pass
+        except json.JSONDecodeError:
+            return None  # Skip malformed responses
+
+        if attempt < RETRIES - 1:
+            await asyncio.sleep(BACKOFF_FACTOR ** attempt)
+
+    return None
+
+
+async def fetch_state_native_range_async(taxon_id, headers=None, verbose=True,
+                                         max_concurrent=MAX_CONCURRENT_REQUESTS):
+    """
+    Query every US state concurrently and return those where the taxon is native.
+
+    Args:
+        taxon_id: iNaturalist taxon ID
+        headers: Request headers (User-Agent etc.)
+        verbose: Print a line for each native state found
+        max_concurrent: Maximum requests in flight
+
+    Returns:
+        List of state names in US_STATE_PLACE_IDS order
+
+    Raises:
+        NativeRangeError if the API refuses requests (remaining queries are cancelled)
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
+
+        async def check_state(state_name, place_id):
+            url = f"{INATURALIST_API_BASE}/observations/species_counts?taxon_id={taxon_id}&place_id={place_id}"
+            async with semaphore:
+                data = await fetch_json(url, headers, executor)
+            native = data is not None and is_native_in_place(data, place_id)
+            if native and verbose:
+                print(f"    ✓ Native to {state_name}")
+            return native
+
+        tasks = [
+            asyncio.create_task(check_state(state_name, place_id))
+            for state_name, place_id in US_STATE_PLACE_IDS.items()
+        ]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            # Stop every query that has not been sent yet, then let the rest settle
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    return [state_name for state_name, native in zip(US_STATE_PLACE_IDS, results) if native]
+
+
+def fetch_state_native_range(taxon_id, headers=None, verbose=True):
+    """
+    Synchronous wrapper around fetch_state_native_range_async for the batch scripts.
+
+    Returns:
+        List of state names where the plant is native
+
+    Raises:
+        NativeRangeError if the API refuses requests
+    """
+    return asyncio.run(fetch_state_native_range_async(taxon_id, headers=headers, verbose=verbose))
+
+
+class NativeRangeIndex:
+    """State name -> set of native taxon IDs, harvested once per state and kept on disk."""
+
+    def __init__(self, path=NATIVE_RANGE_INDEX_FILE, max_age_days=HARVEST_MAX_AGE_DAYS):
+        self.path = path
+        self.max_age = timedelta(days=max_age_days)
+        self.states = {}  # state name -> {'place_id', 'harvested_at', 'taxon_ids': set}
+
+    def load(self):
+        """Load previously harvested sets (a missing or corrupt file just means an empty index)."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return self
+        for state_name, entry in data.get('states', {}).items():
+            self.states[state_name] = {
+                'place_id': entry.get('place_id'),
+                'harvested_at': entry.get('harvested_at'),
+                'taxon_ids': set(entry.get('taxon_ids', [])),
+            }
+        return self
+
+    def save(self):
+        """Write the index atomically so an interrupted run never leaves a broken file."""
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        data = {
+            'saved_at': datetime.now().isoformat(),
+            'taxon_id': PLANTAE_TAXON_ID,
+            'states': {
+                state_name: {
+                    'place_id': entry['place_id'],
+                    'harvested_at': entry['harvested_at'],
+                    'taxon_ids': sorted(entry['taxon_ids']),
+                }
+                for state_name, entry in self.states.items()
+            },
+        }
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+    def is_stale(self, state_name):
+        """True if a state was never harvested, or its set is older than the max age."""
+        entry = self.states.get(state_name)
+        if not entry or not entry.get('harvested_at'):
+            return True
+        try:
+            harvested_at = datetime.fromisoformat(entry['harvested_at'])
+        except ValueError:
+            return True
+        return datetime.now() - harvested_at > self.max_age
+
+    def stale_states(self):
+        return [state_name for state_name in US_STATE_PLACE_IDS if self.is_stale(state_name)]
+
+    def native_states(self, taxon_id):
+        """
+        Local join: the states whose harvested set contains the taxon.
+
+        Returns:
+            List of state names in US_STATE_PLACE_IDS order
+        """
+        return [
+            state_name for state_name in US_STATE_PLACE_IDS
+            if taxon_id in self.states.get(state_name, {}).get('taxon_ids', ())
+        ]
+
+
+async def harvest_state_native_taxa(place_id, headers, executor, taxon_id=PLANTAE_TAXON_ID):
+    """
+    Page through species_counts for one place, filtered to native taxa.
+
+    The first page tells us total_results; the remaining pages are then
+    requested concurrently (still paced by the shared rate limiter).
+
+    Returns:
+        Set of native taxon IDs, or None if any page could not be fetched
+    """
+    def page_url(page):
+        return (f"{INATURALIST_API_BASE}/observations/species_counts?place_id={place_id}"
+                f"&taxon_id={taxon_id}&native=true&per_page={HARVEST_PER_PAGE}&page={page}")
+
+    first = await fetch_json(page_url(1), headers, executor)
+    if first is None:
+        return None
+
+    taxon_ids = set(native_taxon_ids(first, place_id))
+    total_pages = math.ceil(first.get('total_results', 0) / HARVEST_PER_PAGE)
+
+    pages = await asyncio.gather(*(fetch_json(page_url(page), headers, executor)
+                                   for page in range(2, total_pages + 1)))
+    for data in pages:
+        if data is None:
+            return None  # Never store a partial set; the state is retried next run
+        taxon_ids.update(native_taxon_ids(data, place_id))
+
+    return taxon_ids
+
+
+async def harvest_native_range_index_async(index, headers=None, states=None,
+                                           max_concurrent=MAX_CONCURRENT_REQUESTS):
+    """
+    Harvest the given states (default: all stale ones) into the index, saving after each state.
+
+    Returns:
+        Number of states harvested successfully
+
+    Raises:
+        NativeRangeError if the API refuses requests (states already harvested are kept)
+    """
+    states = index.stale_states() if states is None else states
+    semaphore = asyncio.Semaphore(max_concurrent)
+    harvested = 0
+
+    with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
+
+        async def harvest_state(state_name):
+            nonlocal harvested
+            place_id = US_STATE_PLACE_IDS[state_name]
+            async with semaphore:
+                taxon_ids = await harvest_state_native_taxa(place_id, headers, executor)
+            if taxon_ids is None:
+                print(f"    ✗ Could not harvest {state_name}, will retry next run")
+                return
+            index.states[state_name] = {
+                'place_id': place_id,
+                'harvested_at': datetime.now().isoformat(),
+                'taxon_ids': taxon_ids,
+            }
+            index.save()
+            harvested += 1
+            print(f"    ✓ {state_name}: {len(taxon_ids)} native taxa")
+
+        tasks = [asyncio.create_task(harvest_state(state_name)) for state_name in states]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    return harvested
+
+
+def load_native_range_index(headers=None, path=NATIVE_RANGE_INDEX_FILE,
+                            max_age_days=HARVEST_MAX_AGE_DAYS, refresh=False):
+    """
+    Load the state -> native taxa index, harvesting any missing or stale states first.
+
+    Args:
+        headers: Request headers (User-Agent etc.)
+        path: Where the harvested sets are stored
+        max_age_days: Re-harvest states older than this
+        refresh: Re-harvest every state regardless of age
+
+    Returns:
+        NativeRangeIndex
+
+    Raises:
+        NativeRangeError if the API refuses requests
+    """
+    index = NativeRangeIndex(path, max_age_days).load()
+    states = list(US_STATE_PLACE_IDS) if refresh else index.stale_states()
+
+    if states:
+        print(f"  Harvesting native plant taxa for {len(states)} state(s)...")
+        asyncio.run(harvest_native_range_index_async(index, headers=headers, states=states))
+    else:
+        print(f"  ✓ Using harvested native range index ({path})")
+
+    return index
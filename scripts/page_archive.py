@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Compressed, content-addressed archive of full fetched pages for the scrapers.
+
+save_plant_data used to keep only the first 2000 characters of each page in
+the plant JSON, so a parser fix or a SCRAPER_VERSION bump meant crawling the
+site again. The archive keeps every fetched page body in full:
+
+- bodies are stored once per distinct content (keyed by the SHA-256 of the
+  body), so a page fetched again unchanged costs only an index line
+- bodies are compressed with zstd when the optional zstandard package is
+  installed, otherwise with xz (lzma, standard library); the codec is part of
+  the blob's file name, so archives written either way can be read
+- each fetch gets an archive key derived from the URL and the fetch time,
+  recorded in an append-only index; the plant JSON stores just that key
+
+Layout (under PAGE_ARCHIVE_DIR):
+    index.jsonl             One line per fetch: key, url, fetched_at, sha256, size, codec
+    blobs/ab/ab12...ef.zst  Compressed body (.xz without zstandard)
+
+Configuration:
+    - Optional: pip install zstandard (faster, smaller archives than xz)
+
+Usage:
+    from page_archive import get_page_archive
+
+    archive = get_page_archive()             # Or get_page_archive(root) for a separate archive
+    key = archive.put(url, html)             # Archive a fetched page
+    html = archive.get_text(key)             # Random access by key
+    key = archive.latest(url)                # Most recent fetch of a URL
+    entries = archive.fetches(url)           # Every fetch of a URL, oldest first
+    for entry in archive.entries(): ...      # Walk the index
+"""
+
+import hashlib
+import json
+import lzma
+import os
+import threading
+from datetime import datetime, timezone
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Configuration
+PAGE_ARCHIVE_DIR = ".cache/pages"  # Relative to the repository root (gitignored)
+INDEX_FILE = "index.jsonl"
+ZSTD_LEVEL = 10  # zstd compression level (1-22)
+XZ_PRESET = 6  # lzma preset used without zstandard (0-9)
+
+# Codec names, also used as blob file extensions
+CODEC_ZSTD = 'zst'
+CODEC_XZ = 'xz'
+
+# Decompression errors that mean the blob on disk is damaged
+CORRUPT_BLOB_ERRORS = (lzma.LZMAError, ValueError) + ((zstandard.ZstdError,) if ZSTD_AVAILABLE else ())
+
+
+class PageArchiveError(Exception):
+    """An archived page exists but cannot be read (codec unavailable or corrupt blob)."""
+
+
+def archive_key(url, fetched_at):
+    """Archive key for one fetch of a URL (hex, 32 characters)."""
+    return hashlib.sha256(f"{url}\n{fetched_at}".encode('utf-8')).hexdigest()[:32]
+
+
+class PageArchive:
+    """Append-only page archive with deduplicated, compressed bodies. Thread-safe."""
+
+    def __init__(self, root=PAGE_ARCHIVE_DIR, codec=None):
+        self.root = root
+        self.codec = codec or (CODEC_ZSTD if ZSTD_AVAILABLE else CODEC_XZ)
+        self.index_path = os.path.join(root, INDEX_FILE)
+        self.stored = 0
+        self.deduplicated = 0
+        self._entries = None  # key -> index entry, loaded lazily
+        self._latest = {}  # url -> key of the most recent fetch
+        self._lock = threading.Lock()
+
+    def _load_index(self):
+        """Read the index once; later lookups are served from memory."""
+        if self._entries is not None:
+            return
+        self._entries = {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # Partially written last line
+                    self._add_entry(entry)
+        except OSError:
+            pass
+
+    def _add_entry(self, entry):
+        self._entries[entry['key']] = entry
+        latest = self._entries.get(self._latest.get(entry['url']))
+        if latest is None or entry['fetched_at'] >= latest['fetched_at']:
+            self._latest[entry['url']] = entry['key']
+
+    def _blob_path(self, sha256, codec):
+        return os.path.join(self.root, 'blobs', sha256[:2], f"{sha256}.{codec}")
+
+    def _find_blob(self, sha256):
+        """Existing blob for a body hash, in any codec: (path, codec) or None."""
+        for codec in (self.codec, CODEC_ZSTD, CODEC_XZ):
+            path = self._blob_path(sha256, codec)
+            if os.path.exists(path):
+                return path, codec
+        return None
+
+    def _compress(self, body):
+        if self.codec == CODEC_ZSTD:
+            return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(body)
+        return lzma.compress(body, preset=XZ_PRESET)
+
+    def _decompress(self, data, codec):
+        if codec == CODEC_ZSTD:
+            if not ZSTD_AVAILABLE:
+                raise PageArchiveError("page was archived with zstd; pip install zstandard to read it")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return lzma.decompress(data)
+
+    def put(self, url, body, fetched_at=None):
+        """
+        Archive one fetched page.
+
+        Args:
+            url: Page URL
+            body: Page body (str is stored as UTF-8)
+            fetched_at: ISO 8601 fetch time (default: now, UTC)
+
+        Returns:
+            Archive key for this fetch
+        """
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        fetched_at = fetched_at or datetime.now(timezone.utc).isoformat()
+        sha256 = hashlib.sha256(body).hexdigest()
+        key = archive_key(url, fetched_at)
+
+        with self._lock:
+            self._load_index()
+            if key in self._entries:
+                return key
+
+            found = self._find_blob(sha256)
+            if found is None:
+                codec = self.codec
+                path = self._blob_path(sha256, codec)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                self._write_atomic(path, self._compress(body))
+                self.stored += 1
+            else:
+                codec = found[1]
+                self.deduplicated += 1
+
+            entry = {
+                'key': key,
+                'url': url,
+                'fetched_at': fetched_at,
+                'sha256': sha256,
+                'size': len(body),
+                'codec': codec,
+            }
+            os.makedirs(self.root, exist_ok=True)
+            with open(self.index_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + '\n')
+            self._add_entry(entry)
+        return key
+
+    def _write_atomic(self, path, data):
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def entry(self, key):
+        """Index entry for an archive key, or None."""
+        with self._lock:
+            self._load_index()
+            return self._entries.get(key)
+
+    def latest(self, url):
+        """Archive key of the most recent fetch of a URL, or None."""
+        with self._lock:
+            self._load_index()
+            return self._latest.get(url)
+
+    def fetches(self, url):
+        """Index entries of every archived fetch of a URL, oldest first."""
+        with self._lock:
+            self._load_index()
+            return sorted((entry for entry in self._entries.values() if entry['url'] == url),
+                          key=lambda entry: entry['fetched_at'])
+
+    def entries(self):
+        """All index entries, in the order they were archived."""
+        with self._lock:
+            self._load_index()
+            return list(self._entries.values())
+
+    def get(self, key):
+        """
+        Read an archived page body.
+
+        Returns:
+            Body bytes, or None if the key is unknown or its blob is missing
+
+        Raises:
+            PageArchiveError if the blob cannot be decompressed
+        """
+        entry = self.entry(key)
+        if entry is None:
+            return None
+        path = self._blob_path(entry['sha256'], entry.get('codec', CODEC_XZ))
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        try:
+            return self._decompress(data, entry.get('codec', CODEC_XZ))
+        except CORRUPT_BLOB_ERRORS as e:
+            raise PageArchiveError(f"corrupt archive blob {path}: {e}") from e
+
+    def get_text(self, key, encoding='utf-8'):
+        """Read an archived page as text, or None if it is not in the archive."""
+        body = self.get(key)
+        return body.decode(encoding, errors='replace') if body is not None else None
+
+    def stats_line(self):
+        """One-line summary for the end-of-run log."""
+        return (f"Page archive: {self.stored} new page(s), {self.deduplicated} unchanged "
+                f"(deduplicated), codec {self.codec}")
+
+
+# Shared archives used by all scripts in this process, one per root
+_page_archives = {}
+_page_archive_lock = threading.Lock()
+
+
+def get_page_archive(root=PAGE_ARCHIVE_DIR):
+    """Get or create the process-wide shared page archive under `root`."""
+    with _page_archive_lock:
+        archive = _page_archives.get(root)
+        if archive is None:
+            archive = _page_archives[root] = PageArchive(root)
+        return archive
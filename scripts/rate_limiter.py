@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Per-host token-bucket rate limiting for the PlantFinder data scripts.
+
+The scripts used to pace themselves with a fixed time.sleep() after every
+request. Because that sleep came on top of the request latency, a 1 second
+delay with a 0.8 second request meant one call every 1.8 seconds. A token
+bucket instead refills continuously, so time spent waiting for the previous
+response already counts toward the next request's budget.
+
+The limiter also honours what the server tells us:
+- Retry-After (seconds or HTTP date) pauses the host until that time
+- X-RateLimit-Remaining / X-RateLimit-Reset (and the RateLimit-* draft headers)
+  slow the host down so the remaining quota lasts until the reset, and pause it
+  entirely when the quota is exhausted
+
+Configuration:
+    Every host's budget lives in HOST_RATE_LIMITS below. Hosts that are not
+    listed are not paced, but still honour Retry-After and X-RateLimit-*.
+
+Usage:
+    from rate_limiter import get_rate_limiter
+
+    limiter = get_rate_limiter()
+    limiter.acquire("api.inaturalist.org")      # blocks until a token is available
+    ...
+    limiter.observe("api.inaturalist.org", status, response_headers)
+
+The shared transport (http_transport.py) does both calls for every request,
+so scripts normally never touch the limiter directly.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+# Per-host budgets: requests per second and burst size (tokens the bucket can hold).
+# This is the one place to tune how hard each upstream service is hit.
+HOST_RATE_LIMITS = {
+    # iNaturalist asks API clients to stay around 1 request per second
+    'api.inaturalist.org': {'rate': 1.0, 'burst': 1},
+    # wildflower.org blocks aggressive clients (see WILDFLOWER_403_FIX.md)
+    'www.wildflower.org': {'rate': 1 / 1.5, 'burst': 1},
+    # USDA PLANTS services API
+    'plantsservices.sc.egov.usda.gov': {'rate': 1.0, 'burst': 2},
+    # Wikipedia / Wikimedia Commons API
+    'en.wikipedia.org': {'rate': 2.0, 'burst': 4},
+    'commons.wikimedia.org': {'rate': 2.0, 'burst': 4},
+}
+
+# Longest pause accepted from a Retry-After / X-RateLimit-Reset header
+MAX_SERVER_PAUSE = 15 * 60  # seconds
+# Only announce waits longer than this, so normal pacing stays quiet
+ANNOUNCE_WAIT_THRESHOLD = 5.0  # seconds
+
+
+class TokenBucket:
+    """Token bucket for a single host. Thread-safe."""
+
+    def __init__(self, rate=None, burst=1):
+        """
+        Args:
+            rate: Tokens added per second, or None for no pacing
+            burst: Maximum number of tokens the bucket can hold
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        # Time the token count was last brought up to date. It is moved into the
+        # future when the server asks us to pause, so no tokens accrue until then.
+        self.updated = time.monotonic()
+        # Server-advertised budget (from X-RateLimit-*) and when it expires
+        self.server_rate = None
+        self.server_rate_until = 0.0
+        self._lock = threading.Lock()
+
+    def _effective_rate(self, now):
+        if self.server_rate is not None and now >= self.server_rate_until:
+            self.server_rate = None
+        rates = [r for r in (self.rate, self.server_rate) if r is not None]
+        return min(rates) if rates else None
+
+    def _refill(self, now, rate):
+        elapsed = now - self.updated
+        if elapsed > 0:
+            if rate is not None:
+                self.tokens = min(self.burst, self.tokens + elapsed * rate)
+            else:
+                self.tokens = float(self.burst)
+            self.updated = now
+
+    def reserve(self):
+        """
+        Take one token, possibly going into debt.
+
+        Returns:
+            Seconds the caller must wait before sending its request
+        """
+        with self._lock:
+            now = time.monotonic()
+            rate = self._effective_rate(now)
+            self._refill(now, rate)
+
+            # Time until the bucket is allowed to fill again (server-requested pause)
+            wait = max(0.0, self.updated - now)
+            if rate is None:
+                return wait
+
+            self.tokens -= 1
+            if self.tokens < 0:
+                wait += -self.tokens / rate
+            return wait
+
+    def pause_until(self, when):
+        """Stop handing out tokens until the monotonic time `when`."""
+        with self._lock:
+            if when > self.updated:
+                self.updated = when
+                # Allow a single request as soon as the pause ends, then normal pacing.
+                # Any earlier debt belongs to requests that were already sent.
+                self.tokens = 1.0
+
+    def limit_to(self, rate, until):
+        """Apply a server-advertised rate (requests/second) until the monotonic time `until`."""
+        with self._lock:
+            self.server_rate = rate
+            self.server_rate_until = until
+
+
+class RateLimiter:
+    """Collection of per-host token buckets."""
+
+    def __init__(self, host_limits=None):
+        self.host_limits = dict(HOST_RATE_LIMITS if host_limits is None else host_limits)
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, host):
+        """Get or create the token bucket for a host."""
+        host = (host or '').lower()
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                limits = self.host_limits.get(host, {})
+                bucket = TokenBucket(limits.get('rate'), limits.get('burst', 1))
+                self._buckets[host] = bucket
+            return bucket
+
+    def set_host_rate(self, host, rate, burst=1):
+        """Override the budget of one host (e.g. from a --delay command line option)."""
+        host = host.lower()
+        with self._lock:
+            self.host_limits[host] = {'rate': rate, 'burst': burst}
+            self._buckets.pop(host, None)
+
+    def reserve(self, host):
+        """Take a token for `host` and return how long to wait (for async callers)."""
+        return self.bucket(host).reserve()
+
+    def acquire(self, host):
+        """Block until a request to `host` is allowed."""
+        wait = self.reserve(host)
+        if wait > 0:
+            if wait >= ANNOUNCE_WAIT_THRESHOLD:
+                print(f"  ⏳ Rate limit for {host}: waiting {wait:.1f} seconds...")
+            time.sleep(wait)
+
+    def observe(self, host, status_code, headers):
+        """
+        Update the host's budget from a response.
+
+        Args:
+            host: Host name the request went to
+            status_code: HTTP status code of the response
+            headers: Response headers (any mapping with .get())
+        """
+        if headers is None:
+            return
+        bucket = self.bucket(host)
+        now = time.monotonic()
+
+        retry_after = parse_retry_after(headers.get('Retry-After'))
+        if retry_after is not None and status_code in (429, 503):
+            bucket.pause_until(now + min(retry_after, MAX_SERVER_PAUSE))
+            return
+
+        remaining = _header_number(headers, ('X-RateLimit-Remaining', 'RateLimit-Remaining'))
+        reset = _header_number(headers, ('X-RateLimit-Reset', 'RateLimit-Reset'))
+        if remaining is None or reset is None:
+            return
+
+        reset_in = parse_reset_seconds(reset)
+        if reset_in <= 0:
+            return
+        reset_in = min(reset_in, MAX_SERVER_PAUSE)
+
+        if remaining <= 0:
+            bucket.pause_until(now + reset_in)
+        else:
+            # Spread the remaining quota over the time left in the window
+            bucket.limit_to(remaining / reset_in, now + reset_in)
+
+
+def _header_number(headers, names):
+    for name in names:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return float(str(value).split(',')[0].strip())
+        except ValueError:
+            continue
+    return None
+
+
+def parse_retry_after(value):
+    """
+    Parse a Retry-After header.
+
+    Returns:
+        Seconds to wait, or None if the header is missing or malformed
+    """
+    if value is None:
+        return None
+    value = str(value).strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def parse_reset_seconds(reset):
+    """X-RateLimit-Reset is either an epoch timestamp or a delay in seconds."""
+    if reset > 1_000_000_000:
+        return reset - time.time()
+    return reset
+
+
+# Shared limiter used by all scripts in this process
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter():
+    """Get or create the process-wide shared rate limiter."""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = RateLimiter()
+        return _rate_limiter
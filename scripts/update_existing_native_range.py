@@ -9,40 +9,37 @@ Usage:
     python update_existing_native_range.py              # Update all files
     python update_existing_native_range.py --limit 5    # Update only 5 files
     python update_existing_native_range.py --file inaturalist-47912.json  # Update specific file
+    python update_existing_native_range.py --harvest    # Use the harvested per-state sets
+    python update_existing_native_range.py --harvest --refresh-harvest  # Re-harvest every state first
+
+With --harvest the per-state native taxa sets saved by fetch_inaturalist_data.py
+(or a previous run of this script) are reused while they are fresh, so
+updating every file costs no per-taxon requests at all.
 """
 
 import sys
 import os
 import json
-import time
-from urllib.request import Request, urlopen
-from urllib.error import URLError, HTTPError
+
+from inaturalist_native_range import (
+    US_STATE_PLACE_IDS, NativeRangeError, fetch_state_native_range as fetch_native_states,
+    load_native_range_index
+)
 
 # Configuration
 DATA_DIR = "src/data/inaturalist"
-TIMEOUT = 30
 USER_AGENT = 'PlantFinder-DataFetch/1.1 (https://github.com/ampautsc/PlantFinder)'
-INATURALIST_API_BASE = "https://api.inaturalist.org/v1"
-RATE_LIMIT_DELAY = 1.0
-
-# US State place IDs
-US_STATE_PLACE_IDS = {
-    'Alabama': 19, 'Alaska': 6, 'Arizona': 40, 'Arkansas': 36, 'California': 14,
-    'Colorado': 34, 'Connecticut': 49, 'Delaware': 4, 'Florida': 7539, 'Georgia': 23,
-    'Hawaii': 11, 'Idaho': 22, 'Illinois': 35, 'Indiana': 20, 'Iowa': 24,
-    'Kansas': 25, 'Kentucky': 26, 'Louisiana': 27, 'Maine': 17, 'Maryland': 39,
-    'Massachusetts': 2, 'Michigan': 29, 'Minnesota': 38, 'Mississippi': 37,
-    'Missouri': 28, 'Montana': 16, 'Nebraska': 3, 'Nevada': 50, 'New Hampshire': 41,
-    'New Jersey': 51, 'New Mexico': 9, 'New York': 48, 'North Carolina': 30,
-    'North Dakota': 13, 'Ohio': 31, 'Oklahoma': 12, 'Oregon': 10, 'Pennsylvania': 42,
-    'Rhode Island': 8, 'South Carolina': 43, 'South Dakota': 44, 'Tennessee': 45,
-    'Texas': 18, 'Utah': 52, 'Vermont': 47, 'Virginia': 7, 'Washington': 46,
-    'West Virginia': 33, 'Wisconsin': 32, 'Wyoming': 15,
+REQUEST_HEADERS = {
+    'User-Agent': USER_AGENT,
+    'Accept': 'application/json'
 }
+# Request pacing for api.inaturalist.org is set in rate_limiter.HOST_RATE_LIMITS
 
 # Parse command line arguments
 LIMIT = None
 SPECIFIC_FILE = None
+USE_HARVEST = '--harvest' in sys.argv
+REFRESH_HARVEST = '--refresh-harvest' in sys.argv
 
 for i, arg in enumerate(sys.argv):
     if arg == '--limit' and i + 1 < len(sys.argv):
@@ -54,75 +51,16 @@ for i, arg in enumerate(sys.argv):
         SPECIFIC_FILE = sys.argv[i + 1]
 
 
-def make_request(url):
-    """Make an HTTP request with error handling."""
-    headers = {
-        'User-Agent': USER_AGENT,
-        'Accept': 'application/json'
-    }
-    
-    try:
-        request = Request(url, headers=headers)
-        response = urlopen(request, timeout=TIMEOUT)
-        content = response.read().decode('utf-8', errors='ignore')
-        return content, response.status
-    except (HTTPError, URLError) as e:
-        return None, getattr(e, 'code', 0)
-    except Exception as e:
-        print(f"  Error: {type(e).__name__}: {str(e)}")
-        return None, 0
+# Harvested state -> native taxa index, loaded by main() in --harvest mode
+NATIVE_RANGE_INDEX = None
 
 
 def fetch_state_native_range(taxon_id):
-    """Fetch state-level native range data for a taxon."""
-    native_states = []
-    total_states = len(US_STATE_PLACE_IDS)
-    # Calculate max line length for proper clearing: "    [50/50] Checking North Carolina..."
-    # The +3 accounts for the ellipsis "..." at the end of the progress message
-    max_state_name_len = max(len(name) for name in US_STATE_PLACE_IDS.keys())
-    max_line_len = len(f"    [{total_states}/{total_states}] Checking ") + max_state_name_len + 3
-    
-    print(f"  Fetching state-level native range data (checking {total_states} states)...")
-    
-    for state_index, (state_name, place_id) in enumerate(US_STATE_PLACE_IDS.items(), 1):
-        api_url = f"{INATURALIST_API_BASE}/observations/species_counts?taxon_id={taxon_id}&place_id={place_id}"
-        
-        # Show progress indicator
-        print(f"    [{state_index}/{total_states}] Checking {state_name}...", end='\r', flush=True)
-        
-        time.sleep(RATE_LIMIT_DELAY)
-        
-        content, status_code = make_request(api_url)
-        
-        if content is None:
-            continue
-        
-        try:
-            data = json.loads(content)
-            results = data.get('results', [])
-            
-            if results:
-                for result in results:
-                    taxon_data = result.get('taxon', {})
-                    establishment_means = taxon_data.get('establishment_means', {})
-                    
-                    if establishment_means:
-                        means = establishment_means.get('establishment_means', '')
-                        place = establishment_means.get('place', {})
-                        
-                        if means == 'native' and place.get('id') == place_id:
-                            native_states.append(state_name)
-                            # Clear the progress line and print the result
-                            result_line = f"    [{state_index}/{total_states}] ✓ Native to {state_name}"
-                            print(f"\r{result_line}" + " " * (max_line_len - len(result_line)))
-                            break
-        except json.JSONDecodeError:
-            continue
-    
-    # Clear the progress line
-    print(f"\r" + " " * max_line_len)
-    
-    return native_states
+    """Fetch state-level native range data for a taxon (states are queried concurrently)."""
+    if NATIVE_RANGE_INDEX is not None:
+        return NATIVE_RANGE_INDEX.native_states(taxon_id)
+    print(f"  Fetching state-level native range data (checking {len(US_STATE_PLACE_IDS)} states)...")
+    return fetch_native_states(taxon_id, headers=REQUEST_HEADERS)
 
 
 def update_plant_file(filepath):
@@ -174,6 +112,9 @@ def update_plant_file(filepath):
         
         return True
         
+    except NativeRangeError:
+        # The API is refusing requests - let main() stop the run without touching the file
+        raise
     except Exception as e:
         print(f"  ✗ Error: {type(e).__name__}: {str(e)}")
         return False
@@ -197,6 +138,19 @@ def main():
     
     print(f"Found {len(files)} file(s) to process\n")
     
+    if USE_HARVEST:
+        global NATIVE_RANGE_INDEX
+        try:
+            NATIVE_RANGE_INDEX = load_native_range_index(headers=REQUEST_HEADERS, refresh=REFRESH_HARVEST)
+        except NativeRangeError as e:
+            print(f"  ✗ {str(e)}")
+            return 1
+        missing = NATIVE_RANGE_INDEX.stale_states()
+        if missing:
+            # A missing state would silently drop it from every plant's range
+            print(f"✗ Native range harvest incomplete ({len(missing)} state(s) missing), not updating files")
+            return 1
+    
     success_count = 0
     skipped_count = 0
     failure_count = 0
@@ -207,7 +161,13 @@ def main():
             failure_count += 1
             continue
         
-        result = update_plant_file(filepath)
+        try:
+            result = update_plant_file(filepath)
+        except NativeRangeError as e:
+            print(f"  ✗ {str(e)}")
+            print("  Stopping: remaining files are left unchanged")
+            failure_count += 1
+            break
         
         if result:
             success_count += 1
@@ -17,6 +17,8 @@ export class PlantDataLoader {
   private static cache: Map<string, Plant> = new Map();
   private static allPlantsCache: Plant[] | null = null;
   private static plantIdsCache: string[] | null = null;
+  private static STATE_SHARDS_URL = '/data/by-state';
+  private static stateShardCache: Map<string, Record<string, string[]>> = new Map();
 
   /**
    * Get all available plant IDs without loading the full plant data
@@ -144,6 +146,41 @@ export class PlantDataLoader {
     return plants.filter((p): p is Plant => p !== null);
   }
 
+  /**
+   * Get the IDs of plants native to a county (5-digit FIPS code)
+   * Fetches the county's state shard (/data/by-state/{stateFips}.json, written by
+   * scripts/build_state_shards.py) instead of every plant file
+   */
+  static async getPlantIdsForCounty(countyFips: string): Promise<string[]> {
+    const stateFips = countyFips.substring(0, 2);
+    let shard = this.stateShardCache.get(stateFips);
+
+    if (!shard) {
+      try {
+        const response = await fetch(`${this.STATE_SHARDS_URL}/${stateFips}.json`);
+        if (!response.ok) {
+          console.error(`Failed to fetch plants for state ${stateFips}: ${response.statusText}`);
+          return [];
+        }
+        shard = (await response.json()) as Record<string, string[]>;
+        this.stateShardCache.set(stateFips, shard);
+      } catch (error) {
+        console.error(`Error loading plants for state ${stateFips}:`, error);
+        return [];
+      }
+    }
+
+    return shard[countyFips] || [];
+  }
+
+  /**
+   * Get the plants native to a county, loading only those plants
+   */
+  static async getPlantsForCounty(countyFips: string): Promise<Plant[]> {
+    const ids = await this.getPlantIdsForCounty(countyFips);
+    return this.getPlantsByIds(ids);
+  }
+
   /**
    * Clear all caches (useful for testing or forced refresh)
    */
@@ -151,6 +188,7 @@ export class PlantDataLoader {
     this.cache.clear();
     this.allPlantsCache = null;
     this.plantIdsCache = null;
+    this.stateShardCache.clear();
   }
 
   /**
@@ -160,11 +198,13 @@ export class PlantDataLoader {
     cachedPlants: number;
     allPlantsCached: boolean;
     plantIdsCached: boolean;
+    cachedStateShards: number;
   } {
     return {
       cachedPlants: this.cache.size,
       allPlantsCached: this.allPlantsCache !== null,
       plantIdsCached: this.plantIdsCache !== null,
+      cachedStateShards: this.stateShardCache.size,
     };
   }
 }
@@ -29,6 +29,7 @@ export interface PlantDistribution {
   fipsCodes: string[]; // 5-digit county FIPS codes where plant is native
   statesFips?: string[]; // 2-digit state FIPS codes (optional, for quick state-level queries)
   distributionFile?: string; // Optional: path to external distribution file for widespread plants
+  sourceSha256?: string; // SHA-256 of the USDA distribution CSV it was converted from
 }
 
 // Complete Plant interface